@@ -9,21 +9,14 @@ import argparse
 import sys
 import os
 from pathlib import Path
-import yaml
-
-from src.models.openrouter import OpenRouterModel
-from src.experiment import (
-    UniquenessExperiment,
-    EssayExperiment,
-    TopicClassificationExperiment
-)
 
 
 def load_config(config_file: str = "config.yaml") -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file (cached between runs)."""
+    from src.utils import load_cached_yaml
+
     try:
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        return load_cached_yaml(Path(config_file)) or {}
     except FileNotFoundError:
         print(f"WARNING: Config file {config_file} not found. Using defaults.")
         return {}
@@ -32,8 +25,36 @@ def load_config(config_file: str = "config.yaml") -> dict:
         sys.exit(1)
 
 
+# Models built in this process, keyed by (model, max_tokens, temperature, retry_limit)
+_MODEL_CACHE = {}
+
+
+def _get_or_create_model(args, defaults: dict):
+    """Return a cached OpenRouterModel for the resolved CLI/config settings."""
+    from src.models.openrouter import OpenRouterModel
+
+    key = (
+        args.model,
+        args.max_tokens or defaults.get('max_tokens', 1000),
+        args.temperature if args.temperature is not None else defaults.get('temperature', 1.0),
+        args.retry_limit or defaults.get('retry_limit', 25),
+    )
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = OpenRouterModel(
+            model_name=key[0],
+            max_tokens=key[1],
+            temperature=key[2],
+            retry_limit=key[3]
+        )
+        _MODEL_CACHE[key] = model
+    return model
+
+
 def run_batch1(args, config):
     """Run batch1 uniqueness experiment."""
+    from src.experiment import UniquenessExperiment
+
     # Get configuration
     exp_config = config.get('experiments', {}).get('batch1', {})
     defaults = config.get('defaults', {})
@@ -42,8 +63,7 @@ def run_batch1(args, config):
     if args.prompt:
         prompt = args.prompt
     elif args.prompt_file:
-        with open(args.prompt_file, 'r') as f:
-            prompt = f.read()
+        prompt = Path(args.prompt_file).read_text(encoding='utf-8')
     else:
         prompt = exp_config.get('default_prompt', "How many Rs are in the word strawberry?")
 
@@ -51,12 +71,7 @@ def run_batch1(args, config):
     output_dir = Path(args.output_dir) if args.output_dir else Path(exp_config.get('output_dir', 'results/batch1'))
 
     # Create model
-    model = OpenRouterModel(
-        model_name=args.model,
-        max_tokens=args.max_tokens or defaults.get('max_tokens', 1000),
-        temperature=args.temperature if args.temperature is not None else defaults.get('temperature', 1.0),
-        retry_limit=args.retry_limit or defaults.get('retry_limit', 25)
-    )
+    model = _get_or_create_model(args, defaults)
 
     # Create and run experiment
     experiment = UniquenessExperiment(
@@ -71,6 +86,8 @@ def run_batch1(args, config):
 
 def run_batch2(args, config):
     """Run batch2 essay generation experiment."""
+    from src.experiment import EssayExperiment
+
     # Get configuration
     exp_config = config.get('experiments', {}).get('batch2', {})
     defaults = config.get('defaults', {})
@@ -79,8 +96,7 @@ def run_batch2(args, config):
     if args.prompt:
         essay_prompt = args.prompt
     elif args.prompt_file:
-        with open(args.prompt_file, 'r') as f:
-            essay_prompt = f.read()
+        essay_prompt = Path(args.prompt_file).read_text(encoding='utf-8')
     else:
         essay_prompt = exp_config.get('essay_prompt', "Write an essay")
 
@@ -94,12 +110,7 @@ def run_batch2(args, config):
     output_dir = Path(args.output_dir) if args.output_dir else Path(exp_config.get('output_dir', 'results/batch2'))
 
     # Create model
-    model = OpenRouterModel(
-        model_name=args.model,
-        max_tokens=args.max_tokens or defaults.get('max_tokens', 1000),
-        temperature=args.temperature if args.temperature is not None else defaults.get('temperature', 1.0),
-        retry_limit=args.retry_limit or defaults.get('retry_limit', 25)
-    )
+    model = _get_or_create_model(args, defaults)
 
     # Create and run experiment
     experiment = EssayExperiment(
@@ -115,6 +126,8 @@ def run_batch2(args, config):
 
 def run_batch5(args, config):
     """Run batch5 topic classification experiment."""
+    from src.experiment import TopicClassificationExperiment
+
     # Get configuration
     exp_config = config.get('experiments', {}).get('batch5', {})
     defaults = config.get('defaults', {})
@@ -138,12 +151,7 @@ def run_batch5(args, config):
     output_dir = Path(args.output_dir) if args.output_dir else Path(exp_config.get('output_dir', 'results/batch5'))
 
     # Create model
-    model = OpenRouterModel(
-        model_name=args.model,
-        max_tokens=args.max_tokens or defaults.get('max_tokens', 1000),
-        temperature=args.temperature if args.temperature is not None else defaults.get('temperature', 1.0),
-        retry_limit=args.retry_limit or defaults.get('retry_limit', 25)
-    )
+    model = _get_or_create_model(args, defaults)
 
     # Create and run experiment
     experiment = TopicClassificationExperiment(
@@ -157,8 +165,91 @@ def run_batch5(args, config):
     experiment.run()
 
 
-def main():
+def _add_common_arguments(parser: argparse.ArgumentParser, defaults: bool = True) -> None:
+    """Add options shared by every experiment.
+
+    The options live on the top-level parser and are repeated on each
+    subcommand so they may appear on either side of the experiment name;
+    the subcommand copies pass ``defaults=False`` so an option given before
+    the experiment name is not reset by the subparser's defaults.
+    """
+    def default(value):
+        return value if defaults else argparse.SUPPRESS
+
+    parser.add_argument(
+        '--model',
+        required=False,
+        default=default(None),
+        help='AI model to use (overrides OPENROUTER_MODEL env var)'
+    )
+
+    parser.add_argument(
+        '--config',
+        default=default('config.yaml'),
+        help='Path to config file (default: config.yaml)'
+    )
+
+    parser.add_argument('--cycles', type=int, default=default(None), help='Number of cycles to run')
+    parser.add_argument('--temperature', type=float, default=default(None), help='Sampling temperature (0.0-2.0)')
+    parser.add_argument('--max-tokens', type=int, default=default(None), help='Maximum tokens in response')
+    parser.add_argument('--retry-limit', type=int, default=default(None), help='Maximum retry attempts')
+    parser.add_argument('--output-dir', default=default(None), help='Output directory for results')
+
+
+def _selected_experiment(argv) -> str:
+    """Return the experiment named in argv, or None if there is none.
+
+    Parsed with the shared options declared so their values (``--output-dir
+    batch1``) are never mistaken for the experiment name.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    _add_common_arguments(parser)
+    parser.add_argument('experiment', nargs='?')
+    known, _ = parser.parse_known_args(argv)
+    return known.experiment if known.experiment in BATCH_PARSERS else None
+
+
+def _build_batch1_parser(subparsers) -> None:
+    """Register the batch1 subcommand."""
+    parser = subparsers.add_parser('batch1', help='Response uniqueness testing')
+    _add_common_arguments(parser, defaults=False)
+    parser.add_argument('--prompt', help='Prompt text')
+    parser.add_argument('--prompt-file', help='File containing prompt')
+    parser.set_defaults(func=run_batch1)
+
+
+def _build_batch2_parser(subparsers) -> None:
+    """Register the batch2 subcommand."""
+    parser = subparsers.add_parser('batch2', help='Essay generation and thesis extraction')
+    _add_common_arguments(parser, defaults=False)
+    parser.add_argument('--prompt', help='Essay prompt text')
+    parser.add_argument('--prompt-file', help='File containing essay prompt')
+    parser.add_argument('--thesis-prompt', help='Thesis extraction prompt')
+    parser.set_defaults(func=run_batch2)
+
+
+def _build_batch5_parser(subparsers) -> None:
+    """Register the batch5 subcommand."""
+    parser = subparsers.add_parser('batch5', help='Topic classification')
+    _add_common_arguments(parser, defaults=False)
+    parser.add_argument('--essay-file', help='File containing essays')
+    parser.add_argument('--topic-prompt', help='Topic classification prompt')
+    parser.set_defaults(func=run_batch5)
+
+
+# Subcommand builders, keyed by experiment name
+BATCH_PARSERS = {
+    'batch1': _build_batch1_parser,
+    'batch2': _build_batch2_parser,
+    'batch5': _build_batch5_parser,
+}
+
+
+def main(argv=None):
     """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         description='Run AI Essay Experiments',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -175,43 +266,23 @@ Examples:
         """
     )
 
-    parser.add_argument(
-        'experiment',
-        choices=['batch1', 'batch2', 'batch5'],
-        help='Experiment type to run'
-    )
-
-    parser.add_argument(
-        '--model',
-        required=False,
-        help='AI model to use (overrides OPENROUTER_MODEL env var)'
-    )
+    _add_common_arguments(parser)
 
-    parser.add_argument(
-        '--config',
-        default='config.yaml',
-        help='Path to config file (default: config.yaml)'
+    subparsers = parser.add_subparsers(
+        dest='experiment',
+        metavar='experiment',
+        required=True,
+        help='Experiment type to run'
     )
 
-    # Common options
-    parser.add_argument('--cycles', type=int, help='Number of cycles to run')
-    parser.add_argument('--temperature', type=float, help='Sampling temperature (0.0-2.0)')
-    parser.add_argument('--max-tokens', type=int, help='Maximum tokens in response')
-    parser.add_argument('--retry-limit', type=int, help='Maximum retry attempts')
-    parser.add_argument('--output-dir', help='Output directory for results')
-
-    # Batch 1 options
-    parser.add_argument('--prompt', help='Prompt text (batch1)')
-    parser.add_argument('--prompt-file', help='File containing prompt (batch1, batch2)')
-
-    # Batch 2 options
-    parser.add_argument('--thesis-prompt', help='Thesis extraction prompt (batch2)')
-
-    # Batch 5 options
-    parser.add_argument('--essay-file', help='File containing essays (batch5)')
-    parser.add_argument('--topic-prompt', help='Topic classification prompt (batch5)')
+    # Only build the selected experiment's parser; fall back to all of them
+    # so top-level --help and usage errors still list every choice.
+    selected = _selected_experiment(argv)
+    for name, build in BATCH_PARSERS.items():
+        if selected is None or name == selected:
+            build(subparsers)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Load configuration
     config = load_config(args.config)
@@ -226,12 +297,7 @@ Examples:
     args.model = model_name
 
     # Run appropriate experiment
-    if args.experiment == 'batch1':
-        run_batch1(args, config)
-    elif args.experiment == 'batch2':
-        run_batch2(args, config)
-    elif args.experiment == 'batch5':
-        run_batch5(args, config)
+    args.func(args, config)
 
 
 if __name__ == '__main__':
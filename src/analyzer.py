@@ -1,29 +1,126 @@
 """Essay Structure Analyzer module."""
 
+import asyncio
 import logging
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from rich.console import Console
-from rich.table import Table
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, replace
+from enum import IntFlag
 
 from .models.base import AIModel
+from .utils import run_coroutine
 
 # Configure logging
 logger = logging.getLogger(__name__)
-console = Console()
+
+# Number of analyses memoized per EssayAnalyzer instance
+ANALYSIS_CACHE_SIZE = 128
+
+# Minimum paragraph lengths (in words) for intro/conclusion detection
+_MIN_INTRO_WORDS = 30
+_MIN_CONCLUSION_WORDS = 20
+
+# Marker phrases used by the structural heuristics
+_INTRO_MARKERS = frozenset({
+    "this essay", "this paper", "will discuss", "will explore",
+    "will examine", "in this", "purpose of this",
+})
+_CONCLUSION_MARKERS = frozenset({
+    "in conclusion", "to conclude", "in summary",
+    "to summarize", "ultimately", "in the end",
+    "therefore", "thus",
+})
+_TRANSITION_MARKERS = frozenset({
+    "however", "moreover", "furthermore", "additionally", "nevertheless",
+    "consequently", "therefore", "thus", "meanwhile", "similarly",
+    "in contrast", "on the other hand", "for example", "for instance",
+})
+
+
+def _compile_markers(markers: frozenset) -> re.Pattern:
+    """Compile a marker set into one alternation (plain substring semantics)."""
+    # Sorted for a deterministic pattern; longest first so the match is maximal
+    ordered = sorted(markers, key=lambda m: (-len(m), m))
+    return re.compile("|".join(re.escape(m) for m in ordered))
+
+
+# (header, width) for the paragraph table in print_analysis
+_PARAGRAPH_TABLE_COLUMNS = (
+    ("#", 4),
+    ("Words", 8),
+    ("Strength", 10),
+    ("Topic Sentence", 8),
+    ("Issues", 30),
+)
+
+_console = None
+
+
+def _get_console():
+    """Return the shared rich Console, importing rich on first use."""
+    # rich is only needed for rendering; keep it off the analyze() import path
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-separated words."""
+    return len(text.split())
+
+
+def _split_paragraphs(text: str) -> List[str]:
+    """Split text on blank lines, returning stripped non-empty paragraphs."""
+    # Strip each chunk once (the old comprehension stripped twice)
+    return [p for p in map(str.strip, text.split('\n\n')) if p]
+
+
+_INTRO_RE = _compile_markers(_INTRO_MARKERS)
+_CONCLUSION_RE = _compile_markers(_CONCLUSION_MARKERS)
+_TRANSITION_RE = _compile_markers(_TRANSITION_MARKERS)
+
+class ParagraphIssue(IntFlag):
+    """Structural problems detected in a paragraph."""
+    NONE = 0
+    TOO_SHORT = 1
+    TOO_LONG = 2
+    NO_TOPIC = 4
+
+    def descriptions(self) -> List[str]:
+        """Human-readable text for each flag set, in display order."""
+        return [text for flag, text in _ISSUE_DESCRIPTIONS.items() if self & flag]
+
+_ISSUE_DESCRIPTIONS = {
+    ParagraphIssue.TOO_SHORT: "Too short (under 50 words)",
+    ParagraphIssue.TOO_LONG: "Too long (over 250 words)",
+    ParagraphIssue.NO_TOPIC: "Weak or missing topic sentence",
+}
 
 @dataclass
 class ParagraphAnalysis:
-    """Analysis of a single paragraph."""
+    """Analysis of a single paragraph.
+
+    Issues are stored as ParagraphIssue flags in issue_flags; the issues
+    property keeps the earlier List[str] view of them.
+    """
     number: int
     word_count: int
     has_topic_sentence: bool
     topic_sentence: Optional[str]
     strength: str  # "strong", "moderate", "weak"
-    issues: List[str]
+    issue_flags: ParagraphIssue
     is_body: bool = False  # Whether this is a body paragraph (not intro/conclusion)
 
+    @property
+    def issues(self) -> List[str]:
+        """Human-readable descriptions of the paragraph's issues."""
+        return self.issue_flags.descriptions()
+
 @dataclass
 class EssayStructure:
     """Complete essay structure analysis."""
@@ -39,6 +136,37 @@ class EssayStructure:
     overall_score: float  # 0-100
     recommendations: List[str]
 
+@dataclass
+class _ParsedEssay:
+    """Paragraph-level data shared between analysis stages."""
+    paragraphs: List[str]
+    word_counts: List[int]
+    has_intro: bool
+    has_conclusion: bool
+
+@dataclass
+class _BodyCounts:
+    """Body-paragraph tallies shared by scoring and recommendations."""
+    total: int = 0
+    strong: int = 0
+    moderate: int = 0
+    weak: int = 0
+    missing_topic: int = 0
+
+    def add(self, p: ParagraphAnalysis) -> None:
+        """Fold one paragraph into the tallies (non-body paragraphs are ignored)."""
+        if not p.is_body:
+            return
+        self.total += 1
+        if p.strength == "strong":
+            self.strong += 1
+        elif p.strength == "moderate":
+            self.moderate += 1
+        elif p.strength == "weak":
+            self.weak += 1
+        if not p.has_topic_sentence and p.issue_flags:
+            self.missing_topic += 1
+
 class EssayAnalyzer:
     """Analyzes essay structure and provides recommendations."""
 
@@ -50,51 +178,189 @@ class EssayAnalyzer:
             model: AIModel instance for AI-powered analysis (optional)
         """
         self.model = model
+        # Per-instance LRU memo so repeated scoring of the same text is free;
+        # essay text -> structure, least recently used first
+        self._analyses: "OrderedDict[str, EssayStructure]" = OrderedDict()
 
     def analyze(self, essay_text: str) -> EssayStructure:
         """
         Analyze essay structure.
 
+        Results are memoized per analyzer instance by essay text, except
+        when the AI thesis call failed, so the next analysis retries it. The
+        top-level lists are copied for each caller; the ParagraphAnalysis
+        entries are shared and should be treated as read-only.
+
         Args:
             essay_text: The essay text to analyze
 
         Returns:
             EssayStructure with complete analysis
         """
-        # Split into paragraphs
-        paragraphs = [p.strip() for p in essay_text.split('\n\n') if p.strip()]
+        structure = self._recall(essay_text)
+        if structure is None:
+            structure, complete = self._analyze_uncached(essay_text)
+            if complete:
+                self._remember(essay_text, structure)
+        return self._copy_structure(structure)
+
+    def _recall(self, essay_text: str) -> Optional[EssayStructure]:
+        """Return the memoized analysis for a text, marking it recently used."""
+        structure = self._analyses.get(essay_text)
+        if structure is not None:
+            self._analyses.move_to_end(essay_text)
+        return structure
+
+    def _remember(self, essay_text: str, structure: EssayStructure) -> None:
+        """Memoize an analysis, evicting the least recently used past the cap."""
+        self._analyses[essay_text] = structure
+        self._analyses.move_to_end(essay_text)
+        if len(self._analyses) > ANALYSIS_CACHE_SIZE:
+            self._analyses.popitem(last=False)
+
+    def _analyze_uncached(self, essay_text: str) -> Tuple[EssayStructure, bool]:
+        """Run the full analysis pipeline for one essay.
+
+        Returns the structure and whether it is complete (False when the AI
+        thesis call failed).
+        """
+        parsed = self._parse(essay_text)
+        if parsed is None:
+            return self._create_empty_structure(), True
+
+        if not self.model:
+            thesis, thesis_loc = self._extract_thesis(parsed.paragraphs, parsed.has_intro, parsed.has_conclusion)
+            return self._build_structure(parsed, thesis, thesis_loc), True
+
+        success, response, _ = self.model.call(self._thesis_prompt(parsed.paragraphs))
+        thesis, thesis_loc = self._parse_thesis_response(success, response, parsed.paragraphs, parsed.has_conclusion)
+        return self._build_structure(parsed, thesis, thesis_loc), success
+
+    def analyze_batch(self, essays: List[str]) -> List[EssayStructure]:
+        """
+        Analyze several essays, issuing AI thesis extraction calls concurrently.
+
+        Shares the memo with analyze(): memoized essays are not re-analyzed,
+        and new results are memoized unless their AI thesis call failed.
+
+        Args:
+            essays: Essay texts to analyze
+
+        Returns:
+            EssayStructure for each essay, in input order
+        """
+        # Identical essays (common in uniqueness runs) are analyzed once
+        by_text: Dict[str, EssayStructure] = {}
+        new_texts = []
+        for text in dict.fromkeys(essays):
+            structure = self._recall(text)
+            if structure is None:
+                new_texts.append(text)
+            else:
+                by_text[text] = structure
+
+        parsed_essays = [self._parse(text) for text in new_texts]
+        pending = [p for p in parsed_essays if p is not None]
+
+        if self.model:
+            theses = run_coroutine(self._extract_theses_async(pending))
+        else:
+            theses = [
+                (*self._extract_thesis(p.paragraphs, p.has_intro, p.has_conclusion), True)
+                for p in pending
+            ]
+
+        thesis_iter = iter(theses)
+        for text, parsed in zip(new_texts, parsed_essays):
+            if parsed is None:
+                structure, complete = self._create_empty_structure(), True
+            else:
+                thesis, thesis_loc, complete = next(thesis_iter)
+                structure = self._build_structure(parsed, thesis, thesis_loc)
+            if complete:
+                self._remember(text, structure)
+            by_text[text] = structure
+        return [self._copy_structure(by_text[text]) for text in essays]
+
+    @staticmethod
+    def _copy_structure(structure: EssayStructure) -> EssayStructure:
+        """Copy a shared structure so callers can't mutate its lists."""
+        return replace(
+            structure,
+            paragraphs=list(structure.paragraphs),
+            recommendations=list(structure.recommendations),
+        )
+
+    async def _extract_theses_async(
+        self, parsed_essays: List[_ParsedEssay]
+    ) -> List[Tuple[Optional[str], Optional[str], bool]]:
+        """Run AI thesis extraction for all essays in parallel.
+
+        Returns (thesis, location, success) for each essay.
+        """
+        responses = await asyncio.gather(
+            *(self.model.acall(self._thesis_prompt(p.paragraphs)) for p in parsed_essays)
+        )
+        return [
+            (*self._parse_thesis_response(success, response, p.paragraphs, p.has_conclusion), success)
+            for p, (success, response, _error) in zip(parsed_essays, responses)
+        ]
+
+    def _parse(self, essay_text: str) -> Optional[_ParsedEssay]:
+        """Split an essay into paragraphs and detect intro/conclusion."""
+        paragraphs = _split_paragraphs(essay_text)
 
         if not paragraphs:
-            return self._create_empty_structure()
+            return None
+
+        # Count words once per paragraph; token lists are dropped right away
+        word_counts = [_word_count(p) for p in paragraphs]
 
-        # Analyze each component
-        has_intro = self._detect_introduction(paragraphs[0])
-        has_conclusion = self._detect_conclusion(paragraphs[-1]) if len(paragraphs) > 1 else False
-        thesis, thesis_loc = self._extract_thesis(paragraphs, has_intro, has_conclusion)
+        # Cheap word-count guards first; only lowercase paragraphs that pass
+        has_intro = word_counts[0] >= _MIN_INTRO_WORDS and self._detect_introduction(
+            paragraphs[0], word_counts[0], paragraphs[0].lower()
+        )
+        has_conclusion = (
+            len(paragraphs) > 1
+            and word_counts[-1] >= _MIN_CONCLUSION_WORDS
+            and self._detect_conclusion(paragraphs[-1], word_counts[-1], paragraphs[-1].lower())
+        )
+        return _ParsedEssay(paragraphs, word_counts, has_intro, has_conclusion)
+
+    def _build_structure(
+        self, parsed: _ParsedEssay, thesis: Optional[str], thesis_loc: Optional[str]
+    ) -> EssayStructure:
+        """Score a parsed essay and assemble the final structure."""
+        paragraphs = parsed.paragraphs
+        has_intro = parsed.has_intro
+        has_conclusion = parsed.has_conclusion
 
         # Analyze paragraphs
         paragraph_analyses = []
         body_start = 1 if has_intro else 0
         body_end = len(paragraphs) - 1 if has_conclusion else len(paragraphs)
 
+        # Tally body paragraphs as they are analyzed, for both recommendations and score
+        counts = _BodyCounts()
         for i, para in enumerate(paragraphs):
             is_body = body_start <= i < body_end
-            analysis = self._analyze_paragraph(i + 1, para, is_body)
+            analysis = self._analyze_paragraph(i + 1, para, is_body, parsed.word_counts[i])
             paragraph_analyses.append(analysis)
+            counts.add(analysis)
 
         # Calculate metrics
-        total_words = sum(len(p.split()) for p in paragraphs)
+        total_words = sum(parsed.word_counts)
         body_count = body_end - body_start
         transition_quality = self._assess_transitions(paragraphs)
 
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            has_intro, has_conclusion, thesis, paragraph_analyses, transition_quality
+            has_intro, has_conclusion, thesis, paragraph_analyses, transition_quality, counts
         )
 
         # Calculate overall score
         score = self._calculate_score(
-            has_intro, has_conclusion, thesis, paragraph_analyses, transition_quality
+            has_intro, has_conclusion, thesis, paragraph_analyses, transition_quality, counts
         )
 
         return EssayStructure(
@@ -111,37 +377,36 @@ class EssayAnalyzer:
             recommendations=recommendations
         )
 
-    def _detect_introduction(self, first_para: str) -> bool:
+    def _detect_introduction(
+        self, first_para: str, word_count: Optional[int] = None, text_lower: Optional[str] = None
+    ) -> bool:
         """Detect if first paragraph is a proper introduction."""
-        words = first_para.split()
-        word_count = len(words)
+        if word_count is None:
+            word_count = _word_count(first_para)
 
         # Simple heuristics
-        if word_count < 30:
+        if word_count < _MIN_INTRO_WORDS:
             return False
 
         # Look for introduction markers
-        intro_markers = ["this essay", "this paper", "will discuss", "will explore",
-                        "will examine", "in this", "purpose of this"]
-        text_lower = first_para.lower()
-
-        return any(marker in text_lower for marker in intro_markers)
+        if text_lower is None:
+            text_lower = first_para.lower()
+        return _INTRO_RE.search(text_lower) is not None
 
-    def _detect_conclusion(self, last_para: str) -> bool:
+    def _detect_conclusion(
+        self, last_para: str, word_count: Optional[int] = None, text_lower: Optional[str] = None
+    ) -> bool:
         """Detect if last paragraph is a proper conclusion."""
-        words = last_para.split()
-        word_count = len(words)
+        if word_count is None:
+            word_count = _word_count(last_para)
 
-        if word_count < 20:
+        if word_count < _MIN_CONCLUSION_WORDS:
             return False
 
         # Look for conclusion markers
-        conclusion_markers = ["in conclusion", "to conclude", "in summary",
-                             "to summarize", "ultimately", "in the end",
-                             "therefore", "thus"]
-        text_lower = last_para.lower()
-
-        return any(marker in text_lower for marker in conclusion_markers)
+        if text_lower is None:
+            text_lower = last_para.lower()
+        return _CONCLUSION_RE.search(text_lower) is not None
 
     def _extract_thesis(self, paragraphs: List[str], has_intro: bool, has_conclusion: bool) -> tuple[Optional[str], Optional[str]]:
         """Extract thesis statement and its location."""
@@ -155,14 +420,24 @@ class EssayAnalyzer:
             return None, "missing"
 
         # AI-powered extraction
-        prompt = (
+        success, response, error = self.model.call(self._thesis_prompt(paragraphs))
+        return self._parse_thesis_response(success, response, paragraphs, has_conclusion)
+
+    @staticmethod
+    def _thesis_prompt(paragraphs: List[str]) -> str:
+        """Build the thesis extraction prompt from the opening paragraphs."""
+        return (
             "Identify the thesis statement in the following essay. "
             "Return ONLY the thesis statement, nothing else. "
             "If there is no clear thesis, return 'NO_THESIS'.\n\n"
             f"Essay:\n{' '.join(paragraphs[:3])[:1000]}..."  # First few paragraphs
         )
 
-        success, response, error = self.model.call(prompt)
+    @staticmethod
+    def _parse_thesis_response(
+        success: bool, response: str, paragraphs: List[str], has_conclusion: bool
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Turn a thesis extraction response into (thesis, location)."""
         if success and response.strip() != "NO_THESIS":
             # Determine location
             if response.lower() in paragraphs[0].lower():
@@ -175,10 +450,12 @@ class EssayAnalyzer:
 
         return None, "missing"
 
-    def _analyze_paragraph(self, number: int, para: str, is_body: bool) -> ParagraphAnalysis:
-        """Analyze a single paragraph."""
-        words = para.split()
-        word_count = len(words)
+    def _analyze_paragraph(
+        self, number: int, para: str, is_body: bool, word_count: Optional[int] = None
+    ) -> ParagraphAnalysis:
+        """Analyze a single paragraph (reusing a precomputed word count when given)."""
+        if word_count is None:
+            word_count = _word_count(para)
         sentences = para.split('.')
 
         # Extract potential topic sentence (first sentence)
@@ -187,14 +464,14 @@ class EssayAnalyzer:
         # Simple heuristic for topic sentence quality
         has_topic = False
         strength = "weak"
-        issues = []
+        issues = ParagraphIssue.NONE
 
         if is_body:
             if word_count < 50:
-                issues.append("Too short (under 50 words)")
+                issues |= ParagraphIssue.TOO_SHORT
                 strength = "weak"
             elif word_count > 250:
-                issues.append("Too long (over 250 words)")
+                issues |= ParagraphIssue.TOO_LONG
                 strength = "moderate"
             else:
                 strength = "moderate"
@@ -204,7 +481,7 @@ class EssayAnalyzer:
                 if len(sentences) > 3:
                     strength = "strong"
             else:
-                issues.append("Weak or missing topic sentence")
+                issues |= ParagraphIssue.NO_TOPIC
                 has_topic = False
 
         return ParagraphAnalysis(
@@ -213,7 +490,7 @@ class EssayAnalyzer:
             has_topic_sentence=has_topic,
             topic_sentence=topic_sentence,
             strength=strength,
-            issues=issues,
+            issue_flags=issues,
             is_body=is_body
         )
 
@@ -222,16 +499,10 @@ class EssayAnalyzer:
         if len(paragraphs) < 2:
             return "weak"
 
-        transition_words = [
-            "however", "moreover", "furthermore", "additionally", "nevertheless",
-            "consequently", "therefore", "thus", "meanwhile", "similarly",
-            "in contrast", "on the other hand", "for example", "for instance"
-        ]
-
         transition_count = 0
         for para in paragraphs[1:]:  # Skip first paragraph
-            first_sentence = para.split('.')[0].lower()
-            if any(word in first_sentence for word in transition_words):
+            first_sentence = para.split('.', 1)[0].lower()
+            if _TRANSITION_RE.search(first_sentence):
                 transition_count += 1
 
         ratio = transition_count / (len(paragraphs) - 1)
@@ -243,15 +514,26 @@ class EssayAnalyzer:
         else:
             return "weak"
 
+    @staticmethod
+    def _summarize(paragraphs: List[ParagraphAnalysis]) -> _BodyCounts:
+        """Tally body paragraphs by strength and topic-sentence status in one pass."""
+        counts = _BodyCounts()
+        for p in paragraphs:
+            counts.add(p)
+        return counts
+
     def _generate_recommendations(
         self,
         has_intro: bool,
         has_conclusion: bool,
         thesis: Optional[str],
         paragraphs: List[ParagraphAnalysis],
-        transition_quality: str
+        transition_quality: str,
+        counts: Optional[_BodyCounts] = None
     ) -> List[str]:
         """Generate improvement recommendations."""
+        if counts is None:
+            counts = self._summarize(paragraphs)
         recs = []
 
         if not has_intro:
@@ -264,15 +546,12 @@ class EssayAnalyzer:
             recs.append("Include a clear thesis statement")
 
         # Check body paragraphs only (exclude intro/conclusion)
-        body_paras = [p for p in paragraphs if p.is_body]
-        weak_body_paras = [p for p in body_paras if p.strength == "weak"]
-        if weak_body_paras:
-            recs.append(f"Strengthen {len(weak_body_paras)} weak body paragraph(s)")
+        if counts.weak:
+            recs.append(f"Strengthen {counts.weak} weak body paragraph(s)")
 
         # Check topic sentences in body paragraphs only
-        missing_topics = [p for p in body_paras if not p.has_topic_sentence and p.issues]
-        if missing_topics:
-            recs.append(f"Add clear topic sentences to {len(missing_topics)} paragraph(s)")
+        if counts.missing_topic:
+            recs.append(f"Add clear topic sentences to {counts.missing_topic} paragraph(s)")
 
         # Check transitions
         if transition_quality == "weak":
@@ -291,9 +570,12 @@ class EssayAnalyzer:
         has_conclusion: bool,
         thesis: Optional[str],
         paragraphs: List[ParagraphAnalysis],
-        transition_quality: str
+        transition_quality: str,
+        counts: Optional[_BodyCounts] = None
     ) -> float:
         """Calculate overall structure score (0-100)."""
+        if counts is None:
+            counts = self._summarize(paragraphs)
         score = 0.0
 
         # Introduction (20 points)
@@ -309,12 +591,8 @@ class EssayAnalyzer:
             score += 25
 
         # Body paragraphs (30 points) - only score actual body paragraphs
-        body_paras = [p for p in paragraphs if p.is_body]
-        if body_paras:
-            strong_count = len([p for p in body_paras if p.strength == "strong"])
-            moderate_count = len([p for p in body_paras if p.strength == "moderate"])
-
-            body_score = (strong_count * 1.0 + moderate_count * 0.6) / len(body_paras)
+        if counts.total:
+            body_score = (counts.strong * 1.0 + counts.moderate * 0.6) / counts.total
             score += body_score * 30
 
         # Transitions (10 points)
@@ -343,8 +621,19 @@ class EssayAnalyzer:
             recommendations=["Provide essay text to analyze"]
         )
 
+    @staticmethod
+    def _make_paragraph_table():
+        """Create an empty paragraph table with the standard columns."""
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold")
+        for header, width in _PARAGRAPH_TABLE_COLUMNS:
+            table.add_column(header, width=width)
+        return table
+
     def print_analysis(self, structure: EssayStructure) -> None:
         """Print formatted analysis to console."""
+        console = _get_console()
         console.print("\n[bold cyan]Essay Structure Analysis[/bold cyan]")
         console.print("=" * 60)
 
@@ -385,12 +674,7 @@ class EssayAnalyzer:
         if structure.paragraphs:
             console.print(f"\n[bold]Paragraph Analysis:[/bold]")
 
-            table = Table(show_header=True, header_style="bold")
-            table.add_column("#", width=4)
-            table.add_column("Words", width=8)
-            table.add_column("Strength", width=10)
-            table.add_column("Topic Sentence", width=8)
-            table.add_column("Issues", width=30)
+            table = self._make_paragraph_table()
 
             for p in structure.paragraphs:
                 strength_color = {
@@ -400,7 +684,7 @@ class EssayAnalyzer:
                 }[p.strength]
 
                 topic_icon = "✅" if p.has_topic_sentence else "❌"
-                issues_text = ", ".join(p.issues) if p.issues else "None"
+                issues_text = ", ".join(p.issues) or "None"
 
                 table.add_row(
                     str(p.number),
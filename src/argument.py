@@ -1,15 +1,23 @@
 """Argument Analyzer & Strengthener."""
 
+import asyncio
+import json
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from .models.base import AIModel
+from .models.cache import ResponseCache, default_cache_dir
+from .utils import run_coroutine
 
 logger = logging.getLogger(__name__)
 
+# Labels recognised in the line-based model replies
+_CLAIM_FIELDS = frozenset({"Type", "Strength", "Evidence", "Explanation"})
+_EVALUATION_LABELS = frozenset({"Score", "Critique", "Suggestions"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Claim:
     """A specific claim made in the argument."""
 
@@ -20,17 +28,21 @@ class Claim:
     explanation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fallacy:
     """A detected logical fallacy."""
 
     name: str
-    description: str
     text: str
     explanation: str
 
+    @property
+    def description(self) -> str:
+        """Short description of the fallacy (currently the explanation)."""
+        return self.explanation
+
 
-@dataclass
+@dataclass(slots=True)
 class ArgumentAnalysis:
     """Full analysis of an essay's argumentation."""
 
@@ -45,19 +57,47 @@ class ArgumentAnalysis:
 class ArgumentAnalyzer:
     """Analyzes and strengthens arguments in essays."""
 
-    def __init__(self, model: Optional[AIModel] = None):
+    def __init__(
+        self,
+        model: Optional[AIModel] = None,
+        combined: bool = True,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+    ):
         """
         Initialize the analyzer.
 
         Args:
             model: AI model for analysis.
+            combined: Ask for structure, fallacies and evaluation in one JSON
+                call before falling back to three separate prompts.
+            cache: Response cache (defaults to the on-disk cache).
+            bypass_cache: Always query the model, refreshing cached responses.
         """
         self.model = model
+        self.combined = combined
+        self.cache = cache if cache is not None else ResponseCache(default_cache_dir())
+        self.bypass_cache = bypass_cache
 
     def analyze(self, text: str) -> ArgumentAnalysis:
         """
         Analyze the argumentation in the text.
 
+        Args:
+            text: The essay text to analyze.
+
+        Returns:
+            ArgumentAnalysis object containing the results.
+        """
+        return run_coroutine(self.aanalyze(text))
+
+    async def aanalyze(self, text: str) -> ArgumentAnalysis:
+        """
+        Async version of analyze.
+
+        The structure, fallacy and strength prompts are independent of each
+        other, so all three model calls are issued concurrently.
+
         Args:
             text: The essay text to analyze.
 
@@ -71,14 +111,25 @@ class ArgumentAnalyzer:
             logger.warning("No AI model provided for argument analysis.")
             return ArgumentAnalysis(thesis=None, critique="AI model required for argument analysis.")
 
-        # 1. Extract structure (Thesis & Claims)
-        structure = self._extract_structure(text)
-        
-        # 2. Detect fallacies
-        fallacies = self._detect_fallacies(text)
-        
-        # 3. Evaluate strength and get suggestions
-        evaluation = self._evaluate_strength(text, structure, fallacies)
+        if self.combined:
+            success, response, error = await self._acall_model(self._combined_prompt(text))
+            if not success:
+                # A failed call (rate limit, timeout) says nothing about whether
+                # the model can answer in JSON, so combined mode stays on
+                logger.warning(f"Argument analysis call failed: {error}")
+                return ArgumentAnalysis(thesis=None, critique="Could not evaluate.")
+            analysis = self._parse_combined_response(response)
+            if analysis is not None:
+                return analysis
+            # Model did not return usable JSON; don't retry it for this analyzer
+            logger.info("Combined argument analysis reply was not JSON; using separate prompts.")
+            self.combined = False
+
+        structure, fallacies, evaluation = await asyncio.gather(
+            self._extract_structure_async(text),
+            self._detect_fallacies_async(text),
+            self._evaluate_strength_async(text),
+        )
 
         return ArgumentAnalysis(
             thesis=structure.get("thesis"),
@@ -89,9 +140,96 @@ class ArgumentAnalyzer:
             suggestions=evaluation.get("suggestions", []),
         )
 
+    def _call_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Call the model through the response cache."""
+        return self.cache.call(self.model, prompt, bypass_cache=self.bypass_cache)
+
+    async def _acall_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Async call to the model through the response cache."""
+        return await self.cache.acall(self.model, prompt, bypass_cache=self.bypass_cache)
+
+    @staticmethod
+    def _combined_prompt(text: str) -> str:
+        """Build the single-call analysis prompt."""
+        return (
+            "Review the argument in the following text. Identify the main thesis and the key claims "
+            "(with type, strength and evidence), any logical fallacies, and rate the overall argument "
+            "strength on a scale of 1-10 with a brief critique and 3 suggestions for improvement.\n\n"
+            "Answer with JSON only, in this format:\n"
+            "{\n"
+            '  "thesis": "The main thesis statement",\n'
+            '  "claims": [{"text": "...", "type": "supporting/counter", "strength": "strong/moderate/weak", '
+            '"evidence": "... or null", "explanation": "..."}],\n'
+            '  "fallacies": [{"name": "...", "text": "...", "explanation": "..."}],\n'
+            '  "score": 1-10,\n'
+            '  "critique": "One paragraph critique",\n'
+            '  "suggestions": ["...", "...", "..."]\n'
+            "}\n\n"
+            f"Text:\n{text}"
+        )
+
+    def _parse_combined_response(self, response: str) -> Optional[ArgumentAnalysis]:
+        """Parse the JSON reply of the single-call prompt."""
+        # Parse only the outermost {...}, which skips markdown fences or prose
+        # around the object; replies without one fall back without a parse
+        start = response.find("{")
+        end = response.rfind("}")
+        if start == -1 or end < start:
+            return None
+        try:
+            data = json.loads(response[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        try:
+            claims = [
+                Claim(
+                    text=c["text"],
+                    type=str(c.get("type") or "supporting").lower(),
+                    strength=str(c.get("strength") or "moderate").lower(),
+                    evidence=c.get("evidence"),
+                    explanation=c.get("explanation"),
+                )
+                for c in data.get("claims") or []
+            ]
+            fallacies = [
+                Fallacy(
+                    name=f["name"],
+                    text=f.get("text", ""),
+                    explanation=f.get("explanation", ""),
+                )
+                for f in data.get("fallacies") or []
+            ]
+            score = float(data.get("score") or 0.0)
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            logger.warning(f"Malformed combined analysis response: {e}")
+            return None
+
+        return ArgumentAnalysis(
+            thesis=data.get("thesis"),
+            claims=claims,
+            fallacies=fallacies,
+            overall_strength=score,
+            critique=data.get("critique") or "",
+            suggestions=list(data.get("suggestions") or []),
+        )
+
     def _extract_structure(self, text: str) -> Dict[str, Any]:
         """Extract thesis and supporting claims."""
-        prompt = (
+        success, response, _ = self._call_model(self._structure_prompt(text))
+        return self._structure_from_response(success, response)
+
+    async def _extract_structure_async(self, text: str) -> Dict[str, Any]:
+        """Async version of _extract_structure."""
+        success, response, _ = await self._acall_model(self._structure_prompt(text))
+        return self._structure_from_response(success, response)
+
+    @staticmethod
+    def _structure_prompt(text: str) -> str:
+        """Build the thesis/claims extraction prompt."""
+        return (
             "Analyze the argument structure of the following text.\n"
             "Identify the main thesis statement and the key supporting claims.\n"
             "For each claim, assess its strength (strong/moderate/weak) and identify any evidence used.\n\n"
@@ -106,7 +244,8 @@ class ArgumentAnalyzer:
             f"Text:\n{text}"
         )
 
-        success, response, _ = self.model.call(prompt)
+    def _structure_from_response(self, success: bool, response: str) -> Dict[str, Any]:
+        """Turn a structure call result into thesis and claims."""
         if not success:
             return {"thesis": None, "claims": []}
 
@@ -114,47 +253,52 @@ class ArgumentAnalyzer:
 
     def _parse_structure_response(self, response: str) -> Dict[str, Any]:
         """Parse the AI response for structure."""
-        lines = response.strip().split('\n')
         thesis = None
         claims = []
         current_claim = {}
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_claim:
-                    claims.append(Claim(**current_claim))
+        for line in response.strip().split('\n'):
+            label, sep, value = line.partition(":")
+            label = label.strip()
+            if not sep:
+                if not label:
+                    # Blank line closes the current claim
+                    if "text" in current_claim:
+                        claims.append(Claim(**current_claim))
                     current_claim = {}
                 continue
 
-            if line.startswith("Thesis:"):
-                thesis = line.replace("Thesis:", "").strip()
-            elif line.startswith("Claim") and ":" in line:
-                if current_claim and "text" in current_claim:
+            if label == "Thesis":
+                thesis = value.strip()
+            elif label.startswith("Claim"):
+                if "text" in current_claim:
                     claims.append(Claim(**current_claim))
                 # Reset with defaults
-                current_claim = {
-                    "text": line.split(":", 1)[1].strip(),
-                    "type": "supporting",
-                    "strength": "moderate"
-                }
-            elif line.startswith("Type:"):
-                current_claim["type"] = line.replace("Type:", "").strip().lower()
-            elif line.startswith("Strength:"):
-                current_claim["strength"] = line.replace("Strength:", "").strip().lower()
-            elif line.startswith("Evidence:"):
-                current_claim["evidence"] = line.replace("Evidence:", "").strip()
-            elif line.startswith("Explanation:"):
-                current_claim["explanation"] = line.replace("Explanation:", "").strip()
-
-        if current_claim and "text" in current_claim:
+                current_claim = {"text": value.strip(), "type": "supporting", "strength": "moderate"}
+            elif label in _CLAIM_FIELDS:
+                value = value.strip()
+                key = label.lower()
+                current_claim[key] = value.lower() if key in ("type", "strength") else value
+
+        if "text" in current_claim:
             claims.append(Claim(**current_claim))
 
         return {"thesis": thesis, "claims": claims}
 
     def _detect_fallacies(self, text: str) -> List[Fallacy]:
         """Detect logical fallacies."""
-        prompt = (
+        success, response, _ = self._call_model(self._fallacy_prompt(text))
+        return self._fallacies_from_response(success, response)
+
+    async def _detect_fallacies_async(self, text: str) -> List[Fallacy]:
+        """Async version of _detect_fallacies."""
+        success, response, _ = await self._acall_model(self._fallacy_prompt(text))
+        return self._fallacies_from_response(success, response)
+
+    @staticmethod
+    def _fallacy_prompt(text: str) -> str:
+        """Build the fallacy detection prompt."""
+        return (
             "Identify any logical fallacies in the following text.\n"
             "Look for common fallacies like Ad Hominem, Straw Man, Slippery Slope, Circular Reasoning, Hasty Generalization, etc.\n"
             "If no fallacies are found, reply with 'No fallacies found.'\n\n"
@@ -165,7 +309,8 @@ class ArgumentAnalyzer:
             f"Text:\n{text}"
         )
 
-        success, response, _ = self.model.call(prompt)
+    def _fallacies_from_response(self, success: bool, response: str) -> List[Fallacy]:
+        """Turn a fallacy call result into Fallacy objects."""
         if not success or "no fallacies found" in response.lower():
             return []
 
@@ -173,43 +318,58 @@ class ArgumentAnalyzer:
 
     def _parse_fallacy_response(self, response: str) -> List[Fallacy]:
         """Parse the AI response for fallacies."""
-        lines = response.strip().split('\n')
         fallacies = []
         current_fallacy = {}
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_fallacy:
-                    fallacies.append(Fallacy(**current_fallacy))
+        for line in response.strip().split('\n'):
+            label, sep, value = line.partition(":")
+            label = label.strip()
+            if not sep:
+                if not label:
+                    # Blank line closes the current fallacy
+                    if "name" in current_fallacy:
+                        fallacies.append(Fallacy(**current_fallacy))
                     current_fallacy = {}
                 continue
 
-            if line.startswith("Fallacy:"):
-                if current_fallacy and "name" in current_fallacy and "text" in current_fallacy:
+            if label == "Fallacy":
+                if "name" in current_fallacy and "text" in current_fallacy:
                     fallacies.append(Fallacy(**current_fallacy))
                 # Reset with defaults
-                current_fallacy = {
-                    "name": line.replace("Fallacy:", "").strip(),
-                    "description": "",
-                    "text": "",
-                    "explanation": ""
-                }
-            elif line.startswith("Text:"):
-                current_fallacy["text"] = line.replace("Text:", "").strip()
-            elif line.startswith("Explanation:"):
-                explanation = line.replace("Explanation:", "").strip()
-                current_fallacy["explanation"] = explanation
-                current_fallacy["description"] = explanation # Use explanation as description for now
-
-        if current_fallacy and "name" in current_fallacy and "text" in current_fallacy:
+                current_fallacy = {"name": value.strip(), "text": "", "explanation": ""}
+            elif label == "Text":
+                current_fallacy["text"] = value.strip()
+            elif label == "Explanation":
+                current_fallacy["explanation"] = value.strip()
+
+        if "name" in current_fallacy and "text" in current_fallacy:
             fallacies.append(Fallacy(**current_fallacy))
 
         return fallacies
 
-    def _evaluate_strength(self, text: str, structure: Dict[str, Any], fallacies: List[Fallacy]) -> Dict[str, Any]:
-        """Evaluate overall argument strength and generate suggestions."""
-        prompt = (
+    def _evaluate_strength(
+        self,
+        text: str,
+        structure: Optional[Dict[str, Any]] = None,
+        fallacies: Optional[List[Fallacy]] = None,
+    ) -> Dict[str, Any]:
+        """Evaluate overall argument strength and generate suggestions.
+
+        The prompt is built from the text alone; structure and fallacies are
+        accepted for backwards compatibility but not sent to the model.
+        """
+        success, response, _ = self._call_model(self._evaluation_prompt(text))
+        return self._evaluation_from_response(success, response)
+
+    async def _evaluate_strength_async(self, text: str) -> Dict[str, Any]:
+        """Async version of _evaluate_strength."""
+        success, response, _ = await self._acall_model(self._evaluation_prompt(text))
+        return self._evaluation_from_response(success, response)
+
+    @staticmethod
+    def _evaluation_prompt(text: str) -> str:
+        """Build the strength evaluation prompt."""
+        return (
             "Evaluate the overall strength of the argument in the following text on a scale of 1-10.\n"
             "Consider the clarity of the thesis, the strength of supporting claims, and the presence of any logical fallacies.\n"
             "Provide a brief critique and 3 specific suggestions for improvement.\n\n"
@@ -223,7 +383,8 @@ class ArgumentAnalyzer:
             f"Text:\n{text}"
         )
 
-        success, response, _ = self.model.call(prompt)
+    def _evaluation_from_response(self, success: bool, response: str) -> Dict[str, Any]:
+        """Turn an evaluation call result into score, critique and suggestions."""
         if not success:
             return {"score": 0.0, "critique": "Could not evaluate.", "suggestions": []}
 
@@ -231,36 +392,38 @@ class ArgumentAnalyzer:
 
     def _parse_evaluation_response(self, response: str) -> Dict[str, Any]:
         """Parse the AI response for evaluation."""
-        lines = response.strip().split('\n')
         score = 0.0
         critique = ""
         suggestions = []
         in_suggestions = False
 
-        for line in lines:
+        for line in response.strip().split('\n'):
             line = line.strip()
             if not line:
                 continue
 
-            if line.startswith("Score:"):
+            label, sep, value = line.partition(":")
+            if sep and label in _EVALUATION_LABELS:
+                value = value.strip()
+            else:
+                label = None
+
+            if label == "Score":
                 try:
-                    score_str = line.replace("Score:", "").strip().split("/")[0] # Handle "8/10"
-                    score = float(score_str)
+                    score = float(value.split("/")[0])  # Handle "8/10"
                 except (ValueError, IndexError):
                     logger.warning(f"Could not parse score from: {line}")
                     score = 0.0
-            elif line.startswith("Critique:"):
-                critique = line.replace("Critique:", "").strip()
+            elif label == "Critique":
+                critique = value
                 in_suggestions = False
-            elif line.startswith("Suggestions:"):
+            elif label == "Suggestions":
                 in_suggestions = True
-            elif in_suggestions and (line[0].isdigit() or line.startswith("-")):
+            elif in_suggestions and (line[0].isdigit() or line[0] == "-"):
                 # Remove numbering like "1. " or "- "
-                suggestion = line.lstrip("0123456789.- ").strip()
-                suggestions.append(suggestion)
-            elif not in_suggestions and not line.startswith("Score:"):
+                suggestions.append(line.lstrip("0123456789.- ").strip())
+            elif not in_suggestions and critique:
                 # Append to critique if multiline
-                if critique:
-                    critique += " " + line
+                critique += " " + line
 
         return {"score": score, "critique": critique, "suggestions": suggestions}
@@ -1,39 +1,183 @@
 """Citation management module."""
 
+import asyncio
+import io
 import json
 import logging
+import operator
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-import string
-from habanero import Crossref
-from citeproc import CitationStylesStyle, CitationStylesBibliography
-from citeproc import Citation, CitationItem
-from citeproc import formatter
-from citeproc.source.json import CiteProcJSON
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, TextIO, Tuple
 
 from .models.base import AIModel
+from .models.cache import ResponseCache, default_cache_dir
 from .exceptions import CitationError
+from .utils import STOPWORDS, word_tokens
+
+if TYPE_CHECKING:
+    from habanero import Crossref
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 InlineSuggestion = Dict[str, str]
+# (sources_changed() count, the source dicts) when a derived index was built
+_SourcesSnapshot = Tuple[int, Tuple[Dict[str, Any], ...]]
+
+# Short terms that are still meaningful keywords
+_TECH_TERMS = frozenset({"ai", "ml", "dl", "nlp", "cv", "rl", "go", "c++", "api", "sql"})
+# Crossref results are reused for a day; the oldest entries are evicted past the size cap
+_LOOKUP_CACHE_TTL = 24 * 60 * 60
+_LOOKUP_CACHE_SIZE = 2048
+
+# Bundled CSL styles, and style name -> resolved CSL path for styles already found
+_STYLES_DIR = Path(__file__).parent.parent / "styles"
+_STYLE_PATHS: Dict[str, Path] = {}
+
+
+@lru_cache(maxsize=1)
+def _available_styles() -> Tuple[str, ...]:
+    """Names of the bundled CSL styles."""
+    return tuple(sorted(f.stem for f in _STYLES_DIR.glob("*.csl")))
+
+
+def _crossref_client() -> "Crossref":
+    """Create a default Crossref client (habanero is imported on first use)."""
+    from habanero import Crossref
+
+    return Crossref()
+
+
+@lru_cache(maxsize=8)
+def _load_style(style_path: str) -> Any:
+    """Parse a CSL style file, reusing the result for repeat calls."""
+    # citeproc (and lxml behind it) is only needed for bibliographies
+    from citeproc import CitationStylesStyle
+
+    return CitationStylesStyle(style_path, validate=False)
+
 
 class CitationManager:
     """Manages citations, source lookups, and bibliography generation."""
 
-    def __init__(self, model: Optional[AIModel] = None, crossref_client: Optional[Crossref] = None):
+    def __init__(
+        self,
+        model: Optional[AIModel] = None,
+        crossref_client: Optional["Crossref"] = None,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False
+    ):
         """
         Initialize citation manager.
 
         Args:
             model: AIModel instance for claim detection
             crossref_client: Optional Crossref client for dependency injection
+            cache: Response cache for model calls (defaults to the on-disk cache)
+            bypass_cache: Always query the model, refreshing cached responses
         """
         self.model = model
-        self.cr = crossref_client or Crossref()
+        self.cache = cache if cache is not None else ResponseCache(default_cache_dir())
+        self.bypass_cache = bypass_cache
+        self._cr = crossref_client
         self.sources: List[Dict[str, Any]] = []
+        # Bumped by sources_changed(); indexes derived from the sources
+        # remember the _sources_snapshot() they were built from
+        self._sources_version = 0
         self._ieee_source_map: Dict[str, int] = {}  # Map source ID to IEEE number
+        # Source ID -> source, as of _sources_by_id_snapshot
+        self._sources_by_id: Dict[str, Dict[str, Any]] = {}
+        self._sources_by_id_snapshot: Optional[_SourcesSnapshot] = None
+        # Crossref lookups: (query, limit) -> (fetched_at, items), plus in-flight async lookups
+        self._lookup_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lookup_inflight: Dict[Tuple[str, int], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+        # Formatted bibliography entries per style, with the sources snapshot they cover
+        self._bib_cache: Dict[str, Tuple[_SourcesSnapshot, List[str]]] = {}
+        # Inverted keyword index over self.sources, as of _keyword_index_snapshot
+        self._keyword_index_snapshot: Optional[_SourcesSnapshot] = None
+        self._keyword_index: Dict[str, List[int]] = {}
+
+    def sources_changed(self) -> None:
+        """Invalidate indexes derived from the sources.
+
+        Adding, removing, replacing or reordering sources is detected on its
+        own; call this after editing a source dict in place.
+        """
+        self._sources_version += 1
+
+    def _sources_snapshot(self) -> _SourcesSnapshot:
+        """Record the current sources: the change counter plus the source objects."""
+        return self._sources_version, tuple(self.sources)
+
+    def _is_current(self, snapshot: Optional[_SourcesSnapshot]) -> bool:
+        """Whether the sources are unchanged since the snapshot was taken.
+
+        Sources are compared by identity; the snapshot holds them, so an
+        identity cannot be reused by a new source while it is kept.
+        """
+        if snapshot is None:
+            return False
+        version, sources = snapshot
+        return (
+            version == self._sources_version
+            and len(sources) == len(self.sources)
+            and all(map(operator.is_, sources, self.sources))
+        )
+
+    @property
+    def cr(self) -> "Crossref":
+        """Crossref client, created on first use unless one was injected."""
+        if self._cr is None:
+            self._cr = _crossref_client()
+        return self._cr
+
+    @cr.setter
+    def cr(self, client: "Crossref") -> None:
+        self._cr = client
+
+    def _call_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Call the model through the response cache."""
+        return self.cache.call(self.model, prompt, bypass_cache=self.bypass_cache)
+
+    async def _acall_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Async version of _call_model."""
+        return await self.cache.acall(self.model, prompt, bypass_cache=self.bypass_cache)
+
+    @staticmethod
+    def _claims_prompt(text: str) -> str:
+        """Build the claim detection prompt."""
+        return (
+            "Identify sentences in the following text that contain specific claims, "
+            "facts, or data that require a citation. Return ONLY the sentences, "
+            "one per line. Do not include general knowledge or topic sentences.\n\n"
+            f"Text:\n{text}"
+        )
+
+    @staticmethod
+    def _plagiarism_prompt(text: str) -> str:
+        """Build the plagiarism check prompt."""
+        return (
+            "Analyze the following text for potential plagiarism. "
+            "Identify direct quotes or specific data points that do NOT have "
+            "an accompanying citation (e.g., (Smith, 2023) or [1]). "
+            "Return ONLY the specific sentences or phrases that are missing citations, "
+            "one per line. If none, return nothing.\n\n"
+            f"Text:\n{text}"
+        )
+
+    @staticmethod
+    def _lines_from_response(kind: str, reply: Tuple[bool, str, str]) -> List[str]:
+        """Split a line-per-item model reply."""
+        success, response, error = reply
+        if not success:
+            action = "find claims" if kind == "claims" else "check plagiarism"
+            logger.error(f"Failed to {action}: {error}")
+            return []
+
+        return [line.strip() for line in response.split('\n') if line.strip()]
 
     def find_claims(self, text: str) -> List[str]:
         """
@@ -49,25 +193,23 @@ class CitationManager:
             logger.warning("No AI model available for claim detection.")
             return []
 
-        prompt = (
-            "Identify sentences in the following text that contain specific claims, "
-            "facts, or data that require a citation. Return ONLY the sentences, "
-            "one per line. Do not include general knowledge or topic sentences.\n\n"
-            f"Text:\n{text}"
-        )
+        return self._lines_from_response("claims", self._call_model(self._claims_prompt(text)))
 
-        success, response, error = self.model.call(prompt)
-        if not success:
-            logger.error(f"Failed to find claims: {error}")
+    async def afind_claims(self, text: str) -> List[str]:
+        """Async version of find_claims."""
+        if not self.model:
+            logger.warning("No AI model available for claim detection.")
             return []
 
-        claims = [line.strip() for line in response.split('\n') if line.strip()]
-        return claims
+        reply = await self._acall_model(self._claims_prompt(text))
+        return self._lines_from_response("claims", reply)
 
     def lookup_source(self, query: str, limit: int = 1) -> List[Dict[str, Any]]:
         """
         Find sources using CrossRef.
 
+        Successful results are cached per (query, limit) for a day.
+
         Args:
             query: Search query (title, author, etc.)
             limit: Max number of results
@@ -75,21 +217,85 @@ class CitationManager:
         Returns:
             List of source metadata in CSL JSON format
         """
+        key = (query, limit)
+        cached = self._lookup_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _LOOKUP_CACHE_TTL:
+            # Copies, since add_source assigns ids on the dicts it is given
+            return [dict(item) for item in cached[1]]
+
         try:
             results = self.cr.works(query=query, limit=limit)
             items = results['message']['items']
-            return items
         except Exception as e:
             logger.error(f"Error looking up source '{query}': {e}")
             return []
 
+        self._lookup_cache.pop(key, None)
+        if len(self._lookup_cache) >= _LOOKUP_CACHE_SIZE:
+            del self._lookup_cache[next(iter(self._lookup_cache))]
+        self._lookup_cache[key] = (time.monotonic(), items)
+        return [dict(item) for item in items]
+
+    async def lookup_source_async(self, query: str, limit: int = 1) -> List[Dict[str, Any]]:
+        """
+        Async version of lookup_source.
+
+        The blocking Crossref call runs in a worker thread. Concurrent lookups
+        of the same (query, limit) share a single request.
+
+        Args:
+            query: Search query (title, author, etc.)
+            limit: Max number of results
+
+        Returns:
+            List of source metadata in CSL JSON format
+        """
+        key = (query, limit)
+        pending = self._lookup_inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(asyncio.to_thread(self.lookup_source, query, limit))
+            self._lookup_inflight[key] = pending
+            pending.add_done_callback(lambda _: self._lookup_inflight.pop(key, None))
+
+        items = await asyncio.shield(pending)
+        return [dict(item) for item in items]
+
+    async def lookup_sources_batch(self, queries: List[str], limit: int = 1) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Look up several queries concurrently.
+
+        Args:
+            queries: Search queries (duplicates are looked up once)
+            limit: Max number of results per query
+
+        Returns:
+            Mapping of each distinct query to its source metadata
+        """
+        distinct = list(dict.fromkeys(queries))
+        results = await asyncio.gather(*(self.lookup_source_async(q, limit) for q in distinct))
+        return dict(zip(distinct, results))
+
     def add_source(self, source_data: Dict[str, Any]):
         """Add a source to the manager."""
         # Ensure it has an ID
         if 'id' not in source_data:
             # Use a simple counter for now, but could be improved
             source_data['id'] = f"source-{len(self.sources) + 1}"
+        indexed = self._is_current(self._sources_by_id_snapshot)
         self.sources.append(source_data)
+        if indexed:
+            # Extend an up-to-date index instead of rebuilding it
+            self._sources_by_id.setdefault(source_data['id'], source_data)
+            self._sources_by_id_snapshot = self._sources_snapshot()
+
+    def _source_for_id(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """Return the first source with the given ID, or None."""
+        if not self._is_current(self._sources_by_id_snapshot):
+            self._sources_by_id = {}
+            for source in self.sources:
+                self._sources_by_id.setdefault(source['id'], source)
+            self._sources_by_id_snapshot = self._sources_snapshot()
+        return self._sources_by_id.get(source_id)
 
     def generate_bibliography(self, style: str = "apa") -> str:
         """
@@ -105,47 +311,83 @@ class CitationManager:
             FileNotFoundError: If style file is missing
             ValueError: If style is invalid
         """
+        buf = io.StringIO()
+        self.write_bibliography(buf, style)
+        return buf.getvalue()
+
+    def write_bibliography(self, fp: TextIO, style: str = "apa") -> int:
+        """
+        Write the bibliography for added sources to a text stream, one entry at a time.
+
+        Args:
+            fp: Writable text stream (file, StringIO, ...)
+            style: Citation style (apa, mla, chicago-author-date, ieee)
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            CitationError: If the style is unsupported or cannot be loaded
+        """
+        count = 0
+        for entry in self._bibliography_entries(style):
+            if count:
+                fp.write("\n")
+            fp.write(entry)
+            count += 1
+        return count
+
+    def _bibliography_entries(self, style: str) -> List[str]:
+        """Return formatted entries, reusing the last result while the sources are unchanged."""
+        cached = self._bib_cache.get(style)
+        if cached and self._is_current(cached[0]):
+            return cached[1]
+
+        entries = [str(item) for item in self._build_bibliography(style)]
+        self._bib_cache[style] = (self._sources_snapshot(), entries)
+        return entries
+
+    def _build_bibliography(self, style: str) -> List[Any]:
+        """Build the citeproc bibliography and return its entries in order."""
         supported_styles = ["apa", "mla", "chicago-author-date", "ieee"]
         if style not in supported_styles:
             raise CitationError(f"Unsupported style: {style}. Choose from {supported_styles}")
 
         if not self.sources:
-            return ""
+            return []
+
+        from citeproc import Citation, CitationItem, CitationStylesBibliography, formatter
+        from citeproc.source.json import CiteProcJSON
 
         # Create a bibliography source
         bib_source = CiteProcJSON(self.sources)
         
-        # Check for local CSL file
-        # Fix: Use absolute path relative to this file
-        styles_dir = Path(__file__).parent.parent / "styles"
-        style_path = styles_dir / f"{style}.csl"
-        
-        if not style_path.exists():
-            # Try to find it in the current directory as fallback
-            if Path(f"styles/{style}.csl").exists():
-                 style_path = Path(f"styles/{style}.csl")
-            else:
-                # List available styles
-                available = [f.stem for f in styles_dir.glob("*.csl")]
-                raise CitationError(
-                    f"Style file {style}.csl not found in {styles_dir}. "
-                    f"Available styles: {', '.join(available)}"
-                )
+        style_path = _STYLE_PATHS.get(style)
+        if style_path is None:
+            style_path = _STYLES_DIR / f"{style}.csl"
+            if not style_path.exists():
+                # Try to find it in the current directory as fallback
+                if Path(f"styles/{style}.csl").exists():
+                    style_path = Path(f"styles/{style}.csl").resolve()
+                else:
+                    raise CitationError(
+                        f"Style file {style}.csl not found in {_STYLES_DIR}. "
+                        f"Available styles: {', '.join(_available_styles())}"
+                    )
+            # Only found styles are remembered, so a file added later is still picked up
+            _STYLE_PATHS[style] = style_path
 
         try:
-            bib_style = CitationStylesStyle(str(style_path), validate=False)
+            bib_style = _load_style(str(style_path))
         except Exception as e:
             raise CitationError(f"Error loading style {style}: {e}")
 
         bibliography = CitationStylesBibliography(bib_style, bib_source, formatter.plain)
 
-        # Register all items
-        for source in self.sources:
-            citation = Citation([CitationItem(source['id'])])
-            bibliography.register(citation)
+        # Register all items in one citation; citeproc keeps their order
+        bibliography.register(Citation([CitationItem(source['id']) for source in self.sources]))
 
-        # Generate
-        return "\n".join(str(item) for item in bibliography.bibliography())
+        return bibliography.bibliography()
 
     def format_citation(self, source_id: str, style: str = "apa") -> str:
         """
@@ -162,7 +404,7 @@ class CitationManager:
         # We might need a simplified approach for inline citations or use the bibliography engine.
         # For now, a simple placeholder or basic author-year if possible.
         
-        source = next((s for s in self.sources if s['id'] == source_id), None)
+        source = self._source_for_id(source_id)
         if not source:
             return "(Source not found)"
 
@@ -213,22 +455,16 @@ class CitationManager:
             logger.warning("No AI model available for plagiarism check.")
             return []
 
-        prompt = (
-            "Analyze the following text for potential plagiarism. "
-            "Identify direct quotes or specific data points that do NOT have "
-            "an accompanying citation (e.g., (Smith, 2023) or [1]). "
-            "Return ONLY the specific sentences or phrases that are missing citations, "
-            "one per line. If none, return nothing.\n\n"
-            f"Text:\n{text}"
-        )
+        return self._lines_from_response("plagiarism", self._call_model(self._plagiarism_prompt(text)))
 
-        success, response, error = self.model.call(prompt)
-        if not success:
-            logger.error(f"Failed to check plagiarism: {error}")
+    async def acheck_plagiarism(self, text: str) -> List[str]:
+        """Async version of check_plagiarism."""
+        if not self.model:
+            logger.warning("No AI model available for plagiarism check.")
             return []
 
-        issues = [line.strip() for line in response.split('\n') if line.strip()]
-        return issues
+        reply = await self._acall_model(self._plagiarism_prompt(text))
+        return self._lines_from_response("plagiarism", reply)
 
     def suggest_inline_citations(
         self,
@@ -251,58 +487,80 @@ class CitationManager:
         if not self.sources:
             return []
 
+        # Score every claim against one index snapshot, and format each
+        # matched source (and score each repeated claim) only once
+        index = self._source_keyword_index()
+        citations: Dict[str, Optional[str]] = {}
         suggestions: List[InlineSuggestion] = []
         for claim in claims:
-            source = self._best_source_for_claim(claim, lenient=lenient)
-            if not source:
-                continue
-            citation = self.format_citation(source["id"], style=style)
-            suggestions.append({"claim": claim, "citation": citation})
+            if claim not in citations:
+                source = self._best_source_for_claim(claim, lenient=lenient, index=index)
+                citations[claim] = self.format_citation(source["id"], style=style) if source else None
+            citation = citations[claim]
+            if citation is not None:
+                suggestions.append({"claim": claim, "citation": citation})
         return suggestions
 
-    def _best_source_for_claim(self, claim: str, lenient: bool = False) -> Optional[Dict[str, Any]]:
+    def _best_source_for_claim(
+        self,
+        claim: str,
+        lenient: bool = False,
+        index: Optional[Dict[str, List[int]]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Pick the source with the most keyword overlap with the claim.
 
         If lenient is False, returns None when no keywords match any source.
         If lenient is True, falls back to the first source.
+        Batch callers may pass a keyword index they already fetched.
         """
         if not self.sources:
             return None
 
-        stopwords = {
-            "the", "and", "for", "are", "was", "but", "not", "you", "all", "can",
-            "her", "has", "had", "with", "from", "that", "this", "they", "them",
-            "their", "its", "into", "onto", "about", "over", "under", "an", "is",
-            "be", "been", "being", "have", "do", "does", "did", "he", "she", "it",
-            "we", "us", "him", "his", "in", "on", "at", "by", "to", "of", "or",
-            "if", "when", "where", "while", "may", "will", "would", "could", "should"
-        }
-        technical_terms = {"ai", "ml", "dl", "nlp", "cv", "rl", "go", "c++", "api", "sql"}
         keywords = {
-            w.lower().strip(string.punctuation)
-            for w in claim.split()
-            if w and (
-                w.lower().strip(string.punctuation) in technical_terms
-                or (w.lower() not in stopwords and len(w.strip(string.punctuation)) >= 2)
-            )
+            token for token in word_tokens(claim)
+            if token in _TECH_TERMS or (token not in STOPWORDS and len(token) >= 2)
         }
-        best = None
-        best_score = -1
-
-        for source in self.sources:
-            haystack = " ".join([
-                source.get("title", ""),
-                source.get("abstract", ""),
-                source.get("url", "")
-            ]).lower()
-            score = sum(1 for kw in keywords if kw and kw in haystack)
-            if score > best_score:
-                best_score = score
-                best = source
+
+        # No keywords to score, or one source that lenient mode returns anyway
+        if not keywords or (lenient and len(self.sources) == 1):
+            return self.sources[0] if lenient else None
+
+        if index is None:
+            index = self._source_keyword_index()
+        # A single source only needs one shared keyword
+        if len(self.sources) == 1:
+            return self.sources[0] if any(kw in index for kw in keywords) else None
+
+        # Score only the sources that share a token with the claim; Counter
+        # tallies the concatenated posting lists in C
+        scores = Counter(chain.from_iterable(index.get(kw, ()) for kw in keywords))
 
         MIN_MATCH_SCORE = 1
-        if best_score >= MIN_MATCH_SCORE:
-            return best
+        if scores:
+            # Highest score wins; ties go to the earliest source
+            best_score = max(scores.values())
+            if best_score >= MIN_MATCH_SCORE:
+                return self.sources[min(i for i, score in scores.items() if score == best_score)]
         if lenient:
             return self.sources[0] if self.sources else None
         return None
+
+    def _source_keyword_index(self) -> Dict[str, List[int]]:
+        """Map each title/abstract/URL token to the indexes of sources containing it.
+
+        The index is rebuilt whenever the sources change.
+        """
+        if not self._is_current(self._keyword_index_snapshot):
+            index: Dict[str, List[int]] = {}
+            for i, source in enumerate(self.sources):
+                haystack = " ".join([
+                    source.get("title", ""),
+                    source.get("abstract", ""),
+                    source.get("url", "")
+                ]).lower()
+                tokens = set(word_tokens(haystack))
+                for token in tokens:
+                    index.setdefault(token, []).append(i)
+            self._keyword_index = index
+            self._keyword_index_snapshot = self._sources_snapshot()
+        return self._keyword_index
@@ -1,9 +1,14 @@
 """Configuration settings for the AI Essay project."""
 
+import logging
 import os
 from pathlib import Path
-from typing import Dict, Any
-import yaml
+from typing import Callable, Dict, Any
+
+from .utils import load_cached_yaml
+
+logger = logging.getLogger(__name__)
+
 
 class Config:
     """Central configuration management."""
@@ -14,6 +19,7 @@ class Config:
     DEFAULT_SEARCH_LIMIT = 5
     API_TIMEOUT = 30
     MAX_RETRIES = 3
+    MAX_CONCURRENCY = 8
     
     # Paths
     PROJECT_ROOT = Path(__file__).parent.parent
@@ -22,18 +28,56 @@ class Config:
     def __init__(self):
         """Initialize configuration."""
         self._config = self._load_config()
+        defaults = self._config.get("defaults", {})
+        # Rate-limit settings are parsed once here, so a bad value is reported
+        # at startup instead of failing every API call
+        self._max_concurrency = self._parse_setting(
+            "OPENROUTER_MAX_CONCURRENCY", "max_concurrency",
+            defaults.get("max_concurrency"), self.MAX_CONCURRENCY, int, minimum=1
+        )
+        self._requests_per_minute = self._parse_setting(
+            "OPENROUTER_RPM", "requests_per_minute",
+            defaults.get("requests_per_minute"), 0.0, float, minimum=0
+        )
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from yaml file."""
+        """Load configuration from yaml file (cached until the file changes)."""
         if not self.CONFIG_FILE.exists():
             return {}
         
         try:
-            with open(self.CONFIG_FILE, "r") as f:
-                return yaml.safe_load(f) or {}
+            return load_cached_yaml(self.CONFIG_FILE) or {}
         except Exception:
             return {}
 
+    @staticmethod
+    def _parse_setting(
+        env_var: str,
+        key: str,
+        configured: Any,
+        default: Any,
+        parse: Callable[[Any], Any],
+        minimum: float
+    ) -> Any:
+        """Parse a numeric setting from the environment, then config.yaml.
+
+        Invalid or out-of-range values are logged and replaced by the default.
+        """
+        raw = os.getenv(env_var)
+        source = env_var
+        if raw is None:
+            raw, source = configured, f"defaults.{key}"
+        if raw is None:
+            return default
+        try:
+            value = parse(raw)
+        except (TypeError, ValueError):
+            value = None
+        if value is None or not value >= minimum:
+            logger.warning("Ignoring invalid %s=%r; using %r", source, raw, default)
+            return default
+        return value
+
     @property
     def default_model(self) -> str:
         """Get default model name."""
@@ -54,5 +98,15 @@ class Config:
         """Get retry limit."""
         return self._config.get("defaults", {}).get("retry_limit", self.MAX_RETRIES)
 
+    @property
+    def max_concurrency(self) -> int:
+        """Get the cap on concurrent OpenRouter requests."""
+        return self._max_concurrency
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Get the OpenRouter request budget per minute (0 for unlimited)."""
+        return self._requests_per_minute
+
 # Global config instance
 config = Config()
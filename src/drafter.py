@@ -1,39 +1,93 @@
 """Essay Drafter module."""
 
 import asyncio
+import contextlib
 import logging
+import os
+import random
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from rich.console import Console
 
 from .models.base import AIModel
+from .models.cache import ResponseCache, default_cache_dir
+from .exceptions import ModelError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Fixed drafting prompt; only the topic slot varies between drafts
+DRAFT_PROMPT_TEMPLATE = (
+    "Write a comprehensive essay about the following topic:\n\n"
+    "Topic: {topic}\n\n"
+    "The essay should have a clear introduction, body paragraphs, and conclusion. "
+    "Focus on depth, clarity, and logical flow."
+)
+
+# Failed calls with these errors (rate limits, server errors, timeouts and
+# dropped connections) are worth retrying; anything else fails immediately
+_TRANSIENT_ERROR_RE = re.compile(r"Error code: (?:408|409|429|5\d\d)\b|Connection error|timed out", re.IGNORECASE)
+
+# Exponential backoff between draft retries, in seconds
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 10.0
+
+# Streamed drafts are flushed to disk whenever this many characters are buffered
+_STREAM_FLUSH_SIZE = 1 << 16
+
 class EssayDrafter:
     """Handles multi-model essay drafting."""
 
-    def __init__(self, models: List[AIModel]):
+    def __init__(
+        self,
+        models: List[AIModel],
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+        max_concurrency: int = 8,
+        stream: bool = False,
+        max_retries: int = 2
+    ):
         """
         Initialize the drafter.
 
+        Only models sampling at temperature 0 are cached, since any other
+        temperature is expected to produce a different draft each time.
+
         Args:
             models: List of AIModel instances to use for drafting
+            cache: Response cache for drafts (defaults to the on-disk cache)
+            bypass_cache: Always query the models, refreshing cached drafts
+            max_concurrency: Maximum number of model calls in flight at once
+            stream: Write uncached drafts to disk as they are generated
+                instead of holding each full response in memory
+            max_retries: Extra attempts for a draft that failed with a
+                transient error (rate limit, server error, timeout)
         """
         self.models = models
+        self.cache = cache if cache is not None else ResponseCache(default_cache_dir())
+        self.bypass_cache = bypass_cache
+        self.max_concurrency = max(1, max_concurrency)
+        self.stream = stream
+        self.max_retries = max(0, max_retries)
 
-    async def draft_essay(self, topic: str, output_dir: Path) -> List[Dict[str, Any]]:
+    async def draft_essay(
+        self,
+        topic: str,
+        output_dir: Path,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Generate essay drafts using all configured models in parallel.
 
         Args:
             topic: The essay topic
             output_dir: Directory to save drafts
+            on_result: Called with each result as soon as its draft finishes
 
         Returns:
-            List of results with model name, status, and file path
+            List of results with model name, status, and file path, in model order
         """
         if not self.models:
             logger.warning("No models configured for drafting.")
@@ -42,37 +96,57 @@ class EssayDrafter:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        prompt = (
-            f"Write a comprehensive essay about the following topic:\n\n"
-            f"Topic: {topic}\n\n"
-            "The essay should have a clear introduction, body paragraphs, and conclusion. "
-            "Focus on depth, clarity, and logical flow."
-        )
-
-        # Create tasks for all models
-        tasks = [self._generate_single(model, prompt, output_dir) for model in self.models]
-        
-        # Run in parallel
-        results = await asyncio.gather(*tasks)
-        return results
-
-    async def _generate_single(self, model: AIModel, prompt: str, output_dir: Path) -> Dict[str, Any]:
+        # Collapse whitespace so trivially different spellings of a topic
+        # produce the same prompt (and share cached drafts)
+        prompt = DRAFT_PROMPT_TEMPLATE.format(topic=" ".join(topic.split()))
+
+        # Sanitize model names for filenames up front (replace slashes and special chars)
+        filenames = [f"{model.model_id.replace('/', '_').replace(':', '_')}.txt" for model in self.models]
+
+        # Create tasks for all models, capping how many call out at once
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.ensure_future(self._generate_single(model, prompt, output_dir / filename, semaphore))
+            for model, filename in zip(self.models, filenames)
+        ]
+
+        # Run in parallel, reporting each draft the moment it is written
+        if on_result is not None:
+            for finished in asyncio.as_completed(tasks):
+                on_result(await finished)
+
+        return list(await asyncio.gather(*tasks))
+
+    async def _generate_single(
+        self,
+        model: AIModel,
+        prompt: str,
+        filepath: Path,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
         """
         Generate a single essay draft.
 
         Args:
             model: The AI model to use
             prompt: The prompt
-            output_dir: Output directory
+            filepath: Where to save the draft
+            semaphore: Limits concurrent model calls across drafts
 
         Returns:
             Dictionary with result details (model, success, error, file, word_count)
         """
-        # Sanitize model name for filename (replace slashes and special chars)
-        model_name = model.model_id.replace('/', '_').replace(':', '_')
         logger.info(f"Starting draft with {model.model_id}...")
 
-        success, response, error = await model.acall(prompt)
+        if self.stream and not self.cache.cacheable(model):
+            async def stream_attempt() -> Tuple[bool, Dict[str, Any], str]:
+                result = await self._stream_single(model, prompt, filepath)
+                return result["success"], result, result["error"]
+
+            _, result, _ = await self._retry(model, stream_attempt, semaphore)
+            return result
+
+        success, response, error = await self._call_with_retry(model, prompt, semaphore)
 
         result = {
             "model": model.model_id,
@@ -83,10 +157,9 @@ class EssayDrafter:
         }
 
         if success:
-            filename = f"{model_name}.txt"
-            filepath = output_dir / filename
             try:
-                filepath.write_text(response)
+                # Write off the event loop so other drafts keep streaming in
+                await asyncio.to_thread(filepath.write_text, response)
                 result["file"] = str(filepath)
                 result["word_count"] = len(response.split())
                 logger.info(f"Draft saved to {filepath} ({result['word_count']} words)")
@@ -97,3 +170,131 @@ class EssayDrafter:
             logger.error(f"Draft failed for {model.model_id}: {error}")
 
         return result
+
+    async def _call_with_retry(
+        self,
+        model: AIModel,
+        prompt: str,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[bool, str, str]:
+        """
+        Call the model, retrying transient failures with jittered backoff.
+
+        Args:
+            model: The AI model to use
+            prompt: The prompt
+            semaphore: Limits concurrent model calls across drafts
+
+        Returns:
+            Tuple of (success, response_text, error_message) from the last attempt
+        """
+        async def call_attempt() -> Tuple[bool, str, str]:
+            try:
+                return await self.cache.acall(model, prompt, bypass_cache=self.bypass_cache)
+            except Exception as e:
+                # A model that raises fails its own draft, not its siblings'
+                return False, "", str(e)
+
+        return await self._retry(model, call_attempt, semaphore)
+
+    async def _retry(
+        self,
+        model: AIModel,
+        attempt_once: Callable[[], Awaitable[Tuple[bool, Any, str]]],
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[bool, Any, str]:
+        """
+        Run a draft attempt, retrying transient failures with jittered backoff.
+
+        The concurrency slot is released while backing off so other drafts
+        can use it.
+
+        Args:
+            model: The AI model the attempt uses (for logging)
+            attempt_once: Makes one attempt and returns (success, payload, error)
+            semaphore: Limits concurrent model calls across drafts
+
+        Returns:
+            The (success, payload, error) tuple from the last attempt
+        """
+        attempt = 0
+        while True:
+            async with semaphore or contextlib.nullcontext():
+                success, payload, error = await attempt_once()
+
+            if success or attempt >= self.max_retries or not _TRANSIENT_ERROR_RE.search(error or ""):
+                return success, payload, error
+
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(f"Draft attempt {attempt} for {model.model_id} failed ({error}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _stream_single(self, model: AIModel, prompt: str, filepath: Path) -> Dict[str, Any]:
+        """
+        Stream a draft to disk, counting words as chunks arrive.
+
+        The draft is written to a ``.part`` file that replaces ``filepath``
+        only once the response completes, so failures leave no partial draft.
+
+        Args:
+            model: The AI model to use
+            prompt: The prompt
+            filepath: Where to save the draft
+
+        Returns:
+            Dictionary with result details (model, success, error, file, word_count)
+        """
+        result = {
+            "model": model.model_id,
+            "success": False,
+            "error": "",
+            "file": None,
+            "word_count": 0
+        }
+        part_path = filepath.with_name(f"{filepath.name}.part")
+        word_count = 0
+        in_word = False
+        pending: List[str] = []
+        pending_size = 0
+
+        try:
+            fp = await asyncio.to_thread(open, part_path, "w")
+        except OSError as e:
+            result["error"] = f"Failed to save file to {filepath}: {e}"
+            return result
+
+        try:
+            async for chunk in model.astream(prompt):
+                if not chunk:
+                    continue
+                # A word split across chunks is counted once
+                word_count += len(chunk.split()) - (in_word and not chunk[0].isspace())
+                in_word = not chunk[-1].isspace()
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= _STREAM_FLUSH_SIZE:
+                    await asyncio.to_thread(fp.write, "".join(pending))
+                    pending.clear()
+                    pending_size = 0
+            await asyncio.to_thread(fp.write, "".join(pending))
+            await asyncio.to_thread(fp.close)
+            await asyncio.to_thread(os.replace, part_path, filepath)
+        except ModelError as e:
+            result["error"] = str(e)
+            logger.error(f"Draft failed for {model.model_id}: {e}")
+        except OSError as e:
+            result["error"] = f"Failed to save file to {filepath}: {e}"
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"Draft failed for {model.model_id}: {e}")
+        else:
+            result.update(success=True, file=str(filepath), word_count=word_count)
+            logger.info(f"Draft saved to {filepath} ({word_count} words)")
+        finally:
+            # Also covers cancellation: never leave an open file or partial draft
+            if not result["success"]:
+                fp.close()
+                part_path.unlink(missing_ok=True)
+
+        return result
@@ -3,13 +3,19 @@ Essay Maker Platform CLI.
 """
 
 import fire
+from dataclasses import dataclass, field
+from datetime import datetime
+import glob
 from pathlib import Path
 import json
 import os
+import re
+import traceback
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from threading import Thread
+from functools import lru_cache, partial
+from typing import Callable, List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,23 +23,201 @@ load_dotenv()
 from .citations import CitationManager
 from .research import ResearchAssistant
 from .drafter import EssayDrafter
-from .analyzer import EssayAnalyzer
+from .analyzer import EssayAnalyzer, EssayStructure
 from .improver import EssayImprover
 from .outline import OutlineGenerator, OutlineTemplate, ExportFormat
 from .optimizer import GrammarOptimizer
 from .argument import ArgumentAnalyzer
 from .models.openrouter import OpenRouterModel
+from .models.cache import ResponseCache, default_cache_dir
 from .templates import TemplateManager
 from .wizard import EssayWizard
 from .export import Exporter
 from .config import config
+from .utils import load_cached_json, read_cached_text, run_coroutine
 import asyncio
 
 console = Console()
 
+
+@lru_cache(maxsize=16)
+def _cached_model(model_name: str, api_key: str, temperature: Optional[float]) -> OpenRouterModel:
+    """Build a model once per name, API key and temperature."""
+    if temperature is None:
+        return OpenRouterModel(model_name=model_name)
+    return OpenRouterModel(model_name=model_name, temperature=temperature)
+
+
+def _get_model(model_name: str, temperature: Optional[float] = None) -> OpenRouterModel:
+    """Return a shared model instance for this process.
+
+    A temperature of None keeps the model's default. Failed constructions
+    are not cached.
+    """
+    return _cached_model(model_name, os.getenv('OPENROUTER_API_KEY'), temperature)
+
+
+# Characters of each version shown in improve's before/after previews
+_SNIPPET_LENGTH = 180
+
+
+def _snippet(text: str, length: int = _SNIPPET_LENGTH) -> str:
+    """Return the start of text, with an ellipsis when it was cut short."""
+    return text[:length].strip() + ("..." if len(text) > length else "")
+
+
+def _read_essay(path: Path) -> Optional[str]:
+    """Read an input essay (or notes) file, reporting a missing file instead of raising.
+
+    Opening the file directly saves a separate exists() stat (and the race
+    between that check and the read).
+    """
+    try:
+        return read_cached_text(path)
+    except FileNotFoundError:
+        console.print(f"[red]Error: File {path} not found.[/red]")
+        return None
+
+
+def _essay_files(pattern: str) -> Optional[List[Path]]:
+    """Expand a directory or glob pattern into essay files; None for a single file."""
+    if glob.has_magic(pattern):
+        return sorted(Path(p) for p in glob.glob(pattern) if Path(p).is_file())
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob("*.txt"))
+    return None
+
+
+def _sources_path(input_path: Path) -> Path:
+    """Where research saves (and cite loads) the sources found for an essay."""
+    return input_path.parent / f"{input_path.stem}_sources.json"
+
+
+def _paper_to_csl(paper: dict, idx: int) -> dict:
+    """Convert Semantic Scholar paper dict to a CSL-like structure."""
+    authors = paper.get("authors") or []
+    formatted_authors = []
+    for name in authors:
+        if isinstance(name, dict) and name.get("family"):
+            formatted_authors.append(name)
+            continue
+        parts = name.strip().split() if isinstance(name, str) else []
+        if len(parts) >= 2:
+            formatted_authors.append({"family": parts[-1], "given": " ".join(parts[:-1])})
+        elif parts:
+            formatted_authors.append({"literal": parts[0]})
+    year = paper.get("year") or 0
+    # Either may be missing or null in search results
+    venue = paper.get("publicationVenue") or {}
+    external_ids = paper.get("externalIds")
+    csl = {
+        "id": paper.get("paperId") or paper.get("id") or f"source-{idx}",
+        "type": venue.get("type", "article-journal"),
+        "title": paper.get("title", "Untitled"),
+        "author": formatted_authors,
+        "issued": {"date-parts": [[year]]} if year else {},
+        "container-title": venue.get("name", "Semantic Scholar"),
+        "URL": paper.get("url", ""),
+        "abstract": paper.get("abstract", ""),
+    }
+    doi = external_ids.get("DOI") if isinstance(external_ids, dict) else None
+    if doi:
+        csl["DOI"] = doi
+    return csl
+
+
+# Placeholder left after claims that still need a source
+_CITATION_MARKER = "[citation needed]"
+
+
+def _replace_first_occurrences(text: str, replacements: dict) -> tuple:
+    """Replace the first occurrence of each key in a single regex pass.
+
+    Where keys overlap at a position, the longest wins. Returns the new
+    text and the set of keys that were replaced.
+    """
+    keys = sorted((key for key in replacements if key), key=len, reverse=True)
+    if not keys:
+        return text, set()
+    pattern = re.compile("|".join(map(re.escape, keys)))
+    replaced = set()
+
+    def _sub(match: re.Match) -> str:
+        key = match.group(0)
+        if key in replaced:
+            return key
+        replaced.add(key)
+        return replacements[key]
+
+    return pattern.sub(_sub, text), replaced
+
+
+def _insert_citations(text: str, suggestions: list) -> tuple:
+    """Place each suggested citation after its claim (or its marker).
+
+    Returns the annotated text and how many citations were inserted.
+    """
+    citations = {}
+    for s in suggestions:
+        citations.setdefault(s["claim"], s["citation"])
+
+    # Claims already flagged with a marker get their citation there; the
+    # rest are cited at their first plain occurrence
+    text, marked = _replace_first_occurrences(text, {
+        f"{claim} {_CITATION_MARKER}": f"{claim} {citation}" for claim, citation in citations.items()
+    })
+    text, plain = _replace_first_occurrences(text, {
+        claim: f"{claim} {citation}"
+        for claim, citation in citations.items()
+        if f"{claim} {_CITATION_MARKER}" not in marked
+    })
+    return text, len(marked) + len(plain)
+
+
+def _insert_markers(text: str, claims: list) -> tuple:
+    """Flag the first occurrence of each claim as needing a citation.
+
+    Returns the annotated text and how many markers were inserted.
+    """
+    text, marked = _replace_first_occurrences(text, {claim: f"{claim} {_CITATION_MARKER}" for claim in claims})
+    return text, len(marked)
+
+
+def _fill_markers(text: str, citation_for: Callable[[int], str]) -> str:
+    """Replace the i-th remaining marker with citation_for(i) in one pass."""
+    parts = text.split(_CITATION_MARKER)
+    pieces = [parts[0]]
+    for i, part in enumerate(parts[1:]):
+        pieces.append(citation_for(i))
+        pieces.append(part)
+    return "".join(pieces)
+
+
+@dataclass
+class PipelineContext:
+    """State shared by the stages of ``essay pipeline``."""
+
+    text: str
+    claims: List[str] = field(default_factory=list)
+    sources: List[dict] = field(default_factory=list)
+    structure: Optional[EssayStructure] = None
+
+
 class EssayCLI:
     """CLI for the Essay Maker Platform."""
 
+    def __init__(self, temperature: float = None):
+        """
+        Initialize the CLI.
+
+        Args:
+            temperature: Sampling temperature for every model (default: the
+                model's own). At 0, responses are repeatable and are reused
+                from the on-disk response cache on later runs.
+        """
+        self.temperature = temperature
+
     def _init_model(self, model_name: str = None, role_env: str = None, fallback: str = config.DEFAULT_MODEL) -> OpenRouterModel:
         """
         Initialize AI model with env-aware fallback.
@@ -50,37 +234,25 @@ class EssayCLI:
         if target_model:
             try:
                 console.print(f"[dim]Using {target_model}...[/dim]")
-                return OpenRouterModel(model_name=target_model)
+                return _get_model(target_model, self.temperature)
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not initialize {target_model} ({e}).[/yellow]")
         
         try:
-            return OpenRouterModel(model_name=fallback)
+            return _get_model(fallback, self.temperature)
         except Exception as e:
             console.print(f"[red]Error initializing fallback model {fallback}: {e}[/red]")
             return None
 
-    def _run_coroutine_in_thread(self, coro):
-        """Run an async coroutine in a fresh thread to avoid nested event loop errors."""
-        result_holder = {}
-        error_holder = {}
-
-        def _runner():
-            try:
-                result_holder["value"] = asyncio.run(coro)
-            except Exception as exc:  # pragma: no cover - defensive
-                error_holder["error"] = exc
-
-        thread = Thread(target=_runner, daemon=True)
-        thread.start()
-        thread.join()
-
-        if "error" in error_holder:
-            raise error_holder["error"]
-
-        return result_holder.get("value", [])
-
-    def research(self, input_file: str, min_sources: int = 3, auto_cite: bool = False, gap_analysis: bool = False, model: str = None):
+    def research(
+        self,
+        input_file: str,
+        min_sources: int = 3,
+        auto_cite: bool = False,
+        gap_analysis: bool = False,
+        model: str = None,
+        no_cache: bool = False,
+    ):
         """
         Research topics for an essay.
 
@@ -90,30 +262,38 @@ class EssayCLI:
             auto_cite: Whether to automatically add citations (not implemented yet)
             gap_analysis: Whether to perform research gap analysis
             model: AI model to use (default: anthropic/claude-3-haiku)
+            no_cache: Query the model even when --temperature=0 has a cached response
         """
         if model is None:
             model = config.DEFAULT_MODEL
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
-        text = input_path.read_text()
-
         # Initialize model and assistant
         ai_model = self._init_model(model, role_env="MODEL_RESEARCH")
         if ai_model:
-            assistant = ResearchAssistant(model=ai_model)
+            assistant = ResearchAssistant(model=ai_model, bypass_cache=no_cache)
         else:
             console.print("[yellow]Warning: Research capabilities limited (no AI model).[/yellow]")
             assistant = ResearchAssistant()
 
         console.print(Panel(f"Researching topics for {input_file}...", title="Research Assistant"))
 
-        # Suggest sources
+        # Suggest sources (searches run concurrently, overlapping any gap analysis)
         console.print("[bold]Searching for relevant sources...[/bold]")
-        suggestions = assistant.suggest_sources(text, limit=min_sources)
+
+        async def _research():
+            if not gap_analysis:
+                return await assistant.asuggest_sources(text, limit=min_sources), None
+            return await asyncio.gather(
+                assistant.asuggest_sources(text, limit=min_sources),
+                assistant.afind_research_gaps(text),
+            )
+
+        suggestions, gaps = run_coroutine(_research())
         
         if not suggestions:
             console.print("[yellow]No sources found.[/yellow]")
@@ -121,48 +301,32 @@ class EssayCLI:
 
         console.print(f"[green]Found {len(suggestions)} relevant sources:[/green]\n")
         
-        def _to_csl(paper: dict, idx: int) -> dict:
-            """Convert Semantic Scholar paper dict to a CSL-like structure."""
-            authors = paper.get("authors") or []
-            formatted_authors = []
-            for name in authors:
-                if isinstance(name, dict) and name.get("family"):
-                    formatted_authors.append(name)
-                    continue
-                parts = name.strip().split() if isinstance(name, str) else []
-                if len(parts) >= 2:
-                    formatted_authors.append({"family": parts[-1], "given": " ".join(parts[:-1])})
-                elif parts:
-                    formatted_authors.append({"literal": parts[0]})
-            year = paper.get("year") or 0
-            csl = {
-                "id": paper.get("paperId") or paper.get("id") or f"source-{idx}",
-                "type": paper.get("publicationVenue", {}).get("type", "article-journal"),
-                "title": paper.get("title", "Untitled"),
-                "author": formatted_authors,
-                "issued": {"date-parts": [[year]]} if year else {},
-                "container-title": paper.get("publicationVenue", {}).get("name", "Semantic Scholar"),
-                "URL": paper.get("url", ""),
-                "abstract": paper.get("abstract", ""),
-            }
-            doi = paper.get("externalIds", {}).get("DOI") if isinstance(paper.get("externalIds"), dict) else None
-            if doi:
-                csl["DOI"] = doi
-            return csl
+        # One table rendered once, rather than a handful of prints per source
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("#", width=3)
+        table.add_column("Title", style="bold")
+        table.add_column("Authors")
+        table.add_column("Year", width=6)
+        table.add_column("Citations", width=9)
+        table.add_column("URL", overflow="fold")
 
         csl_sources = []
         for i, paper in enumerate(suggestions, 1):
-            console.print(f"[bold]{i}. {paper['title']}[/bold]")
-            console.print(f"   Authors: {', '.join(paper['authors'][:3])}")
-            console.print(f"   Year: {paper['year']}")
-            console.print(f"   Citations: {paper['citationCount']}")
-            console.print(f"   URL: {paper['url']}")
-            console.print()
-            csl_sources.append(_to_csl(paper, i))
+            table.add_row(
+                str(i),
+                paper['title'],
+                ", ".join(paper['authors'][:3]),
+                str(paper['year']),
+                str(paper['citationCount']),
+                paper['url'],
+            )
+            csl_sources.append(_paper_to_csl(paper, i))
+
+        console.print(table)
 
         # Persist sources for downstream citation steps
         try:
-            sources_path = input_path.with_name(f"{input_path.stem}_sources.json")
+            sources_path = _sources_path(input_path)
             sources_path.write_text(json.dumps(csl_sources, indent=2))
             console.print(f"[dim]Saved sources to {sources_path}[/dim]")
         except Exception as e:
@@ -171,7 +335,6 @@ class EssayCLI:
         # Perform gap analysis if requested
         if gap_analysis:
             console.print(Panel("Analyzing Research Gaps...", title="Gap Analysis"))
-            gaps = assistant.find_research_gaps(text)
             if gaps:
                 console.print("[bold]Recommended Research Areas:[/bold]")
                 for i, gap in enumerate(gaps, 1):
@@ -190,6 +353,7 @@ class EssayCLI:
         auto_insert: bool = True,
         switch_to: str = None,
         lenient_fallback: bool = False,
+        no_cache: bool = False,
     ):
         """
         Add citation markers and optionally append a bibliography.
@@ -204,44 +368,47 @@ class EssayCLI:
             switch_to: Convert inline citations/bibliography to this style (overrides style)
             lenient_fallback: If True, use the first source when no keywords match (may be less relevant)
             model: AI model to use (default: anthropic/claude-3-haiku)
+            no_cache: Query the model even when --temperature=0 has a cached response
         """
         if model is None:
             model = config.DEFAULT_MODEL
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
-
-        text = input_path.read_text()
         annotated_text = text
         inline_style = switch_to or style
         # Initialize manager
         ai_model = self._init_model(model, role_env="MODEL_CITE")
-        if ai_model:
-            manager = CitationManager(model=ai_model)
-        else:
+        if not ai_model:
             console.print("[yellow]Warning: Auto-claim detection disabled (no AI model).[/yellow]")
-            manager = CitationManager()
+
+        manager = CitationManager(model=ai_model, bypass_cache=no_cache)
 
         # Load any saved sources from previous research step
-        sources_path = input_path.with_name(f"{input_path.stem}_sources.json")
-        if sources_path.exists():
-            try:
-                raw = sources_path.read_text()
-                saved_sources = json.loads(raw)
-                if not isinstance(saved_sources, list):
-                    raise ValueError("Sources file must contain a list")
-                valid_sources = []
-                for src in saved_sources:
-                    if isinstance(src, dict) and src.get("id"):
-                        valid_sources.append(src)
-                if valid_sources:
-                    manager.sources.extend(valid_sources)
-                    console.print(f"[dim]Loaded {len(valid_sources)} source(s) from {sources_path}[/dim]")
-            except json.JSONDecodeError as e:
-                console.print(f"[yellow]Warning: Corrupt sources file ({e})[/yellow]")
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not load saved sources ({e})[/yellow]")
+        sources_path = _sources_path(input_path)
+        try:
+            # Parsed once per process while the file is unchanged; the parsed
+            # list is shared, so the manager gets its own copy of each source
+            saved_sources = load_cached_json(sources_path)
+            if not isinstance(saved_sources, list):
+                raise ValueError("Sources file must contain a list")
+            valid_sources = []
+            for src in saved_sources:
+                if isinstance(src, dict) and src.get("id"):
+                    valid_sources.append(dict(src))
+            manager.sources.extend(valid_sources)
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError as e:
+            console.print(f"[yellow]Warning: Corrupt sources file ({e})[/yellow]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load saved sources ({e})[/yellow]")
+        if manager.sources:
+            console.print(f"[dim]Loaded {len(manager.sources)} source(s) from {sources_path}[/dim]")
+
+        # Each source's inline citation is formatted once per run
+        cite_source = lru_cache(maxsize=None)(partial(manager.format_citation, style=inline_style))
 
         console.print(Panel(f"Analyzing {input_file} for citations...", title="Citation Generator"))
 
@@ -259,57 +426,28 @@ class EssayCLI:
                 suggestions = manager.suggest_inline_citations(text, claims, style=inline_style, lenient=lenient_fallback)
                 suggested_claims = {s["claim"] for s in suggestions}
                 skipped_claims = [c for c in claims if c not in suggested_claims]
-                for s in suggestions:
-                    claim = s["claim"]
-                    citation = s["citation"]
-                    claim_with_marker = f"{claim} [citation needed]"
-                    if claim_with_marker in annotated_text:
-                        annotated_text = annotated_text.replace(
-                            claim_with_marker, f"{claim} {citation}", 1
-                        )
-                        inserted += 1
-                    elif claim in annotated_text:
-                        annotated_text = annotated_text.replace(
-                            claim, f"{claim} {citation}", 1
-                        )
-                        inserted += 1
+                annotated_text, inserted = _insert_citations(annotated_text, suggestions)
                 if inserted:
                     console.print(f"[green]Inserted {inserted} inline citation(s) using {inline_style.upper()}.[/green]")
                 else:
                     console.print("[yellow]Could not place inline citations (claims not found verbatim in text).[/yellow]")
                 if skipped_claims and not lenient_fallback:
                     console.print(f"[yellow]{len(skipped_claims)} claim(s) had no relevant sources (use --lenient-fallback to cite anyway).[/yellow]")
-                # Replace any remaining markers with leftover citations in order
-                remaining_markers = annotated_text.count("[citation needed]")
-                if remaining_markers and manager.sources:
-                    for i in range(remaining_markers):
-                        source = manager.sources[i % len(manager.sources)]
-                        # Defensive check (should exist if manager.sources is non-empty)
-                        if not source:
-                            continue
-                        src_id = source.get("id")
-                        if not src_id:
-                            continue
-                        citation = manager.format_citation(src_id, style=inline_style)
-                        annotated_text = annotated_text.replace("[citation needed]", citation, 1)
+                # Replace any remaining markers with leftover citations in order,
+                # formatting each source's citation only once
+                source_ids = [source["id"] for source in manager.sources if source and source.get("id")]
+                if source_ids and _CITATION_MARKER in annotated_text:
+                    annotated_text = _fill_markers(
+                        annotated_text, lambda i: cite_source(source_ids[i % len(source_ids)])
+                    )
             elif auto_insert and not manager.sources:
                 console.print("[yellow]No sources available to insert inline citations; falling back to markers.[/yellow]")
                 if annotate_missing:
-                    for claim in claims:
-                        if claim in annotated_text:
-                            annotated_text = annotated_text.replace(
-                                claim, f"{claim} [citation needed]", 1
-                            )
-                            inserted += 1
+                    annotated_text, inserted = _insert_markers(annotated_text, claims)
                     if inserted:
                         console.print(f"[green]Inserted {inserted} citation marker(s) into the text.[/green]")
             elif annotate_missing:
-                for claim in claims:
-                    if claim in annotated_text:
-                        annotated_text = annotated_text.replace(
-                            claim, f"{claim} [citation needed]", 1
-                        )
-                        inserted += 1
+                annotated_text, inserted = _insert_markers(annotated_text, claims)
                 if inserted:
                     console.print(f"[green]Inserted {inserted} citation marker(s) into the text.[/green]")
                 else:
@@ -340,7 +478,7 @@ class EssayCLI:
             if manager.sources:
                 console.print(f"\n[bold]Inline Citation Examples ({inline_style.upper()}):[/bold]")
                 for source in manager.sources:
-                    citation = manager.format_citation(source['id'], style=inline_style)
+                    citation = cite_source(source['id'])
                     title = source.get('title', 'Unknown Title')
                     console.print(f"• {title}: [cyan]{citation}[/cyan]")
         
@@ -354,29 +492,28 @@ class EssayCLI:
         else:
             console.print("\n[dim]No changes saved (no claims detected and no bibliography generated).[/dim]")
 
-    def check_plagiarism(self, input_file: str, model: str = None):
+    def check_plagiarism(self, input_file: str, model: str = None, no_cache: bool = False):
         """
         Check an essay for potential plagiarism (uncited quotes).
 
         Args:
             input_file: Path to the essay file
             model: AI model to use
+            no_cache: Query the model even when --temperature=0 has a cached response
         """
         if model is None:
             model = config.DEFAULT_MODEL
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
-        text = input_path.read_text()
-
         ai_model = self._init_model(model, role_env="MODEL_FACTCHECK")
         if not ai_model:
             return
 
-        manager = CitationManager(model=ai_model)
+        manager = CitationManager(model=ai_model, bypass_cache=no_cache)
 
         console.print(Panel(f"Scanning {input_file} for plagiarism...", title="Plagiarism Checker"))
         
@@ -388,7 +525,149 @@ class EssayCLI:
             for i, issue in enumerate(issues, 1):
                 console.print(f"{i}. {issue}")
 
-    def summarize(self, query: str, limit: int = 3, model: str = None):
+    def audit(self, input_file: str, min_sources: int = 3, model: str = None, no_cache: bool = False):
+        """
+        Suggest sources, find claims and check plagiarism in one pass.
+
+        The three analyses are independent, so their model calls run
+        concurrently instead of one after another.
+
+        Args:
+            input_file: Path to the essay file
+            min_sources: Number of sources to suggest
+            model: AI model to use (default: anthropic/claude-3-haiku)
+            no_cache: Query the model even when --temperature=0 has a cached response
+        """
+        if model is None:
+            model = config.DEFAULT_MODEL
+
+        input_path = Path(input_file)
+        text = _read_essay(input_path)
+        if text is None:
+            return
+
+        ai_model = self._init_model(model, role_env="MODEL_RESEARCH")
+        if not ai_model:
+            return
+
+        assistant = ResearchAssistant(model=ai_model, bypass_cache=no_cache)
+        manager = CitationManager(model=ai_model, bypass_cache=no_cache)
+
+        console.print(Panel(f"Auditing {input_file}...", title="Essay Audit"))
+
+        async def _audit():
+            return await asyncio.gather(
+                assistant.asuggest_sources(text, limit=min_sources),
+                manager.afind_claims(text),
+                manager.acheck_plagiarism(text),
+            )
+
+        suggestions, claims, issues = run_coroutine(_audit())
+
+        console.print("[bold]Suggested sources:[/bold]")
+        if not suggestions:
+            console.print("[yellow]No sources found.[/yellow]")
+        for i, paper in enumerate(suggestions, 1):
+            console.print(f"{i}. {paper['title']} ({paper['year']}) {paper['url']}")
+
+        console.print("\n[bold]Claims needing citations:[/bold]")
+        if not claims:
+            console.print("[green]No uncited claims detected.[/green]")
+        for i, claim in enumerate(claims, 1):
+            console.print(f"{i}. {claim}")
+
+        console.print("\n[bold]Potential plagiarism:[/bold]")
+        if not issues:
+            console.print("[green]No obvious plagiarism detected (all quotes appear cited).[/green]")
+        for i, issue in enumerate(issues, 1):
+            console.print(f"{i}. {issue}")
+
+    def pipeline(
+        self,
+        input_file: str,
+        min_sources: int = 3,
+        style: str = "apa",
+        cycles: int = 3,
+        target_score: int = 85,
+        model: str = None,
+        output_dir: str = "improvements",
+        no_cache: bool = False,
+    ):
+        """
+        Analyze, research, cite and improve an essay in one run.
+
+        The essay is read once and a single model serves every stage; sources
+        and claims found along the way are handed to the next stage instead
+        of being rediscovered. Structural analysis, source search and claim
+        detection are independent, so they run concurrently.
+
+        Args:
+            input_file: Path to the essay file
+            min_sources: Number of sources to suggest
+            style: Citation style for inline citations
+            cycles: Maximum number of improvement cycles
+            target_score: Stop improving once this score is met
+            model: AI model to use (default: anthropic/claude-3-haiku)
+            output_dir: Directory to save the final essay
+            no_cache: Query the model even when --temperature=0 has a cached response
+        """
+        if model is None:
+            model = config.DEFAULT_MODEL
+
+        input_path = Path(input_file)
+        text = _read_essay(input_path)
+        if text is None:
+            return
+
+        ctx = PipelineContext(text=text)
+
+        ai_model = self._init_model(model, role_env="MODEL_RESEARCH")
+        if not ai_model:
+            return
+
+        assistant = ResearchAssistant(model=ai_model, bypass_cache=no_cache)
+        manager = CitationManager(model=ai_model, bypass_cache=no_cache)
+
+        analyzer = EssayAnalyzer(model=ai_model)
+
+        console.print(Panel(
+            f"Running analyze + research → cite → improve on {input_file}...", title="Essay Pipeline"
+        ))
+
+        # 1. Analyze and research; none of these depend on each other. The
+        # analyzer is synchronous, so it runs in a worker thread.
+        async def _pipeline_async():
+            return await asyncio.gather(
+                asyncio.to_thread(analyzer.analyze, ctx.text),
+                assistant.asuggest_sources(ctx.text, limit=min_sources),
+                manager.afind_claims(ctx.text),
+            )
+
+        ctx.structure, papers, ctx.claims = run_coroutine(_pipeline_async())
+        analyzer.print_analysis(ctx.structure)
+        ctx.sources = [_paper_to_csl(paper, i) for i, paper in enumerate(papers, 1)]
+        console.print(f"[green]Found {len(ctx.sources)} source(s) and {len(ctx.claims)} claim(s).[/green]")
+
+        # 2. Cite
+        manager.sources.extend(ctx.sources)
+        suggestions = manager.suggest_inline_citations(ctx.text, ctx.claims, style=style)
+        cited_text, inserted = _insert_citations(ctx.text, suggestions)
+        console.print(f"[green]Inserted {inserted} inline citation(s) using {style.upper()}.[/green]")
+
+        # 3. Improve
+        result = EssayImprover(model=ai_model).improve(cited_text, cycles=cycles, target_score=target_score)
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        final_file = output_path / f"{input_path.stem}_pipeline_{timestamp}.txt"
+        final_file.write_text(result.final_text)
+
+        status_color = "green" if result.reached_target else "yellow"
+        console.print(f"\n[{status_color}]Final overall score: {result.final_scores.overall:.1f} / 100 (target {target_score})[/{status_color}]")
+        console.print(f"[dim]Saved to {final_file}[/dim]\n")
+
+    def summarize(self, query: str, limit: int = 3, model: str = None, no_cache: bool = False):
         """
         Find and summarize sources for a topic.
 
@@ -396,13 +675,14 @@ class EssayCLI:
             query: Topic to research
             limit: Number of sources
             model: AI model to use
+            no_cache: Query the model even when --temperature=0 has a cached response
         """
         if model is None:
             model = config.DEFAULT_MODEL
 
         try:
-            ai_model = OpenRouterModel(model_name=model)
-            assistant = ResearchAssistant(model=ai_model)
+            ai_model = _get_model(model, self.temperature)
+            assistant = ResearchAssistant(model=ai_model, bypass_cache=no_cache)
         except Exception as e:
             console.print(f"[red]Error initializing AI model: {e}[/red]")
             return
@@ -414,13 +694,15 @@ class EssayCLI:
             console.print("[yellow]No papers found.[/yellow]")
             return
 
-        for i, paper in enumerate(papers, 1):
+        # Summarize every paper in one request (falls back to concurrent requests)
+        summaries = run_coroutine(assistant.asummarize_sources_batch(papers))
+
+        for i, (paper, summary) in enumerate(zip(papers, summaries), 1):
             console.print(f"[bold]{i}. {paper['title']}[/bold]")
-            summary = assistant.summarize_source(paper)
             console.print(f"   [italic]{summary}[/italic]")
             console.print(f"   URL: {paper['url']}\n")
 
-    def check_facts(self, input_file: str, claim: str, model: str = None):
+    def check_facts(self, input_file: str, claim: str, model: str = None, no_cache: bool = False):
         """
         Verify a specific claim using research from the essay's topic.
 
@@ -428,20 +710,19 @@ class EssayCLI:
             input_file: Path to the essay file (to get context/topic)
             claim: The claim to verify
             model: AI model to use
+            no_cache: Query the model even when --temperature=0 has a cached response
         """
         if model is None:
             model = config.DEFAULT_MODEL
 
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
-        text = input_path.read_text()
-
         try:
-            ai_model = OpenRouterModel(model_name=model)
-            assistant = ResearchAssistant(model=ai_model)
+            ai_model = _get_model(model, self.temperature)
+            assistant = ResearchAssistant(model=ai_model, bypass_cache=no_cache)
         except Exception as e:
             console.print(f"[red]Error initializing AI model: {e}[/red]")
             return
@@ -467,7 +748,16 @@ class EssayCLI:
         
         console.print(f"\n[bold]Explanation:[/bold] {result.get('explanation', 'No explanation provided.')}")
 
-    def draft(self, topic: str, models: str = None, output_dir: str = "drafts"):
+    def draft(
+        self,
+        topic: str,
+        models: str = None,
+        output_dir: str = "drafts",
+        no_cache: bool = False,
+        cache_ttl: float = None,
+        max_concurrency: int = 8,
+        stream: bool = False
+    ):
         """
         Draft an essay using multiple AI models in parallel.
 
@@ -475,20 +765,30 @@ class EssayCLI:
             topic: The essay topic
             models: Comma-separated list of model IDs
             output_dir: Directory to save drafts
+            no_cache: Query the models even when --temperature=0 has cached drafts
+            cache_ttl: Maximum age in seconds of a reused cached draft (with --temperature=0)
+            max_concurrency: Maximum number of models drafting at once
+            stream: Write drafts to disk as they are generated
         """
-        from datetime import datetime
-
         if models is None:
             models = f"{config.DEFAULT_MODEL},openai/gpt-3.5-turbo"
 
-        model_list = [m.strip() for m in models.split(',')]
+        # Drop repeated model IDs (keeping first occurrences) so no model drafts twice
+        model_list = []
+        for m in (m.strip() for m in models.split(',')):
+            if not m:
+                continue
+            if m in model_list:
+                console.print(f"[yellow]Skipping duplicate model {m}[/yellow]")
+                continue
+            model_list.append(m)
         console.print(Panel(f"Drafting essay on '{topic}' using {len(model_list)} models...", title="Essay Drafter"))
 
         # Initialize models
         ai_models = []
         for m in model_list:
             try:
-                ai_models.append(OpenRouterModel(model_name=m))
+                ai_models.append(_get_model(m, self.temperature))
             except Exception as e:
                 console.print(f"[red]Error initializing {m}: {e}[/red]")
 
@@ -496,54 +796,61 @@ class EssayCLI:
             console.print("[red]No valid models available. Aborting.[/red]")
             return
 
-        drafter = EssayDrafter(models=ai_models)
+        cache = ResponseCache(default_cache_dir(), ttl=cache_ttl) if cache_ttl is not None else None
+        drafter = EssayDrafter(
+            models=ai_models,
+            cache=cache,
+            bypass_cache=no_cache,
+            max_concurrency=max_concurrency,
+            stream=stream
+        )
 
         # Create timestamped output directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         topic_slug = topic.replace(" ", "_")[:50]  # Limit length
         essay_dir = Path(output_dir) / f"{timestamp}_{topic_slug}"
 
-        # Run async drafting with proper event loop handling
+        def _report(res: dict) -> None:
+            """Print one draft result as soon as it is ready."""
+            model_name = res['model']
+            if res['success']:
+                word_count = res.get('word_count', 0)
+                console.print(f"[green]✅ {model_name}: {word_count} words → {res['file']}[/green]")
+            else:
+                console.print(f"[red]❌ {model_name}: Failed ({res['error']})[/red]")
+
+        # Run async drafting; inside an existing event loop this uses the
+        # background loop. Loop detection is kept apart from the run itself so a
+        # RuntimeError raised while drafting is reported instead of being
+        # mistaken for "no running loop" and retried with asyncio.run().
         try:
-            try:
-                asyncio.get_running_loop()
-                # Already in an event loop (e.g., notebook) – run in a helper thread.
-                results = self._run_coroutine_in_thread(drafter.draft_essay(topic, essay_dir))
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run()
-                results = asyncio.run(drafter.draft_essay(topic, essay_dir))
+            run_coroutine(drafter.draft_essay(topic, essay_dir, on_result=_report))
         except Exception as e:
             console.print(f"[red]Error during drafting: {e}[/red]")
-            import traceback
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
             return
 
-        # Report results
         console.print(f"\n[bold]Drafting Complete![/bold]")
-        console.print(f"[dim]Output directory: {essay_dir}[/dim]\n")
-
-        for res in results:
-            model_name = res['model']
-            if res['success']:
-                word_count = res.get('word_count', 0)
-                console.print(f"[green]✅ {model_name}: {word_count} words → {res['file']}[/green]")
-            else:
-                console.print(f"[red]❌ {model_name}: Failed ({res['error']})[/red]")
+        console.print(f"[dim]Output directory: {essay_dir}[/dim]")
 
     def analyze(self, input_file: str, model: str = None):
         """
         Analyze essay structure and provide recommendations.
 
         Args:
-            input_file: Path to the essay file
+            input_file: Path to the essay file, a directory of .txt essays,
+                or a glob pattern such as "drafts/*/*.txt"
             model: Optional AI model for advanced thesis extraction
         """
-        input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        files = _essay_files(input_file)
+        if files is not None:
+            self._analyze_many(files, model)
             return
 
-        essay_text = input_path.read_text()
+        input_path = Path(input_file)
+        essay_text = _read_essay(input_path)
+        if essay_text is None:
+            return
 
         # Initialize analyzer
         ai_model = self._init_model(model, role_env="MODEL_ANALYZE")
@@ -557,13 +864,31 @@ class EssayCLI:
         # Print results
         analyzer.print_analysis(structure)
 
+    def _analyze_many(self, files: List[Path], model: str = None):
+        """Analyze several essays in one batch, overlapping their model calls."""
+        if not files:
+            console.print("[yellow]No essays matched.[/yellow]")
+            return
+
+        texts = [_read_essay(path) for path in files]
+        found = [(path, text) for path, text in zip(files, texts) if text is not None]
+
+        ai_model = self._init_model(model, role_env="MODEL_ANALYZE")
+        analyzer = EssayAnalyzer(model=ai_model)
+        structures = analyzer.analyze_batch([text for _, text in found])
+
+        for (path, _), structure in zip(found, structures):
+            console.print(Panel(f"Analyzing structure of {path}...", title="Essay Analyzer"))
+            analyzer.print_analysis(structure)
+
     def improve(
         self,
         input_file: str,
         cycles: int = 3,
         target_score: int = 85,
         model: str = None,
-        output_dir: str = "improvements"
+        output_dir: str = "improvements",
+        min_delta: float = 0.5,
     ):
         """
         Iteratively improve an essay.
@@ -572,18 +897,15 @@ class EssayCLI:
             input_file: Path to the essay file.
             cycles: Maximum number of improvement cycles.
             target_score: Stop early once this score is met.
+            min_delta: Stop after two consecutive cycles gaining less than this.
             model: Optional model ID for AI-powered improvements.
             output_dir: Directory to save the improved essay.
         """
-        from datetime import datetime
-
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        essay_text = _read_essay(input_path)
+        if essay_text is None:
             return
 
-        essay_text = input_path.read_text()
-
         ai_model = self._init_model(model, role_env="MODEL_ANALYZE")
         improver = EssayImprover(model=ai_model)
 
@@ -597,6 +919,7 @@ class EssayCLI:
             cycles=cycles,
             target_score=target_score,
             progress_callback=_progress,
+            min_delta=min_delta,
         )
 
         if not result.iterations:
@@ -625,9 +948,6 @@ class EssayCLI:
         console.print(table)
 
         # Show before/after snippets
-        def _snippet(text: str, length: int = 180) -> str:
-            return text[:length].strip() + ("..." if len(text) > length else "")
-
         for step in result.iterations:
             console.print(f"\n[bold]Iteration {step.iteration} preview[/bold]")
             console.print(f"[dim]Before:[/dim] {_snippet(step.before_text)}")
@@ -675,14 +995,16 @@ class EssayCLI:
         try:
             template_enum = OutlineTemplate(template)
         except ValueError:
-            console.print(f"[red]Error: Unknown template '{template}'. Valid options: 5-paragraph, analytical, comparative, argumentative[/red]")
+            valid = ", ".join(t.value for t in OutlineTemplate)
+            console.print(f"[red]Error: Unknown template '{template}'. Valid options: {valid}[/red]")
             return
 
         # Parse format
         try:
             format_enum = ExportFormat(format)
         except ValueError:
-            console.print(f"[red]Error: Unknown format '{format}'. Valid options: markdown, json, plain[/red]")
+            valid = ", ".join(f.value for f in ExportFormat)
+            console.print(f"[red]Error: Unknown format '{format}'. Valid options: {valid}[/red]")
             return
 
         # Initialize AI model if requested
@@ -694,12 +1016,10 @@ class EssayCLI:
         # Generate outline
         if notes_file:
             # Convert notes to outline
-            notes_path = Path(notes_file)
-            if not notes_path.exists():
-                console.print(f"[red]Error: Notes file {notes_file} not found.[/red]")
+            notes = _read_essay(Path(notes_file))
+            if notes is None:
                 return
 
-            notes = notes_path.read_text()
             outline = generator.convert_notes_to_outline(
                 notes=notes,
                 template=template_enum,
@@ -753,12 +1073,10 @@ class EssayCLI:
             output_file: Optional file to save optimized essay.
         """
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
-        text = input_path.read_text()
-
         # Initialize AI model if requested
         ai_model = self._init_model(model, role_env="MODEL_OPTIMIZE") if model else None
         optimizer = GrammarOptimizer(model=ai_model)
@@ -839,21 +1157,20 @@ class EssayCLI:
         elif apply_fixes and result.improvements_applied == 0:
             console.print("\n[yellow]No automatic fixes available (manual review needed)[/yellow]")
 
-    def analyze_argument(self, input_file: str, model: str = None):
+    def analyze_argument(self, input_file: str, model: str = None, no_cache: bool = False):
         """
         Analyze the argument strength and structure of an essay.
 
         Args:
             input_file: Path to the essay file.
             model: Optional AI model to use.
+            no_cache: Query the model even when --temperature=0 has a cached response.
         """
         input_path = Path(input_file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File {input_file} not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
-        text = input_path.read_text()
-
         # Initialize AI model
         ai_model = self._init_model(model, role_env="MODEL_ARGUMENT")
         
@@ -862,7 +1179,7 @@ class EssayCLI:
              console.print("[red]Error: Argument analysis requires a working AI model configuration.[/red]")
              return
 
-        analyzer = ArgumentAnalyzer(model=ai_model)
+        analyzer = ArgumentAnalyzer(model=ai_model, bypass_cache=no_cache)
 
         console.print(Panel(f"Analyzing arguments in {input_file}...", title="Argument Analyzer"))
 
@@ -978,12 +1295,11 @@ class EssayCLI:
         """
         manager = TemplateManager()
 
-        source_path = Path(from_file)
-        if not source_path.exists():
-            console.print(f"[red]Error: Source file '{from_file}' not found.[/red]")
+        content = _read_essay(Path(from_file))
+        if content is None:
             return
 
-        content = source_path.read_text().strip()
+        content = content.strip()
         paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
 
         def _section_entry(title: str, paragraph: str) -> dict:
@@ -1039,8 +1355,8 @@ class EssayCLI:
             output: Optional output path.
         """
         input_path = Path(file)
-        if not input_path.exists():
-            console.print(f"[red]Error: File '{file}' not found.[/red]")
+        text = _read_essay(input_path)
+        if text is None:
             return
 
         if not output:
@@ -1049,7 +1365,7 @@ class EssayCLI:
         exporter = Exporter()
         console.print(f"[dim]Exporting {file} to {format.upper()}...[/dim]")
         
-        if exporter.export(input_path.read_text(), format, output):
+        if exporter.export(text, format, output):
             console.print(f"[green]Successfully exported to {output}[/green]")
         else:
             console.print(f"[red]Export failed. Check logs for details.[/red]")
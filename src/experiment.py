@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 
 from .models.base import AIModel
 from .metrics import MetricsCollector
-from .utils import print_formatted, write_to_file, extract_essay, ensure_dir, clear_file
+from .utils import print_formatted, write_to_file, index_essays, ensure_dir, clear_file
 
 # Load environment variables
 load_dotenv()
@@ -334,13 +334,16 @@ class TopicClassificationExperiment(ExperimentRunner):
         # Clear output file
         clear_file(self.topic_file)
 
+        # Index the essay file once rather than rescanning it every cycle
+        essays = index_essays(self.essay_file) or {}
+
         for cycle in range(self.num_cycles):
             print(f"\n{'#' * 80}")
             print(f"CYCLE {cycle + 1}/{self.num_cycles}")
             print('#' * 80)
 
             # Extract essay
-            essay_text = extract_essay(self.essay_file, cycle + 1)
+            essay_text = essays.get(cycle + 1)
             if essay_text is None:
                 print(f"\nERROR: Essay #{cycle + 1} not found in {self.essay_file}")
                 sys.exit(1)
@@ -64,6 +64,7 @@ class EssayImprover:
         cycles: int = 3,
         target_score: float = 85.0,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        min_delta: float = 0.5,
     ) -> ImprovementResult:
         """
         Improve an essay iteratively.
@@ -73,13 +74,15 @@ class EssayImprover:
             cycles: Maximum number of improvement cycles.
             target_score: Stop early when overall score meets/exceeds this value.
             progress_callback: Optional callable to report progress per cycle.
+            min_delta: Stop once two consecutive cycles each raise the overall
+                score by less than this many points (a plateau).
 
         Returns:
             ImprovementResult with iteration history and final text.
         """
         iterations: List[ImprovementStep] = []
         max_cycles = max(1, cycles)
-        consecutive_no_improvement = 0
+        consecutive_small_gains = 0
 
         current_text = essay_text.strip()
         current_scores = self._score_text(current_text)
@@ -98,7 +101,9 @@ class EssayImprover:
             if progress_callback:
                 progress_callback(i, max_cycles)
 
-            before_scores = self._score_text(current_text)
+            # current_text was scored at the end of the previous cycle, and each
+            # step's after_text is the next step's before_text (one shared string)
+            before_scores = current_scores
             revised_text, used_model = self._apply_improvement(current_text)
             after_scores = self._score_text(revised_text)
 
@@ -119,13 +124,15 @@ class EssayImprover:
             if current_scores.overall >= target_score:
                 break
 
-            # Stop if no measurable improvement for two consecutive cycles
-            if after_scores.overall <= before_scores.overall:
-                consecutive_no_improvement += 1
+            # Stop on a plateau: two consecutive cycles with no gain, or
+            # less than min_delta, rather than paying for another rewrite
+            gain = after_scores.overall - before_scores.overall
+            if gain <= 0 or gain < min_delta:
+                consecutive_small_gains += 1
             else:
-                consecutive_no_improvement = 0
+                consecutive_small_gains = 0
 
-            if consecutive_no_improvement >= 2:
+            if consecutive_small_gains >= 2:
                 break
 
         return ImprovementResult(
@@ -159,8 +166,9 @@ class EssayImprover:
 
     def _score_text(self, text: str) -> ImprovementScores:
         """Compute clarity/grammar/argument scores for a text."""
-        clarity = self._clarity_score(text)
-        grammar = self._grammar_score(text)
+        sentences = self._split_sentences(text)
+        clarity = self._clarity_score(sentences)
+        grammar = self._grammar_score(text, sentences)
         structure_score = self.analyzer.analyze(text).overall_score
 
         # Weighted blend favors structure and clarity
@@ -172,9 +180,8 @@ class EssayImprover:
             overall=overall,
         )
 
-    def _clarity_score(self, text: str) -> float:
+    def _clarity_score(self, sentences: List[str]) -> float:
         """Score clarity based on sentence length and consistency."""
-        sentences = self._split_sentences(text)
         if not sentences:
             return 40.0
 
@@ -197,9 +204,8 @@ class EssayImprover:
 
         return self._clamp(100.0 - length_penalty - variance_penalty, 5.0, 100.0)
 
-    def _grammar_score(self, text: str) -> float:
+    def _grammar_score(self, text: str, sentences: List[str]) -> float:
         """Score grammar using simple heuristics (MVP, not exhaustive)."""
-        sentences = self._split_sentences(text)
         if not sentences:
             return 45.0
 
@@ -2,5 +2,6 @@
 
 from .base import AIModel
 from .openrouter import OpenRouterModel
+from .cache import ResponseCache
 
-__all__ = ['AIModel', 'OpenRouterModel']
+__all__ = ['AIModel', 'OpenRouterModel', 'ResponseCache']
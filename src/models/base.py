@@ -1,7 +1,9 @@
 """Abstract base class for AI models."""
 
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import AsyncIterator, Tuple
+
+from ..exceptions import ModelError
 
 
 class AIModel(ABC):
@@ -61,6 +63,27 @@ class AIModel(ABC):
         """
         pass
 
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream the model's response to a prompt as text chunks.
+
+        The default implementation yields the whole acall() response as a
+        single chunk; models with native streaming should override it.
+
+        Args:
+            prompt: The prompt to send to the model
+
+        Yields:
+            Successive pieces of the response text
+
+        Raises:
+            ModelError: If the call fails
+        """
+        success, response, error = await self.acall(prompt)
+        if not success:
+            raise ModelError(error)
+        yield response
+
     def __repr__(self) -> str:
         """String representation of the model."""
         return (
@@ -0,0 +1,146 @@
+"""Exact-match cache for AI model responses."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .base import AIModel
+
+
+# Persisted responses older than this are ignored (seconds)
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk response cache directory.
+
+    Overridable with the AI_ESSAY_CACHE_DIR environment variable.
+    """
+    return Path(os.getenv('AI_ESSAY_CACHE_DIR') or '~/.cache/ai_essay/llm').expanduser()
+
+
+class ResponseCache:
+    """Cache successful model responses keyed by model settings and prompt.
+
+    Only models sampling at temperature 0 are cached; any other temperature
+    is expected to give a different answer each time, so those calls always
+    go to the model. Cached responses are memoized in memory and persisted as one
+    JSON file per prompt under ``cache_dir`` when the model identifies itself
+    with a string ``model_id``; anonymous models (e.g. test doubles) stay
+    in-memory only so unrelated instances never share answers.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted responses (None for in-memory only)
+            ttl: Maximum age of a persisted response, in seconds
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+        self._memory: Dict[str, str] = {}
+
+    def call(self, model: AIModel, prompt: str, bypass_cache: bool = False) -> Tuple[bool, str, str]:
+        """
+        Call the model unless an identical prompt has already been answered.
+
+        Args:
+            model: Model to call on a cache miss
+            prompt: The prompt to send to the model
+            bypass_cache: Always call the model (the fresh response is still stored)
+
+        Returns:
+            Tuple of (success, response_text, error_message)
+        """
+        if not self.cacheable(model):
+            return model.call(prompt)
+
+        key, persist = self._key(model, prompt)
+        if not bypass_cache:
+            cached = self._get(key, persist)
+            if cached is not None:
+                return True, cached, ""
+
+        success, response, error = model.call(prompt)
+        if success:
+            self._set(key, persist, response)
+        return success, response, error
+
+    async def acall(self, model: AIModel, prompt: str, bypass_cache: bool = False) -> Tuple[bool, str, str]:
+        """Async version of call."""
+        if not self.cacheable(model):
+            return await model.acall(prompt)
+
+        key, persist = self._key(model, prompt)
+        if not bypass_cache:
+            cached = self._get(key, persist)
+            if cached is not None:
+                return True, cached, ""
+
+        success, response, error = await model.acall(prompt)
+        if success:
+            self._set(key, persist, response)
+        return success, response, error
+
+    @staticmethod
+    def cacheable(model: AIModel) -> bool:
+        """Whether the model's responses are deterministic enough to reuse."""
+        return getattr(model, 'temperature', None) == 0
+
+    def clear(self) -> None:
+        """Forget all in-memory responses."""
+        self._memory.clear()
+
+    def _key(self, model: AIModel, prompt: str) -> Tuple[str, bool]:
+        """Hash the model settings and prompt; report whether it may be persisted."""
+        model_id = getattr(model, 'model_id', None)
+        persist = self.cache_dir is not None and isinstance(model_id, str)
+        if persist:
+            identity = f"{model_id}|{getattr(model, 'temperature', '')}|{getattr(model, 'max_tokens', '')}"
+        else:
+            identity = f"anon:{id(model)}"
+        digest = hashlib.blake2b(f"{identity}\0{prompt}".encode('utf-8'), digest_size=20)
+        return digest.hexdigest(), persist
+
+    def _get(self, key: str, persist: bool) -> Optional[str]:
+        """Look a response up in memory, then on disk."""
+        response = self._memory.get(key)
+        if response is not None or not persist:
+            return response
+
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            response = json.loads(path.read_text(encoding='utf-8'))['response']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if not isinstance(response, str):
+            return None
+        self._memory[key] = response
+        return response
+
+    def _set(self, key: str, persist: bool, response: str) -> None:
+        """Store a response in memory and, when allowed, atomically on disk."""
+        self._memory[key] = response
+        if not persist:
+            return
+
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({'response': response}), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError:
+            # Caching is best-effort; an unwritable cache dir shouldn't fail the call
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
@@ -1,10 +1,13 @@
 """OpenRouter AI model implementation."""
 
+import asyncio
 import os
-from typing import Tuple
+import weakref
+from typing import Any, AsyncIterator, Dict, Tuple
 from openai import OpenAI
 
 from .base import AIModel
+from .ratelimit import shared_gate
 from ..exceptions import ModelError
 
 
@@ -20,6 +23,14 @@ class OpenRouterModel(AIModel):
 
     OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+    # Sync clients shared across instances so the HTTP connection pool
+    # (and its TCP/TLS sessions) is reused by every model with the same key
+    _shared_clients: Dict[Tuple[Any, str, str], OpenAI] = {}
+
+    # Async clients are bound to the event loop that uses them, so they are
+    # shared per loop; all models drafting concurrently reuse one pool
+    _shared_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     def __init__(
         self,
         model_name: str,
@@ -57,14 +68,40 @@ class OpenRouterModel(AIModel):
                 "Set OPENROUTER_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Initialize client (reused across calls)
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.OPENROUTER_BASE_URL
-        )
+        # Sync client, created on first use (async-only callers never need one)
+        self._client = None
+
+    @property
+    def client(self) -> OpenAI:
+        """Pooled sync client for this model's API key."""
+        if self._client is None:
+            self._client = self._get_shared_client(self.api_key)
+        return self._client
+
+    @classmethod
+    def _get_shared_client(cls, api_key: str) -> OpenAI:
+        """Return the pooled sync client for an API key, creating it once."""
+        # Keyed on the client class as well so a substituted client never
+        # receives a connection pool created by another implementation
+        key = (OpenAI, api_key, cls.OPENROUTER_BASE_URL)
+        client = cls._shared_clients.get(key)
+        if client is None:
+            client = OpenAI(api_key=api_key, base_url=cls.OPENROUTER_BASE_URL)
+            cls._shared_clients[key] = client
+        return client
+
+    @classmethod
+    def _get_shared_async_client(cls, api_key: str) -> Any:
+        """Return the pooled async client for an API key on the running loop."""
+        from openai import AsyncOpenAI
 
-        # Lazy-initialize async client when needed
-        self._async_client = None
+        clients = cls._shared_async_clients.setdefault(asyncio.get_running_loop(), {})
+        key = (AsyncOpenAI, api_key, cls.OPENROUTER_BASE_URL)
+        client = clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(api_key=api_key, base_url=cls.OPENROUTER_BASE_URL)
+            clients[key] = client
+        return client
 
     def call(self, prompt: str) -> Tuple[bool, str, str]:
         """
@@ -77,15 +114,17 @@ class OpenRouterModel(AIModel):
             Tuple of (success, response_text, error_message)
         """
         try:
-            completion = self.client.chat.completions.create(
-                model=self.model_id,
-                messages=[
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
+            # Shares the process-wide rate budget with async requests
+            with shared_gate().sync_slot():
+                completion = self.client.chat.completions.create(
+                    model=self.model_id,
+                    messages=[
+                        {"role": "system", "content": self.system_message},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature
+                )
             return True, completion.choices[0].message.content, ""
 
         except Exception as e:
@@ -101,30 +140,61 @@ class OpenRouterModel(AIModel):
         Returns:
             Tuple of (success, response_text, error_message)
         """
-        from openai import AsyncOpenAI
-
-        # Lazy-initialize async client on first use (reused for subsequent calls)
-        if self._async_client is None:
-            self._async_client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.OPENROUTER_BASE_URL
-            )
+        # Created on first use per event loop and shared with other models
+        client = self._get_shared_async_client(self.api_key)
 
         try:
-            completion = await self._async_client.chat.completions.create(
-                model=self.model_id,
-                messages=[
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
+            # Every model in the process shares one concurrency/rate budget
+            async with shared_gate().slot():
+                completion = await client.chat.completions.create(
+                    model=self.model_id,
+                    messages=[
+                        {"role": "system", "content": self.system_message},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature
+                )
             return True, completion.choices[0].message.content, ""
 
         except Exception as e:
             return False, "", f"API Error: {str(e)}"
 
+    async def astream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream the OpenRouter model's response as it is generated.
+
+        Args:
+            prompt: The prompt to send to the model
+
+        Yields:
+            Successive pieces of the response text
+
+        Raises:
+            ModelError: If the request fails before or during streaming
+        """
+        client = self._get_shared_async_client(self.api_key)
+
+        try:
+            # The slot is held until the stream ends
+            async with shared_gate().slot():
+                stream = await client.chat.completions.create(
+                    model=self.model_id,
+                    messages=[
+                        {"role": "system", "content": self.system_message},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    stream=True
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise ModelError(f"API Error: {str(e)}") from e
+
     def __repr__(self) -> str:
         """String representation of the model."""
         return (
@@ -0,0 +1,86 @@
+"""Process-wide limits on concurrent and per-minute model requests."""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+from ..config import config
+
+
+class RequestGate:
+    """Caps in-flight requests and spaces them to a requests-per-minute budget.
+
+    Async requests are capped per event loop (asyncio semaphores are bound to
+    the loop that first uses them) and blocking requests are capped across
+    all threads; the per-minute budget is shared by every loop and thread in
+    the process.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: float = 0):
+        """
+        Initialize the gate.
+
+        Args:
+            max_concurrency: Maximum requests in flight at once per event loop
+            requests_per_minute: Request budget; 0 or less disables spacing
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._thread_semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Semaphore for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _reserve_delay(self) -> float:
+        """Claim the next start time in the budget and return the wait until then."""
+        if self.requests_per_minute <= 0:
+            return 0.0
+        interval = 60.0 / self.requests_per_minute
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + interval
+        return start - now
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot, waiting for capacity and the rate budget."""
+        async with self._semaphore():
+            delay = self._reserve_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+
+    @contextmanager
+    def sync_slot(self) -> Iterator[None]:
+        """Hold one request slot from blocking code, sleeping for the rate budget."""
+        with self._thread_semaphore:
+            delay = self._reserve_delay()
+            if delay > 0:
+                time.sleep(delay)
+            yield
+
+
+_shared_gate: Optional[RequestGate] = None
+_shared_gate_lock = threading.Lock()
+
+
+def shared_gate() -> RequestGate:
+    """The gate every OpenRouter request in this process goes through."""
+    global _shared_gate
+    if _shared_gate is None:
+        with _shared_gate_lock:
+            if _shared_gate is None:
+                _shared_gate = RequestGate(config.max_concurrency, config.requests_per_minute)
+    return _shared_gate
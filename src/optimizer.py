@@ -126,16 +126,19 @@ class GrammarOptimizer:
 
         issues: List[OptimizationIssue] = []
 
+        # Split once; every sentence-level check below shares the result
+        sentences = self._split_sentences(text)
+
         # Calculate readability metrics
-        metrics = self._calculate_readability(text)
+        metrics = self._calculate_readability(text, sentences)
 
         # Detect various issues
         issues.extend(self._detect_cliches(text))
         issues.extend(self._detect_wordy_phrases(text))
-        issues.extend(self._detect_weak_verbs(text))
+        issues.extend(self._detect_weak_verbs(sentences))
 
         if prefer_active_voice:
-            issues.extend(self._detect_passive_voice(text))
+            issues.extend(self._detect_passive_voice(sentences))
 
         # Check grade level
         if target_grade_level and metrics.flesch_kincaid_grade > target_grade_level:
@@ -167,26 +170,25 @@ class GrammarOptimizer:
             improvements_applied=improvements_applied,
         )
 
-    def _calculate_readability(self, text: str) -> ReadabilityMetrics:
-        """Calculate readability metrics."""
+    def _calculate_readability(self, text: str, sentences: List[str]) -> ReadabilityMetrics:
+        """Calculate readability metrics from the text and its sentences."""
         try:
             import textstat
         except ImportError:
             logger.warning("textstat not installed, using approximate metrics")
-            return self._approximate_readability(text)
+            return self._approximate_readability(text, sentences)
 
         # Use textstat for accurate metrics
         flesch_ease = textstat.flesch_reading_ease(text)
         flesch_grade = textstat.flesch_kincaid_grade(text)
         avg_sentence_length = textstat.words_per_sentence(text)
 
-        sentences = self._split_sentences(text)
         words = text.split()
 
         # Calculate additional metrics
         avg_word_length = sum(len(w) for w in words) / len(words) if words else 0
         complex_words = sum(1 for w in words if len(w) > 10)
-        passive_pct = self._calculate_passive_percentage(text)
+        passive_pct = self._calculate_passive_percentage(sentences)
 
         return ReadabilityMetrics(
             flesch_reading_ease=max(0, min(100, flesch_ease)),
@@ -199,9 +201,10 @@ class GrammarOptimizer:
             complex_words=complex_words,
         )
 
-    def _approximate_readability(self, text: str) -> ReadabilityMetrics:
+    def _approximate_readability(self, text: str, sentences: Optional[List[str]] = None) -> ReadabilityMetrics:
         """Approximate readability metrics without textstat."""
-        sentences = self._split_sentences(text)
+        if sentences is None:
+            sentences = self._split_sentences(text)
         words = text.split()
 
         if not sentences or not words:
@@ -228,7 +231,7 @@ class GrammarOptimizer:
 
         avg_word_length = sum(len(w) for w in words) / len(words)
         complex_words = sum(1 for w in words if len(w) > 10)
-        passive_pct = self._calculate_passive_percentage(text)
+        passive_pct = self._calculate_passive_percentage(sentences)
 
         return ReadabilityMetrics(
             flesch_reading_ease=max(0, min(100, flesch_ease)),
@@ -298,9 +301,8 @@ class GrammarOptimizer:
 
         return sentences
 
-    def _calculate_passive_percentage(self, text: str) -> float:
+    def _calculate_passive_percentage(self, sentences: List[str]) -> float:
         """Calculate percentage of passive voice usage."""
-        sentences = self._split_sentences(text)
         if not sentences:
             return 0.0
 
@@ -370,10 +372,9 @@ class GrammarOptimizer:
 
         return issues
 
-    def _detect_weak_verbs(self, text: str) -> List[OptimizationIssue]:
-        """Detect weak verbs in text."""
+    def _detect_weak_verbs(self, sentences: List[str]) -> List[OptimizationIssue]:
+        """Detect weak verbs in the given sentences."""
         issues = []
-        sentences = self._split_sentences(text)
 
         for sentence in sentences:
             words = sentence.split()
@@ -392,10 +393,9 @@ class GrammarOptimizer:
 
         return issues
 
-    def _detect_passive_voice(self, text: str) -> List[OptimizationIssue]:
-        """Detect passive voice usage."""
+    def _detect_passive_voice(self, sentences: List[str]) -> List[OptimizationIssue]:
+        """Detect passive voice usage in the given sentences."""
         issues = []
-        sentences = self._split_sentences(text)
 
         for sentence in sentences:
             if self._is_passive_voice(sentence):
@@ -319,12 +319,8 @@ class OutlineGenerator:
         Returns:
             Formatted outline string.
         """
-        if format == ExportFormat.JSON:
-            return self._export_json(outline)
-        elif format == ExportFormat.MARKDOWN:
-            return self._export_markdown(outline)
-        else:
-            return self._export_plain(outline)
+        exporter = self._EXPORTERS.get(format, OutlineGenerator._export_plain)
+        return exporter(self, outline)
 
     def _export_json(self, outline: Outline) -> str:
         """Export outline as JSON."""
@@ -412,6 +408,13 @@ class OutlineGenerator:
         lines.append("\n" + "=" * 60)
         return "\n".join(lines)
 
+    # Export format -> exporter (unknown formats fall back to plain text)
+    _EXPORTERS = {
+        ExportFormat.JSON: _export_json,
+        ExportFormat.MARKDOWN: _export_markdown,
+        ExportFormat.PLAIN_TEXT: _export_plain,
+    }
+
     def convert_notes_to_outline(
         self,
         notes: str,
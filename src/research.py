@@ -1,5 +1,8 @@
+import asyncio
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Tuple
 import signal
 from contextlib import contextmanager
 
@@ -11,6 +14,24 @@ from semanticscholar.PaginatedResults import PaginatedResults
 
 from .models.base import AIModel
 from .config import config
+from .utils import word_shingles, word_tokens
+from .models.cache import ResponseCache, default_cache_dir
+
+# Search results are reused for an hour for queries with the same normalized key
+_SEARCH_CACHE_TTL = 60 * 60
+# Sources whose title + abstract word trigrams overlap at least this much
+# (Jaccard) are treated as one source when fact checking
+_DUPLICATE_SOURCE_THRESHOLD = 0.8
+
+
+def _normalize_query(query: str) -> str:
+    """Reduce a search query to its lowercase words, in order.
+
+    Only case, whitespace and punctuation are ignored, so "Capital of France?"
+    and "capital  of france" share a key while "dogs bite men" and
+    "men bite dogs" do not.
+    """
+    return " ".join(word_tokens(query)) or query.strip().lower()
 
 @contextmanager
 def timeout(seconds):
@@ -31,15 +52,34 @@ def timeout(seconds):
 class ResearchAssistant:
     """Assists with finding sources and research."""
 
-    def __init__(self, model: Optional[AIModel] = None):
+    def __init__(
+        self,
+        model: Optional[AIModel] = None,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False
+    ):
         """
         Initialize research assistant.
 
         Args:
             model: AIModel instance for analysis
+            cache: Response cache for model calls (defaults to the on-disk cache)
+            bypass_cache: Always query the model, refreshing cached responses
         """
         self.model = model
+        self.cache = cache if cache is not None else ResponseCache(default_cache_dir())
+        self.bypass_cache = bypass_cache
         self.sch = SemanticScholar(timeout=config.API_TIMEOUT)
+        # (normalized query, limit) -> (fetched_at, papers)
+        self._search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def _call_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Call the model through the response cache."""
+        return self.cache.call(self.model, prompt, bypass_cache=self.bypass_cache)
+
+    async def _acall_model(self, prompt: str) -> Tuple[bool, str, str]:
+        """Async version of _call_model."""
+        return await self.cache.acall(self.model, prompt, bypass_cache=self.bypass_cache)
 
     def search_papers(self, query: str, limit: int = config.DEFAULT_SEARCH_LIMIT) -> List[Dict[str, Any]]:
         """
@@ -52,6 +92,12 @@ class ResearchAssistant:
         Returns:
             List of paper details
         """
+        key = (_normalize_query(query), limit)
+        cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+            logger.info(f"Reusing Semantic Scholar results for: '{query}'")
+            return [dict(paper) for paper in cached[1]]
+
         try:
             logger.info(f"Searching Semantic Scholar for: '{query}'")
             results = self.sch.search_paper(query, limit=limit)
@@ -73,7 +119,8 @@ class ResearchAssistant:
                     "paperId": item.paperId or ""
                 })
             logger.info(f"Found {len(papers)} papers")
-            return papers
+            self._search_cache[key] = (time.monotonic(), papers)
+            return [dict(paper) for paper in papers]
         except TimeoutError as e:
             logger.error(f"Timeout searching papers for '{query}': {e}")
             return []
@@ -95,47 +142,103 @@ class ResearchAssistant:
             List of suggested papers
         """
         if not self.model:
-            # Fallback: Use simple keyword extraction or just the first sentence
-            # For MVP, let's just use "Artificial Intelligence Education" as a fallback query
-            # based on the likely content, or extract from text.
-            # A simple heuristic: take the first 5 words.
-            words = essay_text.split()[:5]
-            query = " ".join(words)
-            logger.warning(f"Model unavailable. Using fallback query: '{query}'")
-            return self.search_papers(query, limit=limit)
-
-        # 1. Extract key topics/queries from essay
-        # Truncate for token limits if needed
-        truncated_text = essay_text[:config.MAX_ESSAY_LENGTH] 
-        prompt = (
-            "Analyze the following essay and generate 3 specific search queries "
-            "to find academic papers that would support its arguments. "
-            "Return ONLY the queries, one per line.\n\n"
-            f"Essay:\n{truncated_text}..." 
-        )
+            return self.search_papers(self._fallback_query(essay_text), limit=limit)
 
-        success, response, error = self.model.call(prompt)
+        success, response, error = self._call_model(self._source_queries_prompt(essay_text))
         if not success:
             logger.error(f"Failed to generate search queries: {error}")
             return []
 
-        queries = [line.strip() for line in response.split('\n') if line.strip()]
-        
         all_suggestions = []
-        for query in queries[:max_queries]: # Search top queries
+        for query in self._source_queries(response, max_queries): # Search top queries
             papers = self.search_papers(query, limit=search_limit)
             all_suggestions.extend(papers)
 
-        # Deduplicate by paperId
+        return self._unique_papers(all_suggestions, limit)
+
+    async def asuggest_sources(
+        self, essay_text: str, limit: int = 3, max_queries: int = 2, search_limit: int = 2
+    ) -> List[Dict[str, Any]]:
+        """Async version of suggest_sources; searches for all queries at once."""
+        if not self.model:
+            return await asyncio.to_thread(self.search_papers, self._fallback_query(essay_text), limit)
+
+        success, response, error = await self._acall_model(self._source_queries_prompt(essay_text))
+        if not success:
+            logger.error(f"Failed to generate search queries: {error}")
+            return []
+
+        # The Semantic Scholar client is blocking, so searches run in worker threads
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self.search_papers, query, search_limit)
+            for query in self._source_queries(response, max_queries)
+        ))
+        return self._unique_papers([paper for papers in results for paper in papers], limit)
+
+    @staticmethod
+    def _fallback_query(essay_text: str) -> str:
+        """Build a search query from the essay's opening words when no model is set."""
+        # For MVP, a simple heuristic: take the first 5 words.
+        query = " ".join(essay_text.split()[:5])
+        logger.warning(f"Model unavailable. Using fallback query: '{query}'")
+        return query
+
+    @staticmethod
+    def _source_queries_prompt(essay_text: str) -> str:
+        """Build the prompt asking for search queries that support the essay."""
+        # Truncate for token limits if needed
+        truncated_text = essay_text[:config.MAX_ESSAY_LENGTH]
+        return (
+            "Analyze the following essay and generate 3 specific search queries "
+            "to find academic papers that would support its arguments. "
+            "Return ONLY the queries, one per line.\n\n"
+            f"Essay:\n{truncated_text}..."
+        )
+
+    @staticmethod
+    def _source_queries(response: str, max_queries: int) -> List[str]:
+        """Take the first max_queries non-empty lines of the model reply."""
+        queries = [line.strip() for line in response.split('\n') if line.strip()]
+        return queries[:max_queries]
+
+    @staticmethod
+    def _unique_papers(papers: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """Deduplicate papers by paperId, keeping order, and cap the list."""
         seen = set()
         unique_suggestions = []
-        for paper in all_suggestions:
+        for paper in papers:
             if paper['paperId'] not in seen:
                 seen.add(paper['paperId'])
                 unique_suggestions.append(paper)
 
         return unique_suggestions[:limit]
 
+    @staticmethod
+    def _distinct_sources(sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop near-duplicate sources, keeping the most cited of each group.
+
+        Search results often hold the same paper several times (preprint,
+        journal version, mirrors); sending each copy to the model only
+        pads the prompt.
+        """
+        ranked = sorted(
+            range(len(sources)),
+            key=lambda i: sources[i].get('citationCount') or 0,
+            reverse=True,
+        )
+        kept: List[Tuple[int, frozenset]] = []
+        for i in ranked:
+            source = sources[i]
+            shingles = word_shingles(f"{source.get('title') or ''} {source.get('abstract') or ''}")
+            if any(
+                len(shingles & other) / len(shingles | other) >= _DUPLICATE_SOURCE_THRESHOLD
+                for _, other in kept
+            ):
+                continue
+            kept.append((i, shingles))
+
+        return [sources[i] for i in sorted(i for i, _ in kept)]
+
     def find_quotes(self, paper_id: str, topic: str) -> List[str]:
         """
         Find relevant quotes from a paper (simulated since we can't always get full text).
@@ -158,7 +261,7 @@ class ResearchAssistant:
                 f"Abstract:\n{paper.abstract}"
             )
             
-            success, response, _ = self.model.call(prompt)
+            success, response, _ = self._call_model(prompt)
             if success and len(response) > 10:
                 return [response]
             return []
@@ -182,7 +285,7 @@ class ResearchAssistant:
 
         # Prepare source context
         context = ""
-        for i, source in enumerate(sources, 1):
+        for i, source in enumerate(self._distinct_sources(sources), 1):
             title = source.get('title', 'Unknown')
             abstract = source.get('abstract', '')
             if abstract:
@@ -203,14 +306,13 @@ class ResearchAssistant:
             "}"
         )
 
-        success, response, error = self.model.call(prompt)
+        success, response, error = self._call_model(prompt)
         if not success:
             return {"supported": False, "confidence": 0.0, "explanation": f"AI Error: {error}"}
 
         try:
             # Clean up response to ensure valid JSON (sometimes models add markdown)
             clean_response = response.replace("```json", "").replace("```", "").strip()
-            import json
             return json.loads(clean_response)
         except Exception as e:
             logger.error(f"Failed to parse fact check response: {e}")
@@ -226,26 +328,121 @@ class ResearchAssistant:
         Returns:
             Summary string
         """
-        if not self.model:
-            return source.get('abstract', 'No abstract available.')[:200] + "..."
+        if not self.model or not source.get('abstract'):
+            return self._summary_without_model(source)
 
-        title = source.get('title', 'Unknown Title')
-        abstract = source.get('abstract', '')
-        
-        if not abstract:
-            return f"{title}: No abstract available to summarize."
+        success, response, error = self._call_model(self._summary_prompt(source))
+        if success:
+            return response.strip()
+        return "Failed to generate summary."
 
-        prompt = (
-            f"Summarize the following academic paper in 2-3 sentences for a general audience.\n\n"
-            f"Title: {title}\n"
-            f"Abstract: {abstract}"
-        )
+    async def asummarize_source(self, source: Dict[str, Any]) -> str:
+        """Async version of summarize_source."""
+        if not self.model or not source.get('abstract'):
+            return self._summary_without_model(source)
 
-        success, response, error = self.model.call(prompt)
+        success, response, error = await self._acall_model(self._summary_prompt(source))
         if success:
             return response.strip()
         return "Failed to generate summary."
 
+    async def asummarize_sources(self, sources: List[Dict[str, Any]], max_concurrency: int = 8) -> List[str]:
+        """
+        Summarize several sources concurrently.
+
+        Args:
+            sources: Source dictionaries
+            max_concurrency: Maximum number of summaries requested at once
+
+        Returns:
+            Summary strings, in the same order as sources
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _summarize(source: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.asummarize_source(source)
+
+        return list(await asyncio.gather(*(_summarize(source) for source in sources)))
+
+    async def asummarize_sources_batch(self, sources: List[Dict[str, Any]]) -> List[str]:
+        """
+        Summarize several sources with a single model request.
+
+        Falls back to one request per source (see asummarize_sources) when
+        the reply is not a JSON array with one summary per source.
+
+        Args:
+            sources: Source dictionaries
+
+        Returns:
+            Summary strings, in the same order as sources
+        """
+        summaries = [self._summary_without_model(source) for source in sources]
+        if not self.model:
+            return summaries
+
+        batch = [i for i, source in enumerate(sources) if source.get('abstract')]
+        if len(batch) < 2:
+            return await self.asummarize_sources(sources)
+
+        success, response, error = await self._acall_model(
+            self._batch_summary_prompt([sources[i] for i in batch])
+        )
+        parsed = self._parse_batch_summaries(response, len(batch)) if success else None
+        if parsed is None:
+            logger.warning("Batched summary reply unusable; summarizing sources one by one.")
+            return await self.asummarize_sources(sources)
+
+        for i, summary in zip(batch, parsed):
+            summaries[i] = summary
+        return summaries
+
+    @staticmethod
+    def _batch_summary_prompt(sources: List[Dict[str, Any]]) -> str:
+        """Build one prompt asking for a summary of each numbered source."""
+        papers = "\n\n".join(
+            f"Paper {i}\nTitle: {source.get('title', 'Unknown Title')}\nAbstract: {source['abstract']}"
+            for i, source in enumerate(sources, 1)
+        )
+        return (
+            f"Summarize each of the following {len(sources)} academic papers in 2-3 sentences "
+            "for a general audience. Return ONLY a JSON array of strings, one summary per "
+            "paper, in the same order.\n\n"
+            f"{papers}"
+        )
+
+    @staticmethod
+    def _parse_batch_summaries(response: str, count: int) -> Optional[List[str]]:
+        """Parse a JSON array of exactly count summaries, or return None."""
+        # Parse only the outermost [...], which skips markdown fences or prose
+        start = response.find("[")
+        end = response.rfind("]")
+        if start == -1 or end < start:
+            return None
+        try:
+            data = json.loads(response[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, list) or len(data) != count or not all(isinstance(d, str) for d in data):
+            return None
+        return [d.strip() for d in data]
+
+    def _summary_without_model(self, source: Dict[str, Any]) -> str:
+        """Fallback summary when there is no model or nothing to summarize."""
+        if not self.model:
+            return source.get('abstract', 'No abstract available.')[:200] + "..."
+        return f"{source.get('title', 'Unknown Title')}: No abstract available to summarize."
+
+    @staticmethod
+    def _summary_prompt(source: Dict[str, Any]) -> str:
+        """Build the prompt asking for a short summary of a source."""
+        return (
+            f"Summarize the following academic paper in 2-3 sentences for a general audience.\n\n"
+            f"Title: {source.get('title', 'Unknown Title')}\n"
+            f"Abstract: {source.get('abstract', '')}"
+        )
+
     def find_research_gaps(self, essay_text: str) -> List[str]:
         """
         Identify missing research areas or weak arguments needing evidence.
@@ -259,9 +456,21 @@ class ResearchAssistant:
         if not self.model:
             return ["AI model unavailable for gap analysis."]
 
+        return self._gaps_from_reply(self._call_model(self._research_gaps_prompt(essay_text)))
+
+    async def afind_research_gaps(self, essay_text: str) -> List[str]:
+        """Async version of find_research_gaps."""
+        if not self.model:
+            return ["AI model unavailable for gap analysis."]
+
+        return self._gaps_from_reply(await self._acall_model(self._research_gaps_prompt(essay_text)))
+
+    @staticmethod
+    def _research_gaps_prompt(essay_text: str) -> str:
+        """Build the gap analysis prompt."""
         # Truncate for token limits
         truncated_text = essay_text[:config.MAX_ESSAY_LENGTH]
-        prompt = (
+        return (
             "Analyze the following essay and identify 3-5 specific areas where "
             "additional research or evidence is needed to strengthen the argument. "
             "Focus on weak claims, unexplored angles, or missing context. "
@@ -269,10 +478,12 @@ class ResearchAssistant:
             f"Essay:\n{truncated_text}..."
         )
 
-        success, response, error = self.model.call(prompt)
+    @staticmethod
+    def _gaps_from_reply(reply: Tuple[bool, str, str]) -> List[str]:
+        """Split a gap analysis reply into one recommendation per line."""
+        success, response, error = reply
         if not success:
             logger.error(f"Failed to find research gaps: {error}")
             return []
 
-        recommendations = [line.strip() for line in response.split('\n') if line.strip()]
-        return recommendations
+        return [line.strip() for line in response.split('\n') if line.strip()]
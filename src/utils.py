@@ -1,8 +1,50 @@
 """Shared utility functions."""
 
+import asyncio
+import json
+import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Words ignored when matching texts by keyword
+STOPWORDS = frozenset({
+    "the", "and", "for", "are", "was", "but", "not", "you", "all", "can",
+    "her", "has", "had", "with", "from", "that", "this", "they", "them",
+    "their", "its", "into", "onto", "about", "over", "under", "an", "is",
+    "be", "been", "being", "have", "do", "does", "did", "he", "she", "it",
+    "we", "us", "him", "his", "in", "on", "at", "by", "to", "of", "or",
+    "if", "when", "where", "while", "may", "will", "would", "could", "should"
+})
+# Word tokens: runs of word characters, so punctuation (hyphens, URL
+# separators) splits words instead of gluing them together; keeps "c++"
+_WORD_TOKEN_RE = re.compile(r"\w+(?:\+\+)?")
+
+_ESSAY_MARKER_PREFIX = "******** Essay number: "
+_ESSAY_MARKER_RE = re.compile(r"\*{8} Essay number: (\d+) \*{12}$")
+
+
+# In-process cache of parsed YAML files: absolute path -> (signature, data)
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def word_tokens(text: str) -> List[str]:
+    """Lowercase word tokens of a text, split on whitespace and punctuation."""
+    return _WORD_TOKEN_RE.findall(text.lower())
+
+
+def word_shingles(text: str) -> frozenset:
+    """Word trigrams of a text, for near-duplicate detection."""
+    words = text.lower().split()
+    if len(words) < 3:
+        return frozenset([tuple(words)])
+    return frozenset(zip(words, words[1:], words[2:]))
 
 
 def print_formatted(text: str, max_line_length: int = 115) -> None:
@@ -95,6 +137,48 @@ def extract_essay(filepath: Path, essay_number: int) -> Optional[str]:
     return essay.strip()
 
 
+def index_essays(filepath: Path) -> Optional[Dict[int, str]]:
+    """
+    Read every numbered essay from a file in a single streaming pass.
+
+    Uses the same marker format as extract_essay(), but scans the file
+    once instead of once per essay.
+
+    Args:
+        filepath: Path to the essay file
+
+    Returns:
+        Mapping of essay number to essay text, or None if the file
+        cannot be read
+    """
+    chunks: Dict[int, List[str]] = {}
+    current: Optional[List[str]] = None
+
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                match = _ESSAY_MARKER_RE.match(line.strip())
+                if match:
+                    current = chunks.setdefault(int(match.group(1)), [])
+                    continue
+
+                if current is not None and line.startswith(_ESSAY_MARKER_PREFIX):
+                    # Malformed marker: ends the current essay
+                    current = None
+                    continue
+
+                if current is not None:
+                    current.append(line)
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"ERROR: Failed to read {filepath}: {e}")
+        return None
+
+    return {number: "".join(lines).strip() for number, lines in chunks.items()}
+
+
 def ensure_dir(directory: Path) -> None:
     """
     Ensure a directory exists, creating it if necessary.
@@ -114,3 +198,150 @@ def clear_file(filepath: Path) -> None:
     """
     if filepath.exists():
         filepath.unlink()
+
+
+def file_signature(st: os.stat_result) -> Tuple[int, int, int]:
+    """Build a cache signature that changes whenever the file is rewritten."""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def read_cached_text(filepath: Path) -> str:
+    """
+    Read a text file, reusing the previous contents while it is unchanged.
+
+    Contents are memoized in-process for the few most recently read files,
+    keyed by the file's (mtime_ns, size, inode) signature so a rewritten
+    file is always read again.
+
+    Args:
+        filepath: Path to the text file
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(filepath).resolve()
+    return _read_text(str(path), file_signature(os.stat(path)))
+
+
+@lru_cache(maxsize=8)
+def _read_text(path: str, signature: Tuple[int, int, int]) -> str:
+    """Read a file; the signature argument only keys the cache."""
+    return Path(path).read_text()
+
+
+def load_cached_json(filepath: Path) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Results are memoized in-process and keyed like read_cached_text. The
+    returned object is shared between callers and must be treated as
+    read-only.
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    path = Path(filepath).resolve()
+    return _load_json(str(path), file_signature(os.stat(path)))
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, signature: Tuple[int, int, int]) -> Any:
+    """Parse a JSON file; the signature argument only keys the cache."""
+    return json.loads(Path(path).read_text())
+
+
+def load_cached_yaml(filepath: Path) -> Any:
+    """
+    Load a YAML file, reusing previously parsed results when unchanged.
+
+    Parsed data is memoized in-process, keyed by the file's (mtime_ns,
+    size, inode) signature. The returned object is shared between callers
+    and must be treated as read-only.
+
+    Args:
+        filepath: Path to the YAML file
+
+    Returns:
+        Parsed YAML data (None for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    path = Path(filepath).resolve()
+    st = os.stat(path)
+
+    # Empty file: nothing to parse, so don't even import yaml
+    if st.st_size == 0:
+        return None
+
+    signature = file_signature(st)
+    key = str(path)
+
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    import yaml
+
+    # Prefer the libyaml-backed loader; it is several times faster
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=loader)
+
+    _YAML_CACHE[key] = (signature, data)
+    return data
+
+
+# Long-lived loop (and its thread) for coroutines started from inside
+# another event loop, so their async clients and connections are reused
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _BG_LOOP
+    with _BG_LOOP_LOCK:
+        if _BG_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="essay-async", daemon=True).start()
+            _BG_LOOP = loop
+    return _BG_LOOP
+
+
+def run_coroutine(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no event loop is running. Inside a running loop
+    (a notebook, or async code calling a sync API) the coroutine runs on a
+    shared background loop instead, since asyncio.run() would raise there.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    loop = _background_loop()
+    if running is loop:
+        # Blocking the background loop on itself would deadlock
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
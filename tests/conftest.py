@@ -3,6 +3,19 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path so tests can import 'src' module
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Drop process-wide caches after each test so patched doubles never leak."""
+    yield
+    from src.citations import _load_style
+    from src.essay import _cached_model
+
+    for cached in (_load_style, _cached_model):
+        cached.cache_clear()
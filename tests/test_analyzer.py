@@ -1,9 +1,9 @@
 """Tests for EssayAnalyzer."""
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
-from src.analyzer import EssayAnalyzer, EssayStructure, ParagraphAnalysis
+from src.analyzer import EssayAnalyzer, EssayStructure, ParagraphAnalysis, ParagraphIssue
 
 # Sample essays for testing
 GOOD_ESSAY = """The impact of technology on modern education has been profound and transformative. This essay will explore how digital tools have reshaped learning environments, enhanced accessibility, and created new challenges for educators and students alike.
@@ -162,8 +162,8 @@ def test_calculate_score():
         has_conclusion=True,
         thesis="This is a thesis",
         paragraphs=[
-            ParagraphAnalysis(1, 100, True, "Topic", "strong", [], is_body=True),
-            ParagraphAnalysis(2, 120, True, "Topic", "strong", [], is_body=True),
+            ParagraphAnalysis(1, 100, True, "Topic", "strong", ParagraphIssue.NONE, is_body=True),
+            ParagraphAnalysis(2, 120, True, "Topic", "strong", ParagraphIssue.NONE, is_body=True),
         ],
         transition_quality="strong"
     )
@@ -174,7 +174,7 @@ def test_calculate_score():
         has_conclusion=False,
         thesis=None,
         paragraphs=[
-            ParagraphAnalysis(1, 20, False, None, "weak", ["Too short"], is_body=True),
+            ParagraphAnalysis(1, 20, False, None, "weak", ParagraphIssue.TOO_SHORT, is_body=True),
         ],
         transition_quality="weak"
     )
@@ -187,7 +187,7 @@ def test_generate_recommendations():
     analyzer = EssayAnalyzer()
 
     weak_paras = [
-        ParagraphAnalysis(1, 20, False, None, "weak", ["Too short"])
+        ParagraphAnalysis(1, 20, False, None, "weak", ParagraphIssue.TOO_SHORT)
     ]
 
     recs = analyzer._generate_recommendations(
@@ -226,3 +226,119 @@ def test_print_analysis(capsys):
         success = False
 
     assert success is True
+
+def test_analyze_batch_matches_single_analysis():
+    """Batch analysis without a model mirrors per-essay analysis."""
+    analyzer = EssayAnalyzer()
+    results = analyzer.analyze_batch([GOOD_ESSAY, "", POOR_ESSAY])
+
+    assert len(results) == 3
+    assert results[0] == analyzer.analyze(GOOD_ESSAY)
+    assert results[1].paragraph_count == 0
+    assert results[2] == analyzer.analyze(POOR_ESSAY)
+
+def test_analyze_batch_extracts_theses_concurrently():
+    """Batch analysis issues one async thesis call per non-empty essay."""
+    mock_model = Mock()
+    mock_model.acall = AsyncMock(return_value=(True, "Technology has reshaped learning.", ""))
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    results = analyzer.analyze_batch([GOOD_ESSAY, "", NO_INTRO_ESSAY])
+
+    assert mock_model.acall.await_count == 2
+    mock_model.call.assert_not_called()
+    assert results[0].thesis_statement == "Technology has reshaped learning."
+    assert results[1].thesis_statement is None
+    assert results[2].thesis_location == "body"
+
+def test_analyze_memoizes_repeated_text():
+    """Analyzing the same text twice only calls the model once."""
+    mock_model = Mock()
+    mock_model.call.return_value = (True, "Technology has reshaped learning.", "")
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    first = analyzer.analyze(GOOD_ESSAY)
+    first.recommendations.append("mutated by caller")
+    second = analyzer.analyze(GOOD_ESSAY)
+
+    mock_model.call.assert_called_once()
+    assert "mutated by caller" not in second.recommendations
+    assert second.thesis_statement == first.thesis_statement
+
+def test_analyze_retries_failed_thesis_call():
+    """A failed AI thesis call is not memoized; the next analysis retries it."""
+    mock_model = Mock()
+    mock_model.call.side_effect = [
+        (False, "", "API Error: timeout"),
+        (True, "Technology has reshaped learning.", ""),
+    ]
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    assert analyzer.analyze(GOOD_ESSAY).thesis_statement is None
+    assert analyzer.analyze(GOOD_ESSAY).thesis_statement == "Technology has reshaped learning."
+    assert analyzer.analyze(GOOD_ESSAY).thesis_statement == "Technology has reshaped learning."
+    assert mock_model.call.call_count == 2
+
+def test_analyze_memo_evicts_least_recently_used(monkeypatch):
+    """A memo hit keeps an essay from being the next one evicted."""
+    monkeypatch.setattr("src.analyzer.ANALYSIS_CACHE_SIZE", 2)
+    mock_model = Mock()
+    mock_model.call.return_value = (True, "Technology has reshaped learning.", "")
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    analyzer.analyze(GOOD_ESSAY)
+    analyzer.analyze(POOR_ESSAY)
+    analyzer.analyze(GOOD_ESSAY)
+    analyzer.analyze(NO_INTRO_ESSAY)  # evicts POOR_ESSAY, not GOOD_ESSAY
+    assert mock_model.call.call_count == 3
+
+    analyzer.analyze(GOOD_ESSAY)
+    assert mock_model.call.call_count == 3
+    analyzer.analyze(POOR_ESSAY)
+    assert mock_model.call.call_count == 4
+
+def test_analyze_batch_shares_memo_with_analyze():
+    """Batch analysis reuses memoized essays and memoizes the ones it analyzes."""
+    mock_model = Mock()
+    mock_model.call.return_value = (True, "Technology has reshaped learning.", "")
+    mock_model.acall = AsyncMock(side_effect=[
+        (True, "Technology has reshaped learning.", ""),
+        (False, "", "API Error: timeout"),
+        (True, "Technology has reshaped learning.", ""),
+    ])
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    single = analyzer.analyze(GOOD_ESSAY)
+    results = analyzer.analyze_batch([GOOD_ESSAY, POOR_ESSAY, NO_INTRO_ESSAY])
+
+    assert results[0] == single
+    assert mock_model.acall.await_count == 2
+
+    analyzer.analyze(POOR_ESSAY)
+    assert mock_model.call.call_count == 1
+    analyzer.analyze_batch([NO_INTRO_ESSAY])  # failed thesis call is retried
+    assert mock_model.acall.await_count == 3
+
+def test_paragraph_issue_flags():
+    """Paragraph issues are flags, with the List[str] view rendered on demand."""
+    analyzer = EssayAnalyzer()
+    analysis = analyzer._analyze_paragraph(2, "Too brief.", is_body=True)
+
+    assert analysis.issue_flags == ParagraphIssue.TOO_SHORT | ParagraphIssue.NO_TOPIC
+    assert analysis.issues == [
+        "Too short (under 50 words)",
+        "Weak or missing topic sentence",
+    ]
+    assert analyzer._analyze_paragraph(1, "Intro.", is_body=False).issues == []
+
+def test_analyze_batch_deduplicates_identical_essays():
+    """Identical essays in a batch share one thesis extraction call."""
+    mock_model = Mock()
+    mock_model.acall = AsyncMock(return_value=(True, "Technology has reshaped learning.", ""))
+
+    analyzer = EssayAnalyzer(model=mock_model)
+    results = analyzer.analyze_batch([GOOD_ESSAY, GOOD_ESSAY, POOR_ESSAY])
+
+    assert mock_model.acall.await_count == 2
+    assert results[0] == results[1]
+    assert results[0].recommendations is not results[1].recommendations
@@ -1,7 +1,7 @@
 """Tests for Argument Analyzer."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from src.argument import ArgumentAnalyzer, ArgumentAnalysis, Claim, Fallacy
 from src.models.base import AIModel
 
@@ -179,3 +179,85 @@ Explanation: Circular.
     
     assert len(fallacies) == 1
     assert fallacies[0].name == "Circular Reasoning"
+
+
+def test_analyze_issues_model_calls_concurrently():
+    """All three analysis prompts are in flight at the same time."""
+    import asyncio
+
+    class SlowModel(MockAIModel):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = 0
+            self.peak = 0
+
+        async def acall(self, prompt: str):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return self.call(prompt)
+
+    model = SlowModel()
+    analysis = ArgumentAnalyzer(model=model, combined=False).analyze("Testing is good.")
+
+    assert model.call_count == 3
+    assert model.peak == 3
+    assert isinstance(analysis, ArgumentAnalysis)
+
+
+def test_combined_analysis_single_call():
+    """A JSON-capable model answers the whole analysis in one call."""
+    response = """```json
+{"thesis": "Testing is good.",
+ "claims": [{"text": "It finds bugs.", "type": "Supporting", "strength": "strong", "evidence": null}],
+ "fallacies": [{"name": "Hasty Generalization", "text": "All tests", "explanation": "Overreach."}],
+ "score": 8,
+ "critique": "Solid.",
+ "suggestions": ["Add data."]}
+```"""
+    model = MockAIModel({"Answer with JSON only": response})
+    analysis = ArgumentAnalyzer(model=model).analyze("Testing is good because it finds bugs.")
+
+    assert model.call_count == 1
+    assert analysis.thesis == "Testing is good."
+    assert analysis.claims[0].type == "supporting"
+    assert analysis.fallacies[0].description == "Overreach."
+    assert analysis.overall_strength == 8.0
+    assert analysis.suggestions == ["Add data."]
+
+
+def test_combined_analysis_falls_back_to_separate_prompts():
+    """Non-JSON replies fall back to the three-prompt flow and stay there."""
+    model = MockAIModel({"Evaluate the overall strength": "Score: 6/10\nCritique: Fine."})
+    analyzer = ArgumentAnalyzer(model=model)
+
+    analysis = analyzer.analyze("Testing is good.")
+
+    assert model.call_count == 4
+    assert analysis.overall_strength == 6.0
+    assert analyzer.combined is False
+
+
+def test_combined_analysis_call_failure_keeps_combined_mode():
+    """A failed call is reported without falling back or disabling combined mode."""
+    model = MagicMock()
+    model.acall = AsyncMock(return_value=(False, "", "API Error: 429"))
+    analyzer = ArgumentAnalyzer(model=model)
+
+    analysis = analyzer.analyze("Testing is good.")
+
+    assert model.acall.call_count == 1
+    assert analysis.critique == "Could not evaluate."
+    assert analyzer.combined is True
+
+
+def test_parse_combined_response_ignores_surrounding_prose():
+    """JSON embedded in prose is still parsed; replies without JSON are rejected."""
+    analyzer = ArgumentAnalyzer()
+
+    analysis = analyzer._parse_combined_response('Here you go: {"thesis": "T", "score": 7} Hope this helps.')
+    assert analysis.thesis == "T"
+    assert analysis.overall_strength == 7.0
+
+    assert analyzer._parse_combined_response("Score: 7/10") is None
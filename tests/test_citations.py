@@ -39,8 +39,8 @@ def test_generate_bibliography_valid(manager):
     # Mock file existence for a valid style
     with patch("pathlib.Path.exists", return_value=True):
         # We also need to mock CitationStylesStyle and Bibliography since we don't have real CSL files in test env usually
-        with patch("src.citations.CitationStylesStyle") as mock_style, \
-             patch("src.citations.CitationStylesBibliography") as mock_bib:
+        with patch("citeproc.CitationStylesStyle") as mock_style, \
+             patch("citeproc.CitationStylesBibliography") as mock_bib:
 
             mock_bib_instance = Mock()
             mock_bib_instance.bibliography.return_value = ["Reference 1"]
@@ -61,6 +61,41 @@ def test_best_source_for_claim_keyword_match(manager):
     assert source["id"] == "1"
 
 
+def test_best_source_for_claim_splits_on_punctuation(manager):
+    """Hyphenated words and URL paths match the separate words of a claim."""
+    manager.add_source({"id": "1", "title": "Biology Overview", "abstract": "Cells and DNA."})
+    manager.add_source({"id": "2", "title": "A study", "url": "https://example.org/quantum-computing"})
+    manager.add_source({"id": "3", "title": "Machine-learning in practice"})
+
+    assert manager._best_source_for_claim("Quantum hardware keeps improving")["id"] == "2"
+    assert manager._best_source_for_claim("Machine learning needs data")["id"] == "3"
+
+
+def test_best_source_for_claim_sees_directly_appended_sources(manager):
+    manager.add_source({"id": "1", "title": "Biology Overview", "abstract": "Cells and DNA."})
+    assert manager._best_source_for_claim("Quantum entanglement is real") is None
+
+    manager.sources.append({"id": "2", "title": "Quantum Entanglement", "abstract": ""})
+    source = manager._best_source_for_claim("Quantum entanglement is real")
+    assert source["id"] == "2"
+
+    manager.sources[1]["title"] = "Dark Matter"
+    manager.sources_changed()
+    assert manager._best_source_for_claim("Quantum entanglement is real") is None
+
+
+def test_best_source_for_claim_sees_replaced_sources(manager):
+    manager.add_source({"id": "1", "title": "Biology Overview", "abstract": ""})
+    assert manager._best_source_for_claim("Quantum entanglement is real") is None
+    assert type(manager.sources) is list
+
+    manager.sources[0] = {"id": "1", "title": "Quantum Entanglement", "abstract": ""}
+    assert manager._best_source_for_claim("Quantum entanglement is real")["id"] == "1"
+
+    manager.sources = [{"id": "2", "title": "Biology Overview", "abstract": ""}]
+    assert manager._best_source_for_claim("Quantum entanglement is real") is None
+
+
 def test_best_source_for_claim_no_match_returns_first(manager):
     manager.add_source({"id": "1", "title": "Quantum Physics", "abstract": ""})
     claim = "Economics theory suggests"
@@ -96,3 +131,164 @@ def test_cite_no_sources_auto_insert_does_not_write(tmp_path, monkeypatch):
 
     cited_file = essay_file.with_name("essay_cited.txt")
     assert not cited_file.exists()
+
+
+def test_generate_bibliography_reuses_parsed_style():
+    """The CSL style file is parsed once and reused across managers."""
+    from src.citations import _load_style
+
+    source = {
+        "id": "1",
+        "type": "article-journal",
+        "title": "Test",
+        "author": [{"family": "Smith", "given": "J"}],
+        "issued": {"date-parts": [[2020]]},
+    }
+    managers = [CitationManager(crossref_client=Mock()) for _ in range(2)]
+    for manager in managers:
+        manager.add_source(dict(source))
+    _load_style.cache_clear()
+
+    first = managers[0].generate_bibliography(style="apa")
+    second = managers[1].generate_bibliography(style="apa")
+
+    assert first == second
+    assert "Smith" in first
+    assert _load_style.cache_info().misses == 1
+    assert _load_style.cache_info().hits == 1
+
+
+def test_lookup_source_caches_results():
+    """Repeated lookups reuse the Crossref response and hand out fresh copies."""
+    crossref = Mock()
+    crossref.works.return_value = {"message": {"items": [{"title": "Cached"}]}}
+    manager = CitationManager(crossref_client=crossref)
+
+    first = manager.lookup_source("query")
+    manager.add_source(first[0])
+    second = manager.lookup_source("query")
+
+    crossref.works.assert_called_once_with(query="query", limit=1)
+    assert "id" not in second[0]
+
+
+def test_lookup_sources_batch_deduplicates_queries():
+    """Batch lookups issue one Crossref call per distinct query."""
+    import asyncio
+
+    crossref = Mock()
+    crossref.works.side_effect = lambda query, limit: {"message": {"items": [{"title": query}]}}
+    manager = CitationManager(crossref_client=crossref)
+
+    results = asyncio.run(manager.lookup_sources_batch(["a", "b", "a"]))
+
+    assert crossref.works.call_count == 2
+    assert results["a"] == [{"title": "a"}]
+    assert results["b"] == [{"title": "b"}]
+
+
+def test_format_citation_finds_sources_by_id(manager):
+    """Sources added either way are found by ID for inline citations."""
+    manager.add_source({"id": "a", "author": [{"family": "Doe"}], "issued": {"date-parts": [[2021]]}})
+    assert manager.format_citation("a") == "(Doe, 2021)"
+
+    manager.sources.append({"id": "b", "author": [{"family": "Roe"}]})
+    assert manager.format_citation("b") == "(Roe, n.d.)"
+    assert manager.format_citation("missing") == "(Source not found)"
+
+
+def test_format_citation_sees_replaced_sources(manager):
+    """Replacing the source list reindexes it even when its length is unchanged."""
+    manager.add_source({"id": "a", "author": [{"family": "Doe"}]})
+    assert manager.format_citation("a") == "(Doe, n.d.)"
+
+    manager.sources = [{"id": "b", "author": [{"family": "Roe"}]}]
+    assert manager.format_citation("b") == "(Roe, n.d.)"
+    assert manager.format_citation("a") == "(Source not found)"
+
+    manager.sources[0] = {"id": "c", "author": [{"family": "Poe"}]}
+    assert manager.format_citation("c") == "(Poe, n.d.)"
+
+
+def test_write_bibliography_streams_entries(manager, tmp_path):
+    """Entries are written one per line and match generate_bibliography."""
+    for i, family in enumerate(["Adams", "Baker"], start=1):
+        manager.add_source({
+            "id": str(i),
+            "type": "article-journal",
+            "title": f"Paper {i}",
+            "author": [{"family": family, "given": "A"}],
+            "issued": {"date-parts": [[2020]]},
+        })
+
+    out = tmp_path / "refs.txt"
+    with open(out, "w") as fp:
+        count = manager.write_bibliography(fp, style="apa")
+
+    assert count == 2
+    assert out.read_text() == manager.generate_bibliography(style="apa")
+    assert len(out.read_text().splitlines()) == 2
+
+
+def test_generate_bibliography_cached_until_sources_change(manager):
+    """Unchanged sources reuse the formatted bibliography; new sources rebuild it."""
+    manager.add_source({"id": "1", "type": "article-journal", "title": "First",
+                        "author": [{"family": "Adams"}], "issued": {"date-parts": [[2020]]}})
+    first = manager.generate_bibliography(style="apa")
+
+    with patch("citeproc.CitationStylesBibliography") as mock_bib:
+        assert manager.generate_bibliography(style="apa") == first
+        mock_bib.assert_not_called()
+
+    manager.sources.append({"id": "2", "type": "article-journal", "title": "Second",
+                            "author": [{"family": "Baker"}], "issued": {"date-parts": [[2021]]}})
+    assert "Baker" in manager.generate_bibliography(style="apa")
+
+    manager.sources[0]["title"] = "Renamed"
+    manager.sources_changed()
+    assert "Renamed" in manager.generate_bibliography(style="apa")
+
+
+def test_suggest_inline_citations_matches_each_claim(manager):
+    manager.add_source({"id": "1", "title": "Machine Learning Study", "author": [{"family": "Lee"}]})
+    manager.add_source({"id": "2", "title": "Biology Overview", "author": [{"family": "Kim"}]})
+
+    claims = ["Machine learning helps", "Biology matters", "Machine learning helps", "Nothing relevant"]
+    suggestions = manager.suggest_inline_citations("text", claims, style="ieee")
+
+    assert [s["citation"] for s in suggestions] == ["[1]", "[2]", "[1]"]
+    assert suggestions[1]["claim"] == "Biology matters"
+
+
+def test_best_source_for_claim_stopword_only_claim(manager):
+    manager.add_source({"id": "1", "title": "Quantum Physics", "abstract": ""})
+    manager.add_source({"id": "2", "title": "The Study", "abstract": ""})
+
+    assert manager._best_source_for_claim("it is the", lenient=False) is None
+    assert manager._best_source_for_claim("it is the", lenient=True)["id"] == "1"
+
+
+def test_find_claims_and_plagiarism_reused_across_runs(tmp_path, monkeypatch):
+    """Re-running cite and check_plagiarism at --temperature=0 answers both from the on-disk cache."""
+    from src.essay import EssayCLI
+    from src.models.openrouter import OpenRouterModel
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    monkeypatch.setenv("AI_ESSAY_CACHE_DIR", str(tmp_path / "cache"))
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Essay text with Claim one.")
+    client = Mock()
+    client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content="Claim one."))])
+
+    def run():
+        cli = EssayCLI(temperature=0)
+        cli.cite(str(essay), model="test-model")
+        cli.check_plagiarism(str(essay), model="test-model")
+
+    with patch.object(OpenRouterModel, "_get_shared_client", return_value=client):
+        run()
+        first_run_calls = client.chat.completions.create.call_count
+        run()
+
+    assert first_run_calls == 2
+    assert client.chat.completions.create.call_count == first_run_calls
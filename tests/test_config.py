@@ -0,0 +1,37 @@
+"""Tests for Config."""
+
+import logging
+
+import pytest
+
+from src.config import Config
+
+
+@pytest.fixture
+def no_config_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "CONFIG_FILE", tmp_path / "missing.yaml")
+    monkeypatch.delenv("OPENROUTER_MAX_CONCURRENCY", raising=False)
+    monkeypatch.delenv("OPENROUTER_RPM", raising=False)
+
+
+def test_rate_limits_read_from_env(no_config_file, monkeypatch):
+    monkeypatch.setenv("OPENROUTER_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("OPENROUTER_RPM", "120")
+
+    cfg = Config()
+    assert cfg.max_concurrency == 3
+    assert cfg.requests_per_minute == 120.0
+
+
+@pytest.mark.parametrize("concurrency, rpm", [("many", "fast"), ("0", "-5"), ("2.5", "nan")])
+def test_invalid_rate_limits_fall_back_with_warning(no_config_file, monkeypatch, caplog, concurrency, rpm):
+    monkeypatch.setenv("OPENROUTER_MAX_CONCURRENCY", concurrency)
+    monkeypatch.setenv("OPENROUTER_RPM", rpm)
+
+    with caplog.at_level(logging.WARNING, logger="src.config"):
+        cfg = Config()
+
+    assert cfg.max_concurrency == Config.MAX_CONCURRENCY
+    assert cfg.requests_per_minute == 0
+    assert "OPENROUTER_MAX_CONCURRENCY" in caplog.text
+    assert "OPENROUTER_RPM" in caplog.text
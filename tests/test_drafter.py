@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, AsyncMock
 
 from src.drafter import EssayDrafter
 from src.models.base import AIModel
+from src.exceptions import ModelError
 
 class MockAsyncModel(AIModel):
     """Mock model with async support."""
@@ -137,3 +138,180 @@ async def test_draft_essay_file_write_error(tmp_path):
     finally:
         # Cleanup: restore permissions
         readonly_dir.chmod(0o755)
+
+@pytest.mark.asyncio
+async def test_draft_essay_caches_deterministic_models(tmp_path):
+    """Temperature-0 drafts are served from the cache on repeat runs."""
+    from src.models.cache import ResponseCache
+
+    deterministic = MockAsyncModel("det-model", delay=0)
+    deterministic.temperature = 0
+    sampled = MockAsyncModel("sampled-model", delay=0)
+    drafter = EssayDrafter([deterministic, sampled], cache=ResponseCache(tmp_path / "cache"))
+
+    await drafter.draft_essay("Test Topic", tmp_path / "run1")
+    results = await drafter.draft_essay("Test Topic", tmp_path / "run2")
+
+    assert deterministic.call_count == 1
+    assert sampled.call_count == 2
+    assert (tmp_path / "run2" / "det-model.txt").read_text() == "Draft from det-model"
+    assert all(r["success"] for r in results)
+
+@pytest.mark.asyncio
+async def test_draft_essay_topic_whitespace_shares_cache(tmp_path):
+    """Topics that differ only in whitespace map to the same cached draft."""
+    from src.models.cache import ResponseCache
+
+    model = MockAsyncModel("det-model", delay=0)
+    model.temperature = 0
+    drafter = EssayDrafter([model], cache=ResponseCache(tmp_path / "cache"))
+
+    await drafter.draft_essay("AI ethics", tmp_path / "run1")
+    await drafter.draft_essay("  AI \n ethics ", tmp_path / "run2")
+
+    assert model.call_count == 1
+
+@pytest.mark.asyncio
+async def test_draft_essay_reports_results_as_completed(tmp_path):
+    """on_result sees the fastest draft first; the return value keeps model order."""
+    slow = MockAsyncModel("slow", delay=0.1)
+    fast = MockAsyncModel("fast", delay=0.0)
+    reported = []
+
+    drafter = EssayDrafter([slow, fast])
+    results = await drafter.draft_essay("Test Topic", tmp_path, on_result=lambda r: reported.append(r["model"]))
+
+    assert reported == ["fast", "slow"]
+    assert [r["model"] for r in results] == ["slow", "fast"]
+
+@pytest.mark.asyncio
+async def test_draft_essay_limits_concurrency(tmp_path):
+    """No more than max_concurrency model calls are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    class TrackingModel(MockAsyncModel):
+        async def acall(self, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True, "Draft", ""
+
+    models = [TrackingModel(f"model{i}") for i in range(5)]
+    results = await EssayDrafter(models, max_concurrency=2).draft_essay("Test Topic", tmp_path)
+
+    assert peak == 2
+    assert all(r["success"] for r in results)
+
+
+class StreamingModel(MockAsyncModel):
+    """Mock model that streams its draft in small chunks."""
+    def __init__(self, model_id, chunks, fail_after=None):
+        super().__init__(model_id)
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    async def astream(self, prompt):
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise ModelError("API Error: stream dropped")
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_draft_essay_streams_to_file(tmp_path):
+    """Streamed drafts are written whole and words split across chunks count once."""
+    chunks = ["The quick br", "own fox ", " jumps", "\nover the lazy dog."]
+    drafter = EssayDrafter([StreamingModel("streamer", chunks)], stream=True)
+
+    results = await drafter.draft_essay("Test Topic", tmp_path)
+
+    text = (tmp_path / "streamer.txt").read_text()
+    assert text == "".join(chunks)
+    assert results[0]["success"] is True
+    assert results[0]["word_count"] == len(text.split())
+    assert not list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_draft_essay_stream_failure_leaves_no_file(tmp_path):
+    """A stream that fails midway reports the error and removes the partial draft."""
+    model = StreamingModel("streamer", ["Partial ", "draft"], fail_after=1)
+    results = await EssayDrafter([model], stream=True).draft_essay("Test Topic", tmp_path)
+
+    assert results[0]["success"] is False
+    assert results[0]["error"] == "API Error: stream dropped"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_default_astream_wraps_acall(tmp_path):
+    """Models without native streaming stream their acall response."""
+    results = await EssayDrafter([MockAsyncModel("plain", delay=0)], stream=True).draft_essay("Topic", tmp_path)
+
+    assert results[0]["success"] is True
+    assert (tmp_path / "plain.txt").read_text() == "Draft from plain"
+
+
+@pytest.mark.asyncio
+async def test_draft_essay_retries_transient_errors(tmp_path, monkeypatch):
+    """Rate-limited drafts are retried; client errors fail straight away."""
+    monkeypatch.setattr("src.drafter._RETRY_BASE_DELAY", 0)
+    flaky = MockAsyncModel("flaky", delay=0)
+    flaky.acall = AsyncMock(side_effect=[
+        (False, "", "API Error: Error code: 429 - rate limited"),
+        (True, "Recovered draft", ""),
+    ])
+    broken = MockAsyncModel("broken", delay=0)
+    broken.acall = AsyncMock(return_value=(False, "", "API Error: Error code: 401 - bad key"))
+
+    results = await EssayDrafter([flaky, broken]).draft_essay("Test Topic", tmp_path)
+
+    assert results[0]["success"] is True
+    assert flaky.acall.await_count == 2
+    assert results[1]["success"] is False
+    assert broken.acall.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_draft_retries_transient_errors(tmp_path, monkeypatch):
+    """A stream dropped by a rate limit is retried from the start."""
+    monkeypatch.setattr("src.drafter._RETRY_BASE_DELAY", 0)
+
+    class FlakyStreamingModel(StreamingModel):
+        attempts = 0
+
+        async def astream(self, prompt):
+            FlakyStreamingModel.attempts += 1
+            if FlakyStreamingModel.attempts == 1:
+                yield "Partial "
+                raise ModelError("API Error: Error code: 429 - rate limited")
+            async for chunk in super().astream(prompt):
+                yield chunk
+
+    model = FlakyStreamingModel("streamer", ["Full ", "draft"])
+    results = await EssayDrafter([model], stream=True).draft_essay("Test Topic", tmp_path)
+
+    assert FlakyStreamingModel.attempts == 2
+    assert results[0]["success"] is True
+    assert (tmp_path / "streamer.txt").read_text() == "Full draft"
+
+
+@pytest.mark.asyncio
+async def test_draft_essay_isolates_raising_models(tmp_path):
+    """A model whose call raises fails alone; the other drafts still complete."""
+    healthy = MockAsyncModel("healthy", delay=0.01)
+    crashing = MockAsyncModel("crashing", delay=0)
+    crashing.acall = AsyncMock(side_effect=RuntimeError("socket closed"))
+    reported = []
+
+    results = await EssayDrafter([crashing, healthy]).draft_essay(
+        "Test Topic", tmp_path, on_result=lambda r: reported.append(r["model"])
+    )
+
+    assert results[0]["success"] is False
+    assert results[0]["error"] == "socket closed"
+    assert results[1]["success"] is True
+    assert sorted(reported) == ["crashing", "healthy"]
@@ -83,3 +83,40 @@ def test_improver_handles_empty_text():
     assert result.reached_target is False
     assert result.final_text == ""
     assert result.iterations  # Should still attempt improvements
+
+
+def test_improver_chains_steps_without_rescoring():
+    """Each step starts from the previous step's text and scores, scoring each text once."""
+    from unittest.mock import patch
+
+    improver = EssayImprover()
+    with patch.object(improver, "_score_text", wraps=improver._score_text) as score:
+        result = improver.improve(RAW_ESSAY, cycles=3, target_score=100)
+
+    assert len(result.iterations) >= 2
+    first, second = result.iterations[:2]
+    assert second.before_text is first.after_text
+    assert second.scores_before == first.scores_after
+    assert score.call_count == len(result.iterations) + 1
+
+
+def test_improver_stops_on_score_plateau():
+    """Two cycles gaining less than min_delta end the run early."""
+    from unittest.mock import patch
+    from src.improver import ImprovementScores
+
+    def scores(overall):
+        return ImprovementScores(clarity=overall, grammar=overall, argument_strength=overall, overall=overall)
+
+    mock = MockModel("Rewritten essay.")
+    improver = EssayImprover(model=mock)
+    with patch.object(improver, "_score_text", side_effect=[scores(v) for v in (50, 55, 55.2, 55.4, 60)]):
+        result = improver.improve(RAW_ESSAY, cycles=5, target_score=90)
+
+    assert mock.called == 3
+    assert result.final_scores.overall == 55.4
+
+    with patch.object(improver, "_score_text", side_effect=[scores(v) for v in (50, 55, 55.2, 55.4, 60)]):
+        result = improver.improve(RAW_ESSAY, cycles=4, target_score=90, min_delta=0.1)
+
+    assert len(result.iterations) == 4
@@ -81,3 +81,375 @@ def test_exception_handling():
         # Simulate missing API key behavior if we were to call OpenRouterModel directly without key
         # But here we just want to import and use the exception to verify it exists and works
         raise ModelError("Test error")
+
+def test_draft_skips_duplicate_models(cli, tmp_path):
+    """Repeated model IDs are only drafted once, in first-seen order."""
+    async def async_response(*args, **kwargs):
+        return (True, "Draft text.", "")
+
+    with patch("src.essay.OpenRouterModel") as MockModel:
+        def build(model_name):
+            instance = Mock()
+            instance.model_id = model_name
+            instance.acall.side_effect = async_response
+            return instance
+        MockModel.side_effect = build
+
+        cli.draft("Topic", models="a, b,a,,b", output_dir=str(tmp_path))
+
+    assert [c.kwargs["model_name"] for c in MockModel.call_args_list] == ["a", "b"]
+    assert sorted(p.name for p in tmp_path.glob("**/*.txt")) == ["a.txt", "b.txt"]
+
+def test_get_model_reuses_instances(monkeypatch):
+    """Subcommands share one model per name within a process."""
+    from src.essay import _get_model
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    with patch("src.essay.OpenRouterModel") as MockModel:
+        MockModel.side_effect = lambda model_name: Mock(model_id=model_name)
+        first = _get_model("shared-model")
+        assert _get_model("shared-model") is first
+        assert _get_model("other-model") is not first
+        assert MockModel.call_count == 2
+
+        monkeypatch.setenv("OPENROUTER_API_KEY", "other_key")
+        assert _get_model("shared-model") is not first
+
+def test_audit_runs_analyses_concurrently(cli, tmp_path, capsys):
+    """audit overlaps the source, claim and plagiarism model calls."""
+    import asyncio
+
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Studies show 90% of students benefit from tutoring.")
+    in_flight = 0
+    peak = 0
+
+    async def acall(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "search queries" in prompt:
+            return True, "tutoring outcomes", ""
+        return True, "Studies show 90% of students benefit from tutoring.", ""
+
+    paper = {"title": "Tutoring Study", "year": 2020, "url": "http://x", "paperId": "p1"}
+    model = Mock(model_id=None, acall=acall)
+    with patch.object(cli, "_init_model", return_value=model), \
+         patch("src.research.ResearchAssistant.search_papers", return_value=[paper]):
+        cli.audit(str(essay))
+
+    out = capsys.readouterr().out
+    assert peak == 3
+    assert "Tutoring Study" in out
+    assert out.count("Studies show 90%") == 2
+
+def test_draft_inside_running_event_loop(cli, tmp_path, capsys):
+    """Errors while drafting inside an event loop (e.g. a notebook) are reported as-is."""
+    import asyncio
+
+    calls = []
+
+    async def acall(prompt):
+        calls.append(prompt)
+        raise RuntimeError("transient failure")
+
+    with patch("src.essay.OpenRouterModel") as MockModel:
+        MockModel.side_effect = lambda model_name: Mock(model_id=model_name, acall=acall)
+
+        async def run():
+            cli.draft("Topic", models="loop-model", output_dir=str(tmp_path))
+
+        asyncio.run(run())
+
+    assert len(calls) == 1
+    out = capsys.readouterr().out
+    assert "transient failure" in out
+    assert "cannot be called from a running event loop" not in out
+
+def test_research_overlaps_gap_analysis(cli, tmp_path, capsys):
+    """Gap analysis runs alongside source suggestion instead of after it."""
+    import asyncio
+
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Tutoring improves outcomes.")
+    in_flight = 0
+    peak = 0
+
+    async def acall(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "search queries" in prompt:
+            return True, "tutoring outcomes", ""
+        return True, "Longitudinal studies", ""
+
+    paper = {"title": "Tutoring Study", "year": 2020, "url": "http://x", "paperId": "p1",
+             "authors": ["A. Author"], "citationCount": 3}
+    model = Mock(model_id=None, acall=acall)
+    with patch.object(cli, "_init_model", return_value=model), \
+         patch("src.research.ResearchAssistant.search_papers", return_value=[paper]):
+        cli.research(str(essay), gap_analysis=True)
+
+    out = capsys.readouterr().out
+    assert peak == 2
+    assert "Tutoring Study" in out
+    assert "Longitudinal studies" in out
+    assert (tmp_path / "essay_sources.json").exists()
+
+def test_pipeline_shares_claims_and_sources(cli, tmp_path):
+    """pipeline cites with the claims and sources it found, then improves the result."""
+    import time
+
+    essay = tmp_path / "essay.txt"
+    claim = "Studies show 90% of students benefit from tutoring."
+    essay.write_text(f"{claim} Schools should invest more.")
+    prompts = []
+    analyzing = False
+    overlapped = False
+
+    async def acall(prompt):
+        nonlocal overlapped
+        overlapped = overlapped or analyzing
+        prompts.append(prompt)
+        if "search queries" in prompt:
+            return True, "tutoring outcomes", ""
+        return True, claim, ""
+
+    def call(prompt):
+        nonlocal analyzing
+        if "thesis" in prompt.lower():
+            # Structural analysis: held open so research calls can overlap it
+            analyzing = True
+            time.sleep(0.05)
+            analyzing = False
+        return True, prompt[prompt.index(claim):], ""
+
+    paper = {"title": "Tutoring Study", "year": 2020, "url": "http://x", "paperId": "p1",
+             "authors": ["Jane Smith"], "citationCount": 3}
+    model = Mock(model_id=None, acall=acall)
+    model.call.side_effect = call
+    with patch.object(cli, "_init_model", return_value=model), \
+         patch("src.research.ResearchAssistant.search_papers", return_value=[paper]):
+        cli.pipeline(str(essay), cycles=1, output_dir=str(tmp_path / "out"))
+
+    final = next((tmp_path / "out").glob("essay_pipeline_*.txt")).read_text()
+    assert f"{claim} (Smith, 2020)" in final
+    assert sum("search queries" not in p for p in prompts) == 1
+    assert overlapped
+
+def test_missing_input_reported_without_exists_check(cli, tmp_path, capsys):
+    """Commands report a missing essay from the failed read itself."""
+    missing = tmp_path / "missing.txt"
+    with patch("pathlib.Path.exists", side_effect=AssertionError("unexpected stat")):
+        cli.analyze(str(missing))
+        cli.export(str(missing))
+
+    assert capsys.readouterr().out.count("Error: File") == 2
+
+def test_analyze_directory_batches_model_calls(cli, tmp_path, capsys):
+    """Analyzing a directory issues the thesis calls for all essays together."""
+    import asyncio
+
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.txt").write_text(f"Essay {name} argues a point.\n\nBody.\n\nIn conclusion, done.")
+    in_flight = 0
+    peak = 0
+
+    async def acall(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True, "THESIS: A point.", ""
+
+    model = Mock(model_id=None, acall=acall)
+    with patch.object(cli, "_init_model", return_value=model):
+        cli.analyze(str(tmp_path))
+
+    out = capsys.readouterr().out
+    assert peak == 2
+    assert "a.txt" in out and "b.txt" in out
+
+def test_insert_citations_single_pass_semantics():
+    """Marked claims take their citation at the marker; others at their first occurrence."""
+    from src.essay import _insert_citations, _insert_markers
+
+    text = "Tutoring helps. Tutoring helps. Class size matters [citation needed]. Class size matters."
+    suggestions = [
+        {"claim": "Tutoring helps.", "citation": "(Smith, 2020)"},
+        {"claim": "Class size matters", "citation": "(Lee, 2019)"},
+        {"claim": "Tutoring helps.", "citation": "(Other, 2001)"},
+        {"claim": "Not in the essay", "citation": "(None, 2000)"},
+    ]
+
+    cited, inserted = _insert_citations(text, suggestions)
+
+    assert inserted == 2
+    assert cited == "Tutoring helps. (Smith, 2020) Tutoring helps. Class size matters (Lee, 2019). Class size matters."
+
+    marked, count = _insert_markers("A is true. B is true.", ["B is true.", "", "A is true."])
+    assert count == 2
+    assert marked == "A is true. [citation needed] B is true. [citation needed]"
+
+def test_paper_to_csl_handles_null_venue():
+    """Search results with a null venue or external IDs still convert."""
+    from src.essay import _paper_to_csl
+
+    csl = _paper_to_csl({"title": "T", "authors": ["Jane Smith"], "year": 2020,
+                         "publicationVenue": None, "externalIds": None}, 1)
+
+    assert csl["type"] == "article-journal"
+    assert csl["container-title"] == "Semantic Scholar"
+    assert csl["author"] == [{"family": "Smith", "given": "Jane"}]
+    assert "DOI" not in csl
+
+    csl = _paper_to_csl({"publicationVenue": {"type": "book", "name": "Press"},
+                         "externalIds": {"DOI": "10.1/x"}}, 2)
+    assert (csl["id"], csl["type"], csl["container-title"], csl["DOI"]) == ("source-2", "book", "Press", "10.1/x")
+
+def test_fill_markers_cycles_citations_in_order():
+    """Leftover markers are filled left to right in a single pass."""
+    from src.essay import _fill_markers
+
+    text = "A [citation needed]. B [citation needed]. C [citation needed]."
+    assert _fill_markers(text, lambda i: f"[{i % 2 + 1}]") == "A [1]. B [2]. C [1]."
+    assert _fill_markers("No markers.", lambda i: pytest.fail("unexpected")) == "No markers."
+
+def test_cite_formats_each_source_once(cli, tmp_path):
+    """Marker filling and the citation examples share one formatted citation per source."""
+    import json
+    from src.citations import CitationManager
+
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Cats purr [citation needed]. Cats nap [citation needed].")
+    (tmp_path / "essay_sources.json").write_text(json.dumps(
+        [{"id": "s1", "title": "Zebras", "author": [{"family": "Lee"}], "issued": {"date-parts": [[2019]]}}]
+    ))
+    model = Mock(model_id=None)
+    model.call.return_value = (True, "NONE", "")
+    original = CitationManager.format_citation
+
+    with patch.object(cli, "_init_model", return_value=model), \
+         patch.object(CitationManager, "format_citation", autospec=True, side_effect=original) as fmt:
+        cli.cite(str(essay))
+
+    assert fmt.call_count == 1
+    assert (tmp_path / "essay_cited.txt").read_text().startswith("Cats purr (Lee, 2019). Cats nap (Lee, 2019).")
+
+def test_outline_and_template_report_missing_files(cli, tmp_path, capsys):
+    """Missing notes and template sources are reported from the failed read."""
+    missing = tmp_path / "missing.txt"
+    with patch("pathlib.Path.exists", side_effect=AssertionError("unexpected stat")):
+        cli.outline(notes_file=str(missing))
+    cli.template_create(str(missing), name="custom")
+
+    assert capsys.readouterr().out.count("Error: File") == 2
+
+def test_cite_copies_saved_sources(cli, tmp_path):
+    """Each cite run loads the current sources file into its own source dicts."""
+    import json
+    import os
+    from src.citations import CitationManager
+    from src.utils import load_cached_json
+
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Cats purr [citation needed].")
+    sources = tmp_path / "essay_sources.json"
+    sources.write_text(json.dumps([{"id": "s1", "title": "Zebras", "author": [{"family": "Lee"}]}]))
+    model = Mock(model_id=None)
+    model.call.return_value = (True, "NONE", "")
+    managers = []
+
+    def build_manager(**kwargs):
+        managers.append(CitationManager(**kwargs))
+        return managers[-1]
+
+    with patch.object(cli, "_init_model", return_value=model), \
+         patch("src.essay.CitationManager", side_effect=build_manager):
+        cli.cite(str(essay))
+        managers[-1].sources[0]["title"] = "Edited"
+        assert load_cached_json(sources)[0]["title"] == "Zebras"
+
+        sources.write_text(json.dumps([
+            {"id": "s1", "title": "Zebras", "author": [{"family": "Lee"}]},
+            {"id": "s2", "title": "Yaks", "author": [{"family": "Kim"}]},
+        ]))
+        os.utime(sources, ns=(1, 1))
+        cli.cite(str(essay))
+
+    assert len(managers) == 2
+    assert [s["title"] for s in managers[-1].sources] == ["Zebras", "Yaks"]
+
+def test_analyze_argument_reuses_cached_response_at_temperature_zero(tmp_path, monkeypatch):
+    """With --temperature=0, a second run of the command is answered from the on-disk cache."""
+    from unittest.mock import AsyncMock
+    from src.models.openrouter import OpenRouterModel
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    monkeypatch.setenv("AI_ESSAY_CACHE_DIR", str(tmp_path / "cache"))
+    essay = tmp_path / "essay.txt"
+    essay.write_text("Testing is good because it finds bugs.")
+    reply = '{"thesis": "Testing is good.", "score": 7, "critique": "Solid."}'
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content=reply))]))
+
+    with patch.object(OpenRouterModel, "_get_shared_async_client", return_value=client):
+        EssayCLI(temperature=0).analyze_argument(str(essay), model="test-model")
+        EssayCLI(temperature=0).analyze_argument(str(essay), model="test-model")
+        assert client.chat.completions.create.call_count == 1
+        assert client.chat.completions.create.call_args[1]["temperature"] == 0
+
+        # Default sampling temperature: every run calls the model
+        EssayCLI().analyze_argument(str(essay), model="test-model")
+        EssayCLI().analyze_argument(str(essay), model="test-model")
+        assert client.chat.completions.create.call_count == 3
+
+def test_draft_cache_and_no_cache_from_cli(tmp_path, monkeypatch):
+    """A temperature-0 draft is reused by the next run unless --no-cache is passed."""
+    from unittest.mock import AsyncMock
+    from src.models.openrouter import OpenRouterModel
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    monkeypatch.setenv("AI_ESSAY_CACHE_DIR", str(tmp_path / "cache"))
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content="Draft."))]))
+
+    with patch.object(OpenRouterModel, "_get_shared_async_client", return_value=client):
+        cli = EssayCLI(temperature=0)
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"))
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"))
+        assert client.chat.completions.create.call_count == 1
+
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"), no_cache=True)
+        assert client.chat.completions.create.call_count == 2
+
+def test_draft_cache_ttl_from_cli(tmp_path, monkeypatch):
+    """--cache-ttl makes a temperature-0 draft older than the limit be drafted again."""
+    import os
+    import time
+    from unittest.mock import AsyncMock
+    from src.models.openrouter import OpenRouterModel
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    monkeypatch.setenv("AI_ESSAY_CACHE_DIR", str(cache_dir))
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content="Draft."))]))
+
+    with patch.object(OpenRouterModel, "_get_shared_async_client", return_value=client):
+        cli = EssayCLI(temperature=0)
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"))
+        hour_ago = time.time() - 3600
+        for cached in cache_dir.iterdir():
+            os.utime(cached, (hour_ago, hour_ago))
+
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"))
+        assert client.chat.completions.create.call_count == 1
+
+        cli.draft("Topic", models="test-model", output_dir=str(tmp_path / "drafts"), cache_ttl=60)
+        assert client.chat.completions.create.call_count == 2
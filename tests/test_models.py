@@ -69,3 +69,203 @@ def test_repr(mock_env_api_key):
     assert "test-model" in repr_str
     assert "500" in repr_str
     assert "0.7" in repr_str
+
+def test_instances_share_http_client(mock_env_api_key):
+    """Models using the same API key reuse one pooled client."""
+    model_a = OpenRouterModel(model_name="model-a")
+    model_b = OpenRouterModel(model_name="model-b")
+    other_key = OpenRouterModel(model_name="model-a", api_key="other_key")
+
+    assert model_a.client is model_b.client
+    assert other_key.client is not model_a.client
+
+def test_response_cache_persists_named_models(tmp_path):
+    """Successful responses for identifiable models survive a new cache instance."""
+    from src.models.cache import ResponseCache
+
+    model = Mock(model_id="test-model", temperature=0.0, max_tokens=100)
+    model.call.return_value = (True, "cached answer", "")
+
+    first = ResponseCache(tmp_path).call(model, "prompt")
+    second = ResponseCache(tmp_path).call(model, "prompt")
+
+    assert first == second == (True, "cached answer", "")
+    model.call.assert_called_once()
+
+    ResponseCache(tmp_path).call(model, "prompt", bypass_cache=True)
+    assert model.call.call_count == 2
+
+def test_response_cache_skips_failures_and_anonymous_models(tmp_path):
+    """Failed calls are never cached and anonymous models stay in memory."""
+    from src.models.cache import ResponseCache
+
+    model = Mock(temperature=0)
+    model.call.return_value = (False, "", "boom")
+    cache = ResponseCache(tmp_path)
+
+    cache.call(model, "prompt")
+    cache.call(model, "prompt")
+    assert model.call.call_count == 2
+
+    model.call.return_value = (True, "ok", "")
+    cache.call(model, "prompt")
+    cache.call(model, "prompt")
+    assert model.call.call_count == 3
+    assert list(tmp_path.iterdir()) == []
+
+def test_response_cache_skips_sampling_models(tmp_path):
+    """Models sampling above temperature 0 are always called and never stored."""
+    from src.models.cache import ResponseCache
+
+    model = Mock(model_id="test-model", temperature=1.0, max_tokens=100)
+    model.call.return_value = (True, "fresh answer", "")
+    cache = ResponseCache(tmp_path)
+
+    cache.call(model, "prompt")
+    cache.call(model, "prompt")
+    assert model.call.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+def test_async_client_shared_within_event_loop(mock_env_api_key):
+    """Models on the same event loop share one async client."""
+    import asyncio
+
+    async def clients():
+        first = OpenRouterModel(model_name="model-a")._get_shared_async_client("test_key")
+        second = OpenRouterModel(model_name="model-b")._get_shared_async_client("test_key")
+        return first, second
+
+    first, second = asyncio.run(clients())
+    assert first is second
+    assert asyncio.run(clients())[0] is not first
+
+def test_astream_yields_content_deltas(mock_env_api_key):
+    """Streamed chunks without content (e.g. role-only deltas) are skipped."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    def chunk(content):
+        return Mock(choices=[Mock(delta=Mock(content=content))])
+
+    async def events():
+        for c in [chunk(None), chunk("Hello"), chunk(", world")]:
+            yield c
+
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=events())
+    model = OpenRouterModel(model_name="test-model")
+
+    async def collect():
+        return [c async for c in model.astream("Prompt")]
+
+    with patch.object(OpenRouterModel, "_get_shared_async_client", return_value=client):
+        assert asyncio.run(collect()) == ["Hello", ", world"]
+        assert client.chat.completions.create.call_args[1]["stream"] is True
+
+        client.chat.completions.create.side_effect = Exception("boom")
+        with pytest.raises(ModelError, match="API Error: boom"):
+            asyncio.run(collect())
+
+def test_sync_client_created_on_first_use(mock_env_api_key):
+    """Constructing a model does not build a sync client until call() needs it."""
+    with patch("src.models.openrouter.OpenRouterModel._get_shared_client") as get_client:
+        model = OpenRouterModel(model_name="test-model")
+        get_client.assert_not_called()
+
+        assert model.client is get_client.return_value
+        model.client
+        get_client.assert_called_once_with("test_key")
+
+def test_request_gate_caps_concurrency_and_rate():
+    """The gate limits requests in flight and spaces starts to the RPM budget."""
+    import asyncio
+    import time
+    from src.models.ratelimit import RequestGate
+
+    in_flight = 0
+    peak = 0
+
+    async def request(gate):
+        nonlocal in_flight, peak
+        async with gate.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def run(gate, n):
+        await asyncio.gather(*(request(gate) for _ in range(n)))
+
+    asyncio.run(run(RequestGate(max_concurrency=2), 6))
+    assert peak == 2
+
+    start = time.monotonic()
+    asyncio.run(run(RequestGate(max_concurrency=10, requests_per_minute=1200), 4))
+    assert time.monotonic() - start >= 0.15
+
+def test_call_goes_through_shared_gate(mock_env_api_key):
+    """Blocking call()s from several threads are capped and spaced by the gate."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from src.models.ratelimit import RequestGate
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def create(**kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return Mock(choices=[Mock(message=Mock(content="ok"))])
+
+    client = Mock()
+    client.chat.completions.create.side_effect = create
+    models = [OpenRouterModel(model_name=f"model-{i}") for i in range(4)]
+    gate = RequestGate(max_concurrency=2, requests_per_minute=1200)
+
+    start = time.monotonic()
+    with patch.object(OpenRouterModel, "_get_shared_client", return_value=client), \
+         patch("src.models.openrouter.shared_gate", return_value=gate):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda m: m.call("Prompt"), models))
+
+    assert all(success for success, _, _ in results)
+    assert peak <= 2
+    assert time.monotonic() - start >= 0.15
+
+def test_acall_goes_through_shared_gate(mock_env_api_key):
+    """Concurrent acall()s from different models share the process-wide gate."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from src.models.ratelimit import RequestGate
+
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Mock(choices=[Mock(message=Mock(content="ok"))])
+
+    client = Mock()
+    client.chat.completions.create = AsyncMock(side_effect=create)
+    models = [OpenRouterModel(model_name=f"model-{i}") for i in range(4)]
+
+    async def run():
+        return await asyncio.gather(*(m.acall("Prompt") for m in models))
+
+    with patch.object(OpenRouterModel, "_get_shared_async_client", return_value=client), \
+         patch("src.models.openrouter.shared_gate", return_value=RequestGate(max_concurrency=1)):
+        results = asyncio.run(run())
+
+    assert all(success for success, _, _ in results)
+    assert peak == 1
@@ -437,3 +437,21 @@ def test_apply_fixes_preserves_case():
     assert "in order to" not in result.optimized_text
 
 
+
+
+def test_optimize_splits_sentences_once(monkeypatch):
+    """Readability, weak-verb and passive-voice checks share one sentence split."""
+    import sys
+    from unittest.mock import patch
+
+    monkeypatch.setitem(sys.modules, "textstat", None)
+    optimizer = GrammarOptimizer()
+
+    with patch.object(optimizer, "_split_sentences", wraps=optimizer._split_sentences) as split:
+        result = optimizer.optimize(PASSIVE_VOICE_TEXT)
+
+    split.assert_called_once_with(PASSIVE_VOICE_TEXT)
+    assert result.metrics.total_sentences == 3
+    passive_issues = sum(issue.type == "voice" for issue in result.issues)
+    assert passive_issues > 0
+    assert result.metrics.passive_voice_percentage == passive_issues / 3 * 100
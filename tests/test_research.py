@@ -45,3 +45,102 @@ def test_suggest_sources_fallback(assistant):
         assert results[0]['title'] == "Fallback Paper"
         # Verify fallback query logic (first 5 words)
         mock_search.assert_called_with("This is an essay about", limit=1)
+
+def test_search_papers_reuses_equivalent_queries(assistant):
+    """Queries differing only in case, spacing or punctuation hit the same results."""
+    with patch.object(assistant.sch, 'search_paper') as mock_search:
+        mock_item = Mock(title="Paris", url="", abstract="", year=2020, authors=[],
+                         citationCount=0, paperId="p1")
+        mock_search.return_value = [mock_item]
+
+        first = assistant.search_papers("capital of France", limit=2)
+        second = assistant.search_papers("  Capital of France? ", limit=2)
+        assistant.search_papers("capital of France", limit=5)
+
+    assert first == second
+    assert mock_search.call_count == 2
+
+
+def test_search_key_ignores_only_case_and_punctuation():
+    """Queries share a key only when they differ by case, spacing or punctuation."""
+    from src.research import _normalize_query
+
+    assert _normalize_query("Capital of France?") == _normalize_query("capital  of france")
+    assert _normalize_query("dogs bite men") != _normalize_query("men bite dogs")
+    assert _normalize_query("effects of not sleeping") != _normalize_query("effects of sleeping")
+    assert _normalize_query("very very good") != _normalize_query("very good")
+
+def test_summarize_source_reuses_cached_response(assistant, mock_model):
+    """Repeated summaries of a source reuse the model response unless bypassed."""
+    mock_model.temperature = 0
+    mock_model.call.return_value = (True, "A short summary.", "")
+    paper = {"title": "Test Paper", "abstract": "An abstract."}
+
+    assert assistant.summarize_source(paper) == "A short summary."
+    assert assistant.summarize_source(dict(paper)) == "A short summary."
+    mock_model.call.assert_called_once()
+
+    assistant.bypass_cache = True
+    assistant.summarize_source(paper)
+    assert mock_model.call.call_count == 2
+
+def test_asummarize_sources_runs_concurrently_in_order():
+    """Summaries are requested together, capped, and returned in source order."""
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def acall(prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True, prompt.split("Title: ")[1].split("\n")[0] + " summary", ""
+
+    assistant = ResearchAssistant(model=Mock(model_id=None, acall=acall))
+    papers = [{"title": f"Paper {i}", "abstract": "Abstract."} for i in range(5)] + [{"title": "Empty"}]
+
+    summaries = asyncio.run(assistant.asummarize_sources(papers, max_concurrency=3))
+
+    assert summaries[:5] == [f"Paper {i} summary" for i in range(5)]
+    assert summaries[5] == "Empty: No abstract available to summarize."
+    assert peak == 3
+
+def test_asummarize_sources_batch_uses_one_request():
+    """All summaries come from one reply; a malformed reply falls back per source."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    papers = [{"title": "A", "abstract": "First."}, {"title": "B"}, {"title": "C", "abstract": "Third."}]
+    model = Mock(model_id=None)
+    model.acall = AsyncMock(return_value=(True, '```json\n["Summary A", "Summary C"]\n```', ""))
+
+    summaries = asyncio.run(ResearchAssistant(model=model).asummarize_sources_batch(papers))
+
+    assert summaries == ["Summary A", "B: No abstract available to summarize.", "Summary C"]
+    model.acall.assert_awaited_once()
+
+    model.acall = AsyncMock(side_effect=[(True, '["Only one"]', ""), (True, "One", ""), (True, "Two", "")])
+    summaries = asyncio.run(ResearchAssistant(model=model).asummarize_sources_batch(papers))
+
+    assert summaries == ["One", "B: No abstract available to summarize.", "Two"]
+    assert model.acall.await_count == 3
+
+def test_fact_check_sends_each_distinct_source_once(assistant, mock_model):
+    """Near-duplicate search results reach the model once, as the most cited copy."""
+    mock_model.call.return_value = (True, '{"supported": true, "confidence": 0.9, "explanation": "ok"}', "")
+    abstract = "We find that tutoring improves test scores across a large sample of schools."
+    sources = [
+        {"title": "Tutoring and Scores", "abstract": abstract, "citationCount": 2},
+        {"title": "Class Size Effects", "abstract": "Smaller classes show modest gains.", "citationCount": 5},
+        {"title": "Tutoring and Scores", "abstract": abstract + " Published version.", "citationCount": 40},
+    ]
+
+    assistant.fact_check("Tutoring improves scores", sources)
+
+    prompt = mock_model.call.call_args[0][0]
+    assert prompt.count("Tutoring and Scores") == 1
+    assert "Published version." in prompt
+    assert "Source 1 (Class Size Effects)" in prompt
@@ -0,0 +1,85 @@
+"""Tests for the run_experiment.py command-line runner."""
+
+import subprocess
+import sys
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+import run_experiment
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    """Record the experiment runner main() dispatches to instead of running it."""
+    calls = []
+    for name in ("run_batch1", "run_batch2", "run_batch5"):
+        monkeypatch.setattr(
+            run_experiment, name,
+            lambda args, config, name=name: calls.append((name, args))
+        )
+    monkeypatch.setattr(run_experiment, "load_config", lambda path: {})
+    return calls
+
+
+def test_import_does_not_load_experiment_modules():
+    """Importing the runner (e.g. for --help) must not pull in the experiment stack."""
+    code = (
+        "import sys, run_experiment; "
+        "print('src.experiment' in sys.modules, 'openai' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_common_options_before_experiment(dispatched):
+    run_experiment.main(["--model", "m", "--cycles", "3", "batch1", "--prompt", "hi"])
+
+    (name, args), = dispatched
+    assert name == "run_batch1"
+    assert (args.model, args.cycles, args.prompt) == ("m", 3, "hi")
+    assert args.config == "config.yaml"
+
+
+def test_common_options_after_experiment(dispatched):
+    run_experiment.main(["batch2", "--model", "m", "--temperature", "0.5"])
+
+    (name, args), = dispatched
+    assert name == "run_batch2"
+    assert (args.model, args.temperature) == ("m", 0.5)
+
+
+def test_option_value_is_not_taken_for_experiment(dispatched):
+    run_experiment.main(["--output-dir", "batch1", "batch5", "--model", "m"])
+
+    (name, args), = dispatched
+    assert name == "run_batch5"
+    assert args.output_dir == "batch1"
+
+
+def test_unknown_experiment_lists_every_choice(capsys):
+    with pytest.raises(SystemExit):
+        run_experiment.main(["batch9"])
+
+    err = capsys.readouterr().err
+    assert all(name in err for name in ("batch1", "batch2", "batch5"))
+
+
+def test_model_reused_for_same_settings(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test_key")
+    monkeypatch.setattr(run_experiment, "_MODEL_CACHE", {})
+    args = Namespace(model="m", max_tokens=None, temperature=None, retry_limit=None)
+
+    first = run_experiment._get_or_create_model(args, {})
+    assert run_experiment._get_or_create_model(args, {}) is first
+
+    args.temperature = 0.0
+    other = run_experiment._get_or_create_model(args, {})
+    assert other is not first
+    assert other.temperature == 0.0
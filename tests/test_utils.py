@@ -0,0 +1,130 @@
+"""Tests for shared utility helpers."""
+
+import pytest
+
+from src import utils
+from src.utils import load_cached_yaml
+
+
+def test_load_cached_yaml_memoizes_parsed_data(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("defaults:\n  cycles: 5\n1: a\nday: 2024-01-02\n")
+
+    data = load_cached_yaml(config_file)
+
+    assert data["defaults"] == {"cycles": 5}
+    assert data[1] == "a"
+    assert str(data["day"]) == "2024-01-02"
+    assert load_cached_yaml(config_file) is data
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+
+def test_load_cached_yaml_invalidates_on_change(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("defaults:\n  cycles: 5\n")
+    load_cached_yaml(config_file)
+
+    config_file.write_text("defaults:\n  cycles: 10\n")
+
+    assert load_cached_yaml(config_file) == {"defaults": {"cycles": 10}}
+
+
+def test_index_essays_matches_extract_essay(tmp_path):
+    essay_file = tmp_path / "essays.txt"
+    essay_file.write_text(
+        "\n\n******** Essay number: 1 ************\n\nFirst essay.\n"
+        "\n\n******** Essay number: 2 ************\n\nSecond essay.\nMore text.\n"
+    )
+
+    essays = utils.index_essays(essay_file)
+
+    assert essays == {
+        1: utils.extract_essay(essay_file, 1),
+        2: utils.extract_essay(essay_file, 2),
+    }
+    assert essays[2] == "Second essay.\nMore text."
+
+
+def test_index_essays_missing_file(tmp_path):
+    assert utils.index_essays(tmp_path / "missing.txt") is None
+
+
+def test_load_cached_yaml_empty_file_skips_parse(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("")
+
+    assert load_cached_yaml(config_file) is None
+
+
+def test_read_cached_text_reuses_until_file_changes(tmp_path, monkeypatch):
+    essay = tmp_path / "essay.txt"
+    essay.write_text("first")
+    assert utils.read_cached_text(essay) == "first"
+
+    reads = []
+    monkeypatch.setattr(utils.Path, "read_text", lambda self, *a, **k: reads.append(self) or "stale")
+    assert utils.read_cached_text(essay) == "first"
+    assert reads == []
+    monkeypatch.undo()
+
+    essay.write_text("second, longer")
+    assert utils.read_cached_text(essay) == "second, longer"
+
+
+def test_load_cached_json_reuses_until_file_changes(tmp_path, monkeypatch):
+    sources = tmp_path / "essay_sources.json"
+    sources.write_text('[{"id": "a"}]')
+    first = utils.load_cached_json(sources)
+    assert first == [{"id": "a"}]
+
+    monkeypatch.setattr(utils.json, "loads", lambda *a, **k: pytest.fail("parsed again"))
+    assert utils.load_cached_json(sources) is first
+    monkeypatch.undo()
+
+    sources.write_text('[{"id": "a"}, {"id": "b"}]')
+    assert len(utils.load_cached_json(sources)) == 2
+
+
+def test_run_coroutine_inside_running_loop_uses_background_loop():
+    """Coroutines run from inside an event loop reuse one long-lived loop."""
+    import asyncio
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert utils.run_coroutine(current_loop()) is not utils._background_loop()
+
+    async def host():
+        return utils.run_coroutine(current_loop()), utils.run_coroutine(current_loop())
+
+    first, second = asyncio.run(host())
+    assert first is second is utils._background_loop()
+    assert first.is_running()
+
+    async def nested():
+        return utils.run_coroutine(current_loop())
+
+    # Called from the background loop itself, a fresh loop is used instead of deadlocking
+    inner = asyncio.run_coroutine_threadsafe(nested(), first).result(timeout=5)
+    assert inner is not first
+
+
+def test_sync_analyzers_work_inside_running_loop():
+    """ArgumentAnalyzer.analyze and EssayAnalyzer.analyze_batch can be called from async code."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+    from src.analyzer import EssayAnalyzer
+    from src.argument import ArgumentAnalyzer
+
+    model = MagicMock()
+    model.acall = AsyncMock(return_value=(True, '{"thesis": "T", "score": 7}', ""))
+
+    async def host():
+        return (
+            ArgumentAnalyzer(model=model).analyze("Testing is good."),
+            EssayAnalyzer(model=model).analyze_batch(["One paragraph essay."]),
+        )
+
+    argument, structures = asyncio.run(host())
+    assert argument.thesis == "T"
+    assert len(structures) == 1